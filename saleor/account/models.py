@@ -163,6 +163,16 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
             (AccountPermissions.MANAGE_USERS.codename, "Manage customers."),
             (AccountPermissions.MANAGE_STAFF.codename, "Manage staff."),
         )
+        indexes = [
+            # Used by the cursor-based pagination of users sorted by name
+            models.Index(
+                fields=["first_name", "last_name", "id"],
+                name="user_first_name_sort_idx",
+            ),
+            models.Index(
+                fields=["last_name", "first_name", "id"], name="user_last_name_sort_idx"
+            ),
+        ]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
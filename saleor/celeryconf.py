@@ -3,7 +3,7 @@ import os
 from celery import Celery
 from django.conf import settings
 
-from .plugins import discover_plugins_modules
+from .plugins import discover_plugins_modules, has_module
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
 
@@ -11,4 +11,12 @@ app = Celery("saleor")
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
-app.autodiscover_tasks(lambda: discover_plugins_modules(settings.PLUGINS))
+# Celery imports every package it looks for tasks in, so only the packages with
+# a tasks module are passed to avoid loading the SDKs of all payment gateways
+app.autodiscover_tasks(
+    lambda: [
+        package
+        for package in discover_plugins_modules(settings.PLUGINS)
+        if has_module(package, "tasks")
+    ]
+)
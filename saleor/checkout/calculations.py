@@ -1,14 +1,19 @@
-from typing import TYPE_CHECKING, Iterable, Optional
+import hashlib
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from prices import Money, TaxedMoney
 
 from ..core.prices import quantize_price
 from ..core.taxes import zero_taxed_money
 from ..discount import DiscountInfo
 from ..plugins.manager import get_plugins_manager
+from .models import CheckoutLine
+from .price_context import checkout_price_context, get_checkout_key
 
 if TYPE_CHECKING:
-    from prices import TaxedMoney
-
-    from .models import Checkout, CheckoutLine
+    from .models import Checkout
     from ..channel.models import Channel
 
 
@@ -88,3 +93,79 @@ def checkout_line_total(
         line, discounts or [], channel
     )
     return quantize_price(calculated_line_total, line.checkout.currency)
+
+
+def get_prices_fingerprint(
+    checkout: "Checkout",
+    lines: List["CheckoutLine"],
+    discounts: Iterable[DiscountInfo],
+) -> str:
+    """Return a hash of the inputs of the price calculation of the checkout."""
+    key = get_checkout_key("prices", checkout, lines, discounts)
+    return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+
+def fetch_checkout_prices_if_expired(
+    checkout: "Checkout",
+    lines: Iterable["CheckoutLine"],
+    discounts: Optional[Iterable[DiscountInfo]] = None,
+    force_update: bool = False,
+) -> "Checkout":
+    """Store the prices of the checkout and its lines unless they're still valid.
+
+    Stored prices are valid until `CHECKOUT_PRICE_SNAPSHOT_TTL` passes or the lines,
+    addresses, voucher or shipping method of the checkout change. Changes of the
+    product prices or plugin configurations are picked up after the expiration.
+    """
+    lines = list(lines)
+    discounts = list(discounts or [])
+    fingerprint = get_prices_fingerprint(checkout, lines, discounts)
+    if (
+        not force_update
+        and checkout.price_fingerprint == fingerprint
+        and checkout.price_expiration > timezone.now()
+    ):
+        return checkout
+
+    with checkout_price_context():
+        checkout.total = checkout_total(
+            checkout=checkout, lines=lines, discounts=discounts
+        )
+        checkout.subtotal = checkout_subtotal(
+            checkout=checkout, lines=lines, discounts=discounts
+        )
+        checkout.shipping_price = checkout_shipping_price(
+            checkout=checkout, lines=lines, discounts=discounts
+        )
+        for line in lines:
+            total_price = checkout_line_total(
+                line=line, discounts=discounts, channel=checkout.channel
+            )
+            line.total_price_net_amount = total_price.net.amount
+            line.total_price_gross_amount = total_price.gross.amount
+
+    checkout.price_expiration = timezone.now() + settings.CHECKOUT_PRICE_SNAPSHOT_TTL
+    checkout.price_fingerprint = fingerprint
+    checkout.save(
+        update_fields=[
+            "total_net_amount",
+            "total_gross_amount",
+            "subtotal_net_amount",
+            "subtotal_gross_amount",
+            "shipping_price_net_amount",
+            "shipping_price_gross_amount",
+            "price_expiration",
+            "price_fingerprint",
+        ]
+    )
+    CheckoutLine.objects.bulk_update(
+        lines, ["total_price_net_amount", "total_price_gross_amount"]
+    )
+    return checkout
+
+
+def get_stored_line_total(line: "CheckoutLine", currency: str) -> TaxedMoney:
+    return TaxedMoney(
+        net=Money(line.total_price_net_amount, currency),
+        gross=Money(line.total_price_gross_amount, currency),
+    )
@@ -0,0 +1,84 @@
+# Generated by Django 3.1 on 2026-10-16 12:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("checkout", "0030_checkout_channel_listing"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="checkout",
+            name="subtotal_net_amount",
+            field=models.DecimalField(
+                decimal_places=3, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="subtotal_gross_amount",
+            field=models.DecimalField(
+                decimal_places=3, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="shipping_price_net_amount",
+            field=models.DecimalField(
+                decimal_places=3, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="shipping_price_gross_amount",
+            field=models.DecimalField(
+                decimal_places=3, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="total_net_amount",
+            field=models.DecimalField(
+                decimal_places=3, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="total_gross_amount",
+            field=models.DecimalField(
+                decimal_places=3, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="price_expiration",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkout",
+            name="price_fingerprint",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=64
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="total_price_net_amount",
+            field=models.DecimalField(
+                decimal_places=3, default=0, editable=False, max_digits=12
+            ),
+        ),
+        migrations.AddField(
+            model_name="checkoutline",
+            name="total_price_gross_amount",
+            field=models.DecimalField(
+                decimal_places=3, default=0, editable=False, max_digits=12
+            ),
+        ),
+    ]
@@ -7,9 +7,10 @@ from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.db.models import JSONField  # type: ignore
+from django.utils import timezone
 from django.utils.encoding import smart_str
 from django_countries.fields import Country, CountryField
-from django_prices.models import MoneyField
+from django_prices.models import MoneyField, TaxedMoneyField
 from prices import Money
 
 from ..account.models import Address
@@ -101,6 +102,67 @@ class Checkout(ModelWithMetadata):
     redirect_url = models.URLField(blank=True, null=True)
     tracking_code = models.CharField(max_length=255, blank=True, null=True)
 
+    # Prices calculated by the plugins, which are valid until the expiration as
+    # long as the fingerprint of the inputs of the calculation doesn't change
+    subtotal_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+        editable=False,
+    )
+    subtotal_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+        editable=False,
+    )
+    subtotal = TaxedMoneyField(
+        net_amount_field="subtotal_net_amount",
+        gross_amount_field="subtotal_gross_amount",
+        currency_field="currency",
+    )
+
+    shipping_price_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+        editable=False,
+    )
+    shipping_price_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+        editable=False,
+    )
+    shipping_price = TaxedMoneyField(
+        net_amount_field="shipping_price_net_amount",
+        gross_amount_field="shipping_price_gross_amount",
+        currency_field="currency",
+    )
+
+    total_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+        editable=False,
+    )
+    total_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+        editable=False,
+    )
+    total = TaxedMoneyField(
+        net_amount_field="total_net_amount",
+        gross_amount_field="total_gross_amount",
+        currency_field="currency",
+    )
+
+    price_expiration = models.DateTimeField(default=timezone.now, editable=False)
+    price_fingerprint = models.CharField(
+        max_length=64, blank=True, default="", editable=False
+    )
+
     objects = CheckoutQueryset.as_manager()
 
     class Meta:
@@ -184,6 +246,19 @@ class CheckoutLine(models.Model):
     )
     quantity = models.PositiveIntegerField(validators=[MinValueValidator(1)])
     data = JSONField(blank=True, default=dict)
+    # Stored with the prices of the checkout, in its currency
+    total_price_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+        editable=False,
+    )
+    total_price_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+        editable=False,
+    )
 
     class Meta:
         unique_together = ("checkout", "variant", "data")
@@ -0,0 +1,141 @@
+import threading
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from ..discount import DiscountInfo
+
+if TYPE_CHECKING:
+    # flake8: noqa
+    from ..channel.models import Channel
+    from .models import Checkout, CheckoutLine
+
+_local = threading.local()
+
+PriceKey = Tuple[Hashable, ...]
+
+
+class CheckoutPriceContext:
+    """Checkout prices calculated while handling a single request.
+
+    Prices are stored by a fingerprint of everything they depend on: the lines
+    and their quantities, the addresses, the voucher discount, the shipping
+    method and the active discounts. A checkout changed by a mutation gets
+    a new fingerprint, so its prices are calculated again.
+    """
+
+    def __init__(self):
+        self.prices: Dict[PriceKey, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_calculate(self, key: Optional[PriceKey], calculate: Callable[[], Any]):
+        if key is None:
+            return calculate()
+        if key in self.prices:
+            self.hits += 1
+            return self.prices[key]
+        self.misses += 1
+        price = self.prices[key] = calculate()
+        return price
+
+
+def get_price_context() -> Optional[CheckoutPriceContext]:
+    return getattr(_local, "context", None)
+
+
+@contextmanager
+def checkout_price_context() -> Iterator[CheckoutPriceContext]:
+    """Reuse checkout prices calculated within the block.
+
+    Nested blocks share the context of the outermost one.
+    """
+    context = get_price_context()
+    if context is not None:
+        yield context
+        return
+    context = _local.context = CheckoutPriceContext()
+    try:
+        yield context
+    finally:
+        _local.context = None
+
+
+def get_discounts_key(discounts: Iterable[DiscountInfo]) -> PriceKey:
+    return tuple(
+        (type(discount.sale).__name__, discount.sale.pk) for discount in discounts
+    )
+
+
+def get_checkout_state_key(checkout: "Checkout") -> PriceKey:
+    return (
+        checkout.pk,
+        checkout.channel_id,
+        checkout.currency,
+        checkout.country.code,
+        checkout.shipping_address_id,
+        checkout.billing_address_id,
+        checkout.shipping_method_id,
+        checkout.voucher_code,
+        checkout.discount_amount,
+    )
+
+
+def get_checkout_key(
+    name: str,
+    checkout: "Checkout",
+    lines: Iterable["CheckoutLine"],
+    discounts: Iterable[DiscountInfo],
+) -> Optional[PriceKey]:
+    if iter(lines) is lines or iter(discounts) is discounts:
+        # Iterators would be consumed by the fingerprint
+        return None
+    lines_key = tuple((line.pk, line.variant_id, line.quantity) for line in lines)
+    if any(line_key[0] is None for line_key in lines_key):
+        return None
+    return (
+        name,
+        get_checkout_state_key(checkout),
+        lines_key,
+        get_discounts_key(discounts),
+    )
+
+
+def get_checkout_line_key(
+    line: "CheckoutLine", discounts: Iterable[DiscountInfo], channel: "Channel"
+) -> Optional[PriceKey]:
+    if line.pk is None or iter(discounts) is discounts:
+        return None
+    return (
+        "line_total",
+        get_checkout_state_key(line.checkout),
+        (line.pk, line.variant_id, line.quantity),
+        channel.pk,
+        get_discounts_key(discounts),
+    )
+
+
+def memoize_price(
+    scope: Hashable,
+    key_func: Callable[[], Optional[PriceKey]],
+    calculate: Callable[[], Any],
+):
+    """Return the price from the current context or calculate it.
+
+    The scope separates prices calculated differently, e.g. by different plugins.
+    Without a context, e.g. in Celery tasks, prices are always calculated.
+    """
+    context = get_price_context()
+    if context is None:
+        return calculate()
+    key = key_func()
+    return context.get_or_calculate(key and (scope, *key), calculate)
@@ -0,0 +1,119 @@
+from unittest import mock
+
+from ...graphql.tests.utils import get_graphql_content
+from ...plugins.manager import get_plugins_manager
+from .. import base_calculations
+from ..price_context import checkout_price_context
+
+QUERY_CHECKOUT_PRICES = """
+    query CheckoutPrices($token: UUID) {
+        checkout(token: $token) {
+            subtotalPrice {
+                gross {
+                    amount
+                }
+            }
+            totalPrice {
+                gross {
+                    amount
+                }
+            }
+            shippingPrice {
+                gross {
+                    amount
+                }
+            }
+            lines {
+                totalPrice {
+                    gross {
+                        amount
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def calculate_prices(manager, checkout, lines):
+    manager.calculate_checkout_total(checkout, lines, [])
+    manager.calculate_checkout_subtotal(checkout, lines, [])
+    for line in lines:
+        manager.calculate_checkout_line_total(line, [], checkout.channel)
+
+
+@mock.patch.object(
+    base_calculations,
+    "base_checkout_line_total",
+    wraps=base_calculations.base_checkout_line_total,
+)
+def test_checkout_prices_calculated_once_in_context(
+    mocked_line_total, checkout_with_items
+):
+    manager = get_plugins_manager()
+    lines = list(checkout_with_items)
+
+    with checkout_price_context() as context:
+        calculate_prices(manager, checkout_with_items, lines)
+        calculate_prices(get_plugins_manager(), checkout_with_items, lines)
+
+    assert mocked_line_total.call_count == len(lines)
+    assert context.hits > 0
+
+
+@mock.patch.object(
+    base_calculations,
+    "base_checkout_line_total",
+    wraps=base_calculations.base_checkout_line_total,
+)
+def test_checkout_prices_recalculated_after_change(
+    mocked_line_total, checkout_with_items
+):
+    manager = get_plugins_manager()
+    lines = list(checkout_with_items)
+
+    with checkout_price_context():
+        subtotal = manager.calculate_checkout_subtotal(checkout_with_items, lines, [])
+        lines[0].quantity += 1
+        new_subtotal = manager.calculate_checkout_subtotal(
+            checkout_with_items, lines, []
+        )
+
+    # Only the changed line is calculated again
+    assert mocked_line_total.call_count == len(lines) + 1
+    assert new_subtotal > subtotal
+
+
+@mock.patch.object(
+    base_calculations,
+    "base_checkout_line_total",
+    wraps=base_calculations.base_checkout_line_total,
+)
+def test_checkout_prices_calculated_without_context(
+    mocked_line_total, checkout_with_items
+):
+    manager = get_plugins_manager()
+    lines = list(checkout_with_items)
+
+    calculate_prices(manager, checkout_with_items, lines)
+
+    # The total calculates the subtotal, both calculate all line totals
+    assert mocked_line_total.call_count == len(lines) * 3
+
+
+@mock.patch.object(
+    base_calculations,
+    "base_checkout_line_total",
+    wraps=base_calculations.base_checkout_line_total,
+)
+def test_checkout_query_calculates_line_totals_once(
+    mocked_line_total, api_client, checkout_with_items, settings
+):
+    settings.CHECKOUT_PRICE_CONTEXT_ENABLED = True
+    variables = {"token": str(checkout_with_items.token)}
+
+    response = api_client.post_graphql(QUERY_CHECKOUT_PRICES, variables)
+
+    content = get_graphql_content(response)
+    lines = content["data"]["checkout"]["lines"]
+    assert mocked_line_total.call_count == len(lines)
@@ -0,0 +1,156 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ...graphql.checkout.dataloaders import CheckoutLinesByCheckoutTokenLoader
+from ...graphql.checkout.types import CheckoutLine as CheckoutLineType
+from ...graphql.tests.utils import get_graphql_content
+from .. import calculations
+from ..models import CheckoutLine
+
+QUERY_CHECKOUT_PRICES = """
+    query CheckoutPrices($token: UUID) {
+        checkout(token: $token) {
+            totalPrice {
+                gross {
+                    amount
+                }
+            }
+            subtotalPrice {
+                gross {
+                    amount
+                }
+            }
+            lines {
+                totalPrice {
+                    gross {
+                        amount
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_fetch_checkout_prices_stores_prices(checkout_with_items):
+    checkout = checkout_with_items
+    lines = list(checkout)
+
+    calculations.fetch_checkout_prices_if_expired(checkout, lines)
+
+    checkout.refresh_from_db()
+    expected_total = calculations.checkout_total(checkout=checkout, lines=lines)
+    assert checkout.total == expected_total
+    assert checkout.subtotal == calculations.checkout_subtotal(
+        checkout=checkout, lines=lines
+    )
+    assert checkout.price_fingerprint
+    assert checkout.price_expiration > timezone.now()
+    for line in CheckoutLine.objects.filter(checkout=checkout):
+        assert calculations.get_stored_line_total(
+            line, checkout.currency
+        ) == calculations.checkout_line_total(line=line, channel=checkout.channel)
+
+
+@mock.patch(
+    "saleor.checkout.calculations.checkout_total", wraps=calculations.checkout_total
+)
+def test_fetch_checkout_prices_reuses_valid_prices(
+    mocked_checkout_total, checkout_with_items
+):
+    lines = list(checkout_with_items)
+
+    calculations.fetch_checkout_prices_if_expired(checkout_with_items, lines)
+    calculations.fetch_checkout_prices_if_expired(checkout_with_items, lines)
+
+    mocked_checkout_total.assert_called_once()
+
+
+@mock.patch(
+    "saleor.checkout.calculations.checkout_total", wraps=calculations.checkout_total
+)
+def test_fetch_checkout_prices_after_expiration(
+    mocked_checkout_total, checkout_with_items, settings
+):
+    lines = list(checkout_with_items)
+    calculations.fetch_checkout_prices_if_expired(checkout_with_items, lines)
+
+    expired = timezone.now() + settings.CHECKOUT_PRICE_SNAPSHOT_TTL
+    with freeze_time(expired + timedelta(seconds=1)):
+        calculations.fetch_checkout_prices_if_expired(checkout_with_items, lines)
+
+    assert mocked_checkout_total.call_count == 2
+
+
+@mock.patch(
+    "saleor.checkout.calculations.checkout_total", wraps=calculations.checkout_total
+)
+def test_fetch_checkout_prices_after_checkout_change(
+    mocked_checkout_total, checkout_with_items
+):
+    lines = list(checkout_with_items)
+    calculations.fetch_checkout_prices_if_expired(checkout_with_items, lines)
+    total = checkout_with_items.total
+
+    lines[0].quantity += 1
+    lines[0].save(update_fields=["quantity"])
+    calculations.fetch_checkout_prices_if_expired(checkout_with_items, lines)
+
+    assert mocked_checkout_total.call_count == 2
+    assert checkout_with_items.total > total
+
+
+@mock.patch(
+    "saleor.checkout.calculations.checkout_total", wraps=calculations.checkout_total
+)
+def test_fetch_checkout_prices_force_update(mocked_checkout_total, checkout_with_items):
+    lines = list(checkout_with_items)
+    calculations.fetch_checkout_prices_if_expired(checkout_with_items, lines)
+
+    calculations.fetch_checkout_prices_if_expired(
+        checkout_with_items, lines, force_update=True
+    )
+
+    assert mocked_checkout_total.call_count == 2
+
+
+@mock.patch(
+    "saleor.checkout.calculations.checkout_total", wraps=calculations.checkout_total
+)
+def test_checkout_query_serves_stored_prices(
+    mocked_checkout_total, api_client, checkout_with_items, settings
+):
+    settings.CHECKOUT_PRICE_SNAPSHOT_ENABLED = True
+    variables = {"token": str(checkout_with_items.token)}
+
+    first_response = api_client.post_graphql(QUERY_CHECKOUT_PRICES, variables)
+    second_response = api_client.post_graphql(QUERY_CHECKOUT_PRICES, variables)
+
+    first_content = get_graphql_content(first_response)
+    assert get_graphql_content(second_response) == first_content
+    mocked_checkout_total.assert_called_once()
+    checkout_with_items.refresh_from_db()
+    data = first_content["data"]["checkout"]
+    assert data["totalPrice"]["gross"]["amount"] == float(
+        checkout_with_items.total.gross.amount
+    )
+
+
+def test_stored_line_total_price_of_line_missing_from_loader(rf, checkout_with_items):
+    checkout = checkout_with_items
+    line, *other_lines = list(checkout)
+    request = rf.post("/graphql/")
+    request.user = checkout.user
+    request.request_time = timezone.now()
+    # Lines of the checkout loaded before the line was added
+    CheckoutLinesByCheckoutTokenLoader(request).prime(checkout.token, other_lines)
+    info = mock.Mock(context=request)
+
+    total_price = CheckoutLineType._resolve_stored_total_price(line, info).get()
+
+    assert total_price == calculations.checkout_line_total(
+        line=line, channel=checkout.channel
+    )
@@ -0,0 +1,116 @@
+import uuid
+from functools import partial
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+from ..account.models import User
+
+USER_CACHE_KEY = "jwt_user:{}:{}"
+USER_VERSION_KEY = "jwt_user_version:{}"
+
+
+def get_user_version(user_pk) -> str:
+    version_key = USER_VERSION_KEY.format(user_pk)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(version_key)
+    return version
+
+
+def load_user(email: str) -> Optional[User]:
+    return User.objects.filter(email=email, is_active=True).first()
+
+
+def get_active_user(email: str, user_pk: Optional[str]) -> Optional[User]:
+    """Return the active user authenticated with an access token.
+
+    The user is cached together with the effective permission codenames, so the
+    authentication and permission checks of a cached user don't run any queries.
+    Entries are keyed with the version of the user, which is replaced whenever the
+    user, their groups or permissions change.
+    """
+    if not settings.JWT_USER_CACHE_ENABLED or user_pk is None:
+        return load_user(email)
+    key = USER_CACHE_KEY.format(user_pk, get_user_version(user_pk))
+    user = cache.get(key)
+    if user is not None and user.email == email:
+        return user
+    user = load_user(email)
+    if user is not None and str(user.pk) == user_pk:
+        permissions = user.effective_permissions.values_list(
+            "content_type__app_label", "codename"
+        ).order_by()
+        # The setter drops the lazy queryset, so it's not pickled with the user
+        user.effective_permissions = None
+        user._effective_permissions_cache = {f"{ct}.{name}" for ct, name in permissions}
+        timeout = settings.JWT_USER_CACHE_TTL.total_seconds()
+        cache.set(key, user, timeout=timeout)
+    return user
+
+
+def invalidate_users(user_pks: Iterable):
+    """Drop the versions of the users once the transaction is committed.
+
+    Dropping them earlier would let a concurrent request cache the user from
+    before the change again, e.g. with a removed permission or group.
+    """
+    keys = [USER_VERSION_KEY.format(pk) for pk in user_pks]
+    if keys:
+        transaction.on_commit(partial(cache.delete_many, keys))
+
+
+def get_user_pks(**lookup):
+    return User.objects.filter(**lookup).values_list("pk", flat=True)
+
+
+def handle_user_change(sender, instance, **kwargs):
+    invalidate_users([instance.pk])
+
+
+def handle_group_delete(sender, instance, **kwargs):
+    invalidate_users(get_user_pks(groups=instance))
+
+
+def handle_m2m_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # Clearing doesn't pass the removed pks, so affected users are looked up
+    # before the clear
+    if action not in ("post_add", "post_remove", "pre_clear", "post_clear"):
+        return
+    if sender is Group.permissions.through:
+        if not reverse:
+            user_pks = get_user_pks(groups=instance)
+        elif pk_set:
+            user_pks = get_user_pks(groups__in=pk_set)
+        else:
+            user_pks = get_user_pks(groups__permissions=instance)
+    elif not reverse:
+        user_pks = [instance.pk]
+    elif pk_set:
+        user_pks = pk_set
+    else:
+        lookup = "groups" if sender is User.groups.through else "user_permissions"
+        user_pks = get_user_pks(**{lookup: instance})
+    invalidate_users(user_pks)
+
+
+def connect_invalidation_signals():
+    # The receivers look up users of changed groups and permissions, so they are
+    # connected only when the cache is used
+    if not settings.JWT_USER_CACHE_ENABLED:
+        return
+    uid = "jwt_user_cache"
+    post_save.connect(handle_user_change, sender=User, dispatch_uid=uid)
+    post_delete.connect(handle_user_change, sender=User, dispatch_uid=uid)
+    pre_delete.connect(handle_group_delete, sender=Group, dispatch_uid=uid)
+    for through in (
+        User.groups.through,
+        User.user_permissions.through,
+        Group.permissions.through,
+    ):
+        m2m_changed.connect(handle_m2m_change, sender=through, dispatch_uid=uid)
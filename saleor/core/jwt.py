@@ -8,7 +8,8 @@ from django.core.handlers.wsgi import WSGIRequest
 
 from ..account.models import User
 from ..app.models import App
-from .permissions import get_permission_names, get_permissions_from_names
+from .auth_cache import get_active_user
+from .permissions import get_permission_names, get_permissions_enum_dict
 
 JWT_ALGORITHM = "HS256"
 JWT_AUTH_HEADER = "HTTP_AUTHORIZATION"
@@ -96,8 +97,16 @@ def get_token_from_request(request: WSGIRequest) -> Optional[str]:
     return auth[1]
 
 
+def get_user_pk_from_payload(payload: Dict[str, Any]) -> Optional[str]:
+    try:
+        _, user_pk = graphene.Node.from_global_id(payload.get("user_id"))
+    except (TypeError, ValueError):
+        return None
+    return user_pk
+
+
 def get_user_from_payload(payload: Dict[str, Any]) -> Optional[User]:
-    user = User.objects.filter(email=payload["email"], is_active=True).first()
+    user = get_active_user(payload["email"], get_user_pk_from_payload(payload))
     user_jwt_token = payload.get("token")
     if not user_jwt_token or not user:
         raise jwt.InvalidTokenError(
@@ -120,11 +129,16 @@ def get_user_from_access_token(token: str) -> Optional[User]:
     permissions = payload.get(PERMISSIONS_FIELD, None)
     user = get_user_from_payload(payload)
     if user and permissions is not None:
-        token_permissions = get_permissions_from_names(permissions)
-        token_codenames = [perm.codename for perm in token_permissions]
+        permission_enums = get_permissions_enum_dict()
+        token_permissions = [permission_enums[name] for name in permissions]
+        cached_permissions = getattr(user, "_effective_permissions_cache", None)
         user.effective_permissions = user.effective_permissions.filter(
-            codename__in=token_codenames
+            codename__in=[perm.codename for perm in token_permissions]
         )
+        if cached_permissions is not None:
+            user._effective_permissions_cache = cached_permissions & {
+                perm.value for perm in token_permissions
+            }
     return user
 
 
@@ -0,0 +1,95 @@
+import datetime
+import json
+import timeit
+import uuid
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from ....graphql.encoders import encode_json, encode_orjson, orjson
+
+
+def get_price(amount):
+    return {"currency": "USD", "amount": amount}
+
+
+def get_product_node(index):
+    return {
+        "id": f"UHJvZHVjdDo{index}",
+        "name": f"Product {index}",
+        "slug": f"product-{index}",
+        "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+        "updatedAt": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        "rating": Decimal("4.5"),
+        "thumbnail": {
+            "url": f"https://example.com/media/products/{uuid.uuid4()}.png",
+            "alt": "",
+        },
+        "pricing": {
+            "onSale": index % 2 == 0,
+            "priceRange": {
+                "start": {"gross": get_price(10.5 + index), "net": get_price(8.5)},
+                "stop": {"gross": get_price(20.5 + index), "net": get_price(16.5)},
+            },
+        },
+        "variants": [
+            {
+                "id": str(uuid.uuid4()),
+                "sku": f"{index}-{variant}",
+                "quantityAvailable": variant * 10,
+                "attributes": [{"name": "Size", "values": ["S", "M", "L"]}],
+            }
+            for variant in range(3)
+        ],
+    }
+
+
+def get_category_payload(products):
+    edges = [{"node": get_product_node(index)} for index in range(products)]
+    return {
+        "data": {
+            "category": {
+                "id": "Q2F0ZWdvcnk6MQ==",
+                "name": "Apparel",
+                "products": {
+                    "totalCount": products,
+                    "pageInfo": {"hasNextPage": True, "endCursor": "WyIxMDAiXQ=="},
+                    "edges": edges,
+                },
+            }
+        }
+    }
+
+
+def encode_django(data):
+    # The encoding done by `JsonResponse` before the encoder became pluggable
+    return json.dumps(data, cls=DjangoJSONEncoder).encode("utf-8")
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the speed of GraphQL response encoders on a payload similar "
+        "to a category page."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--products", type=int, default=250, help="Number of products to encode."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=50, help="Number of encodings to time."
+        )
+
+    def handle(self, **options):
+        payload = get_category_payload(options["products"])
+        repeat = options["repeat"]
+        encoders = {"DjangoJSONEncoder": encode_django, "encode_json": encode_json}
+        if orjson is not None:
+            encoders["encode_orjson"] = encode_orjson
+
+        size = len(encode_django(payload))
+        self.stdout.write(f"Payload size: {size / 1024:.0f} KB, {repeat} runs")
+        for name, encoder in encoders.items():
+            elapsed = timeit.timeit(lambda: encoder(payload), number=repeat)
+            self.stdout.write(f"{name}: {elapsed / repeat * 1000:.2f} ms per response")
@@ -0,0 +1,66 @@
+import timeit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django_countries.fields import Country
+
+from ....channel.models import Channel
+from ....checkout.models import CheckoutLine
+from ....plugins.manager import DEFAULT_HOOKS, PluginsManager
+from ....product.models import Product
+
+
+class Command(BaseCommand):
+    help = (
+        "Time hot plugin hooks with the configured plugins, dispatching them to "
+        "the plugins implementing each hook and to all plugins."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--channel", default=settings.DEFAULT_CHANNEL_SLUG)
+        parser.add_argument(
+            "--repeat", type=int, default=1000, help="Number of calls to time."
+        )
+
+    def get_hooks(self, channel):
+        product = Product.objects.first()
+        line = (
+            CheckoutLine.objects.filter(checkout__channel=channel)
+            .select_related("checkout", "variant")
+            .first()
+        )
+        if product is None or line is None:
+            raise CommandError("Populate the database with products and checkouts.")
+        price = line.variant.get_price(channel.slug)
+        country = Country(settings.DEFAULT_COUNTRY)
+        # Arguments of the hooks, which are called through the manager
+        return {
+            "apply_taxes_to_product": (product, price, country),
+            "calculate_checkout_line_total": (line, [], channel),
+            "show_taxes_on_storefront": (),
+        }
+
+    def handle(self, **options):
+        channel = Channel.objects.get(slug=options["channel"])
+        repeat = options["repeat"]
+        manager = PluginsManager(settings.PLUGINS)
+        # The dispatch of a manager without the table of implementing plugins
+        all_plugins_manager = PluginsManager(settings.PLUGINS)
+        all_plugins_manager.hook_plugins = {
+            hook: all_plugins_manager.plugins for hook in DEFAULT_HOOKS
+        }
+
+        self.stdout.write(f"Plugins: {len(manager.plugins)}, {repeat} calls")
+        for hook, args in self.get_hooks(channel).items():
+            implementing = len(manager.hook_plugins[hook])
+            dispatched = timeit.timeit(
+                lambda: getattr(manager, hook)(*args), number=repeat
+            )
+            all_plugins = timeit.timeit(
+                lambda: getattr(all_plugins_manager, hook)(*args), number=repeat
+            )
+            self.stdout.write(
+                f"{hook} ({implementing} implementing): "
+                f"{dispatched / repeat * 1e6:.1f} us per call, "
+                f"{all_plugins / repeat * 1e6:.1f} us dispatched to all plugins"
+            )
@@ -0,0 +1,52 @@
+from django.core.management.base import BaseCommand
+
+from ...utils.import_time import (
+    BOOT_MODULES,
+    get_package_import_times,
+    profile_imports,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Boot Django in a new interpreter, import the given modules and print "
+        "the slowest imports by module and by top-level package."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "modules",
+            nargs="*",
+            default=BOOT_MODULES,
+            help="Modules to import after Django is set up.",
+        )
+        parser.add_argument("--limit", type=int, default=30)
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Sort modules by the time including or excluding their imports.",
+        )
+
+    def handle(self, **options):
+        import_times = profile_imports(options["modules"])
+        limit = options["limit"]
+        total = sum(import_time.self_time for import_time in import_times)
+        self.stdout.write(
+            f"Imported {len(import_times)} modules in {total / 1000:.0f} ms"
+        )
+
+        self.stdout.write("\nPackages (self time):")
+        package_times = get_package_import_times(import_times)
+        packages = sorted(package_times.items(), key=lambda item: -item[1])
+        for package, package_time in packages[:limit]:
+            self.stdout.write(f"{package_time / 1000:10.1f} ms  {package}")
+
+        self.stdout.write(f"\nModules ({options['sort']} time):")
+        key = "cumulative_time" if options["sort"] == "cumulative" else "self_time"
+        modules = sorted(import_times, key=lambda item: -getattr(item, key))
+        for import_time in modules[:limit]:
+            self.stdout.write(
+                f"{import_time.cumulative_time / 1000:10.1f} ms "
+                f"{import_time.self_time / 1000:10.1f} ms  {import_time.name}"
+            )
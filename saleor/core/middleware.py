@@ -1,10 +1,13 @@
+import asyncio
 import logging
 from datetime import datetime
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.exceptions import MiddlewareNotUsed
 from django.utils import timezone
+from django.utils.decorators import sync_and_async_middleware
 from django.utils.functional import SimpleLazyObject
 from django.utils.translation import get_language
 from django_countries.fields import Country
@@ -18,13 +21,61 @@ from .utils import get_client_ip, get_country_by_ip, get_currency_for_country
 logger = logging.getLogger(__name__)
 
 
+def process_request_middleware(get_response, process_request, blocking=False):
+    """Return a middleware calling `process_request` before the view.
+
+    The middleware follows the mode of `get_response`, so under ASGI the request
+    isn't handed to a thread for every middleware. Blocking calls, e.g. HTTP
+    requests, are run in a thread by the async middleware.
+    """
+    if asyncio.iscoroutinefunction(get_response):
+        process_request_in_thread = sync_to_async(
+            process_request, thread_sensitive=False
+        )
+
+        async def _async_middleware(request):
+            if blocking:
+                await process_request_in_thread(request)
+            else:
+                process_request(request)
+            return await get_response(request)
+
+        return _async_middleware
+
+    def _middleware(request):
+        process_request(request)
+        return get_response(request)
+
+    return _middleware
+
+
+def process_response_middleware(get_response, process_response):
+    """Return a middleware calling `process_response` with the view's response."""
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def _async_middleware(request):
+            response = await get_response(request)
+            process_response(request, response)
+            return response
+
+        return _async_middleware
+
+    def _middleware(request):
+        response = get_response(request)
+        process_response(request, response)
+        return response
+
+    return _middleware
+
+
+@sync_and_async_middleware
 def google_analytics(get_response):
     """Report a page view to Google Analytics."""
 
     if not settings.GOOGLE_ANALYTICS_TRACKING_ID:
         raise MiddlewareNotUsed()
 
-    def _google_analytics_middleware(request):
+    def _report_view(request):
         client_id = analytics.get_client_id(request)
         path = request.path
         language = get_language()
@@ -35,56 +86,56 @@ def google_analytics(get_response):
             )
         except Exception:
             logger.exception("Unable to update analytics")
-        return get_response(request)
 
-    return _google_analytics_middleware
+    return process_request_middleware(get_response, _report_view, blocking=True)
 
 
+@sync_and_async_middleware
 def request_time(get_response):
     def _stamp_request(request):
         request.request_time = timezone.now()
-        return get_response(request)
 
-    return _stamp_request
+    return process_request_middleware(get_response, _stamp_request)
 
 
+@sync_and_async_middleware
 def discounts(get_response):
     """Assign active discounts to `request.discounts`."""
 
-    def _discounts_middleware(request):
+    def _assign_discounts(request):
         request.discounts = SimpleLazyObject(
             lambda: fetch_discounts(request.request_time)
         )
-        return get_response(request)
 
-    return _discounts_middleware
+    return process_request_middleware(get_response, _assign_discounts)
 
 
+@sync_and_async_middleware
 def country(get_response):
     """Detect the user's country and assign it to `request.country`."""
 
-    def _country_middleware(request):
+    def _assign_country(request):
         client_ip = get_client_ip(request)
         if client_ip:
             request.country = get_country_by_ip(client_ip)
         if not request.country:
             request.country = Country(settings.DEFAULT_COUNTRY)
-        return get_response(request)
 
-    return _country_middleware
+    return process_request_middleware(get_response, _assign_country)
 
 
+@sync_and_async_middleware
 def currency(get_response):
     """Take a country and assign a matching currency to `request.currency`."""
 
-    def _currency_middleware(request):
+    def _assign_currency(request):
         if hasattr(request, "country") and request.country is not None:
             request.currency = get_currency_for_country(request.country)
-        return get_response(request)
 
-    return _currency_middleware
+    return process_request_middleware(get_response, _assign_currency)
 
 
+@sync_and_async_middleware
 def site(get_response):
     """Clear the Sites cache and assign the current site to `request.site`.
 
@@ -98,30 +149,29 @@ def site(get_response):
         Site.objects.clear_cache()
         return Site.objects.get_current()
 
-    def _site_middleware(request):
+    def _assign_site(request):
         request.site = SimpleLazyObject(_get_site)
-        return get_response(request)
 
-    return _site_middleware
+    return process_request_middleware(get_response, _assign_site)
 
 
+@sync_and_async_middleware
 def plugins(get_response):
     """Assign plugins manager."""
 
     def _get_manager():
         return get_plugins_manager(plugins=settings.PLUGINS)
 
-    def _plugins_middleware(request):
+    def _assign_plugins(request):
         request.plugins = SimpleLazyObject(lambda: _get_manager())
-        return get_response(request)
 
-    return _plugins_middleware
+    return process_request_middleware(get_response, _assign_plugins)
 
 
+@sync_and_async_middleware
 def jwt_refresh_token_middleware(get_response):
-    def middleware(request):
+    def _set_refresh_token_cookie(request, response):
         """Append generated refresh_token to response object."""
-        response = get_response(request)
         jwt_refresh_token = getattr(request, "refresh_token", None)
         if jwt_refresh_token:
             expires = None
@@ -135,6 +185,5 @@ def jwt_refresh_token_middleware(get_response):
                 httponly=True,  # protects token from leaking
                 secure=not settings.DEBUG,
             )
-        return response
 
-    return middleware
+    return process_response_middleware(get_response, _set_refresh_token_cookie)
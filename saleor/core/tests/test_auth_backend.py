@@ -1,10 +1,14 @@
+from unittest import mock
+
 import jwt
 import pytest
-from django.contrib.auth.models import Permission
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
 from freezegun import freeze_time
 from jwt import ExpiredSignatureError, InvalidSignatureError, InvalidTokenError
 
 from ..auth_backend import JSONWebTokenBackend
+from ..auth_cache import connect_invalidation_signals
 from ..jwt import (
     JWT_ACCESS_TYPE,
     JWT_ALGORITHM,
@@ -14,7 +18,13 @@ from ..jwt import (
     jwt_encode,
     jwt_user_payload,
 )
-from ..permissions import get_permissions_from_names
+from ..permissions import (
+    AppPermission,
+    CheckoutPermissions,
+    OrderPermissions,
+    get_permissions_from_names,
+)
+from ...tests.utils import flush_post_commit_hooks
 
 
 def test_user_authenticated(rf, staff_user):
@@ -175,3 +185,138 @@ def test_user_has_old_token_type(rf, staff_user, settings):
     backend = JSONWebTokenBackend()
     with pytest.raises(InvalidTokenError):
         backend.authenticate(request)
+
+
+@pytest.fixture
+def jwt_user_cache_enabled(settings):
+    settings.JWT_USER_CACHE_ENABLED = True
+    connect_invalidation_signals()
+    cache.clear()
+
+
+def authenticate_with_token(rf, access_token):
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+    return JSONWebTokenBackend().authenticate(request)
+
+
+def test_user_cached(
+    rf,
+    staff_user,
+    permission_manage_orders,
+    jwt_user_cache_enabled,
+    django_assert_num_queries,
+):
+    staff_user.user_permissions.add(permission_manage_orders)
+    access_token = create_access_token(staff_user)
+    authenticate_with_token(rf, access_token)
+
+    with django_assert_num_queries(0):
+        user = authenticate_with_token(rf, access_token)
+        assert user == staff_user
+        assert user.has_perm(OrderPermissions.MANAGE_ORDERS)
+        assert not user.has_perm(OrderPermissions.MANAGE_ORDERS.value + "_other")
+
+
+def test_cached_user_with_limited_permissions(
+    rf, staff_user, app, jwt_user_cache_enabled, django_assert_num_queries
+):
+    staff_user.user_permissions.set(
+        Permission.objects.filter(codename__in=["manage_apps", "manage_checkouts"])
+    )
+    app.permissions.set(Permission.objects.filter(codename__in=["manage_checkouts"]))
+    access_token_for_app = create_access_token_for_app(app, staff_user)
+    authenticate_with_token(rf, access_token_for_app)
+
+    with django_assert_num_queries(0):
+        user = authenticate_with_token(rf, access_token_for_app)
+        assert user.has_perm(CheckoutPermissions.MANAGE_CHECKOUTS)
+        assert not user.has_perm(AppPermission.MANAGE_APPS)
+
+
+def test_cached_user_deactivated(rf, staff_user, jwt_user_cache_enabled):
+    access_token = create_access_token(staff_user)
+    authenticate_with_token(rf, access_token)
+
+    staff_user.is_active = False
+    staff_user.save(update_fields=["is_active"])
+    flush_post_commit_hooks()
+
+    with pytest.raises(InvalidTokenError):
+        authenticate_with_token(rf, access_token)
+
+
+def test_cached_user_password_changed(rf, staff_user, jwt_user_cache_enabled):
+    access_token = create_access_token(staff_user)
+    authenticate_with_token(rf, access_token)
+
+    staff_user.set_password("new-password")
+    staff_user.jwt_token_key = "New key"
+    staff_user.save(update_fields=["password", "jwt_token_key"])
+    flush_post_commit_hooks()
+
+    with pytest.raises(InvalidTokenError):
+        authenticate_with_token(rf, access_token)
+
+
+def test_cached_user_group_changes(
+    rf, staff_user, permission_manage_orders, jwt_user_cache_enabled
+):
+    group = Group.objects.create(name="Orders")
+    access_token = create_access_token(staff_user)
+    assert not authenticate_with_token(rf, access_token).has_perm(
+        OrderPermissions.MANAGE_ORDERS
+    )
+
+    group.permissions.add(permission_manage_orders)
+    group.user_set.add(staff_user)
+    flush_post_commit_hooks()
+    assert authenticate_with_token(rf, access_token).has_perm(
+        OrderPermissions.MANAGE_ORDERS
+    )
+
+    group.permissions.clear()
+    flush_post_commit_hooks()
+    assert not authenticate_with_token(rf, access_token).has_perm(
+        OrderPermissions.MANAGE_ORDERS
+    )
+
+
+def test_cached_user_invalidated_after_commit(
+    rf, staff_user, permission_manage_orders, jwt_user_cache_enabled
+):
+    staff_user.user_permissions.add(permission_manage_orders)
+    access_token = create_access_token(staff_user)
+    authenticate_with_token(rf, access_token)
+
+    staff_user.user_permissions.clear()
+
+    # Dropping the version before the commit would let concurrent requests cache
+    # the removed permission again, so it's dropped only after the commit
+    assert authenticate_with_token(rf, access_token).has_perm(
+        OrderPermissions.MANAGE_ORDERS
+    )
+    flush_post_commit_hooks()
+    assert not authenticate_with_token(rf, access_token).has_perm(
+        OrderPermissions.MANAGE_ORDERS
+    )
+
+
+def test_cached_user_without_permissions(
+    rf, staff_user, app, jwt_user_cache_enabled, django_assert_num_queries
+):
+    app.permissions.set(Permission.objects.filter(codename__in=["manage_checkouts"]))
+    access_token_for_app = create_access_token_for_app(app, staff_user)
+    authenticate_with_token(rf, access_token_for_app)
+
+    with django_assert_num_queries(0):
+        user = authenticate_with_token(rf, access_token_for_app)
+        assert not user.has_perm(CheckoutPermissions.MANAGE_CHECKOUTS)
+
+
+def test_user_cache_signals_not_connected_when_disabled(settings):
+    settings.JWT_USER_CACHE_ENABLED = False
+
+    with mock.patch("saleor.core.auth_cache.post_save") as mocked_post_save:
+        connect_invalidation_signals()
+
+    mocked_post_save.connect.assert_not_called()
@@ -0,0 +1,56 @@
+from ..utils.import_time import (
+    ModuleImportTime,
+    get_imported_modules,
+    get_package_import_times,
+    parse_import_times,
+)
+
+# Modules which are slow to import and only needed to handle specific requests
+DEFERRED_MODULES = {
+    "boto3",
+    "google.cloud.pubsub_v1",
+    "stripe",
+    "braintree",
+    "razorpay",
+    "Adyen",
+    "saleor.graphql.api",
+}
+
+IMPORT_TIME_OUTPUT = """
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     graphql.pyutils
+import time:       300 |        420 |   graphql
+import time:        80 |        500 | graphene
+"""
+
+
+def test_boot_does_not_import_deferred_modules():
+    # when
+    modules = get_imported_modules(["saleor.urls", "saleor.celeryconf"])
+
+    # then
+    assert "saleor.urls" in modules
+    assert not modules & DEFERRED_MODULES
+
+
+def test_wsgi_warm_up_imports_only_schema():
+    # when
+    modules = get_imported_modules(["saleor.wsgi"])
+
+    # then
+    # The application is warmed up with a request, which builds the schema
+    assert "saleor.graphql.api" in modules
+    assert not modules & (DEFERRED_MODULES - {"saleor.graphql.api"})
+
+
+def test_parse_import_times():
+    # when
+    import_times = parse_import_times(IMPORT_TIME_OUTPUT)
+
+    # then
+    assert import_times == [
+        ModuleImportTime("graphql.pyutils", 120, 120),
+        ModuleImportTime("graphql", 300, 420),
+        ModuleImportTime("graphene", 80, 500),
+    ]
+    assert get_package_import_times(import_times) == {"graphql": 420, "graphene": 80}
@@ -1,4 +1,7 @@
+import asyncio
+
 from django.core.handlers.base import BaseHandler
+from django.utils.module_loading import import_string
 from freezegun import freeze_time
 
 from ..jwt import JWT_REFRESH_TOKEN_COOKIE_NAME, create_refresh_token
@@ -17,3 +20,27 @@ def test_jwt_refresh_token_middleware(rf, customer_user, settings):
     response = handler.get_response(request)
     cookie = response.cookies.get(JWT_REFRESH_TOKEN_COOKIE_NAME)
     assert cookie.value == refresh_token
+
+
+@freeze_time("2020-03-18 12:00:00")
+def test_jwt_refresh_token_middleware_async(rf, customer_user, settings):
+    refresh_token = create_refresh_token(customer_user)
+    settings.MIDDLEWARE = [
+        "saleor.core.middleware.jwt_refresh_token_middleware",
+    ]
+    request = rf.request()
+    request.refresh_token = refresh_token
+    handler = BaseHandler()
+    handler.load_middleware(is_async=True)
+    response = asyncio.run(handler.get_response_async(request))
+    cookie = response.cookies.get(JWT_REFRESH_TOKEN_COOKIE_NAME)
+    assert cookie.value == refresh_token
+
+
+def test_middleware_supports_async_handlers(settings):
+    middleware = [path for path in settings.MIDDLEWARE if path.startswith("saleor.")]
+
+    for path in middleware:
+        factory = import_string(path)
+        assert factory.sync_capable, path
+        assert factory.async_capable, path
@@ -0,0 +1,69 @@
+from unittest import mock
+
+import opentracing
+import pytest
+
+from ...graphql.tests.fixtures import API_PATH
+from ..tracing import get_tracer, is_sampled, sampling, should_sample_request
+
+
+@pytest.mark.parametrize(
+    "sample_rate, random_value, expected",
+    [(1, 0.99, True), (0, 0.0, False), (0.1, 0.05, True), (0.1, 0.5, False)],
+)
+def test_should_sample_request(rf, settings, sample_rate, random_value, expected):
+    settings.OPENTRACING_SAMPLE_RATE = sample_rate
+    request = rf.post(API_PATH)
+
+    with mock.patch("saleor.core.tracing.random.random", return_value=random_value):
+        assert should_sample_request(request) is expected
+
+
+def test_should_sample_request_forced_by_header(rf, settings):
+    settings.OPENTRACING_SAMPLE_RATE = 0
+    request = rf.post(API_PATH, HTTP_X_SALEOR_TRACE="1")
+
+    assert should_sample_request(request) is True
+
+
+def test_sampling_restores_previous_decision():
+    assert is_sampled()
+
+    with sampling(False):
+        assert not is_sampled()
+        assert get_tracer() is not opentracing.global_tracer()
+
+    assert is_sampled()
+    assert get_tracer() is opentracing.global_tracer()
+
+
+def test_unsampled_request_does_not_create_spans(api_client, settings):
+    settings.OPENTRACING_SAMPLE_RATE = 0
+
+    with mock.patch("saleor.graphql.views.opentracing.global_tracer") as mocked_tracer:
+        response = api_client.post({"query": "{ shop { name } }"})
+
+    assert response.status_code == 200
+    mocked_tracer.assert_not_called()
+
+
+def test_sampled_request_creates_spans(api_client, settings):
+    settings.OPENTRACING_SAMPLE_RATE = 0
+
+    with mock.patch(
+        "saleor.graphql.views.opentracing.global_tracer",
+        wraps=opentracing.global_tracer,
+    ) as mocked_tracer:
+        api_client.post({"query": "{ shop { name } }"}, HTTP_X_SALEOR_TRACE="1")
+
+    mocked_tracer.assert_called()
+
+
+def test_unsampled_request_does_not_set_span_tags(api_client, settings):
+    settings.OPENTRACING_SAMPLE_RATE = 0
+
+    with mock.patch.object(opentracing.Span, "set_tag") as mocked_set_tag:
+        response = api_client.post({"query": "{ shop { name } }"})
+
+    assert response.status_code == 200
+    mocked_set_tag.assert_not_called()
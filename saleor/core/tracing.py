@@ -1,8 +1,54 @@
+import random
+import threading
+from contextlib import contextmanager
 from functools import partial
+from typing import TYPE_CHECKING, Iterator
 
+import opentracing
+from django.conf import settings
 from graphene.types.resolver import default_resolver
 from graphql import ResolveInfo
 
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+FORCE_SAMPLE_HEADER = "HTTP_X_SALEOR_TRACE"
+
+_local = threading.local()
+_noop_tracer = opentracing.Tracer()
+
+
+def should_sample_request(request: "HttpRequest") -> bool:
+    """Decide if spans are recorded for the request.
+
+    Requests are sampled at `OPENTRACING_SAMPLE_RATE`, the decision can be forced
+    with the `X-Saleor-Trace` header.
+    """
+    if request.META.get(FORCE_SAMPLE_HEADER, "").lower() in ("1", "true"):
+        return True
+    sample_rate = settings.OPENTRACING_SAMPLE_RATE
+    return sample_rate >= 1 or random.random() < sample_rate
+
+
+def is_sampled() -> bool:
+    # Code running outside of a request, e.g. in Celery tasks, is always traced
+    return getattr(_local, "sampled", True)
+
+
+@contextmanager
+def sampling(sampled: bool) -> Iterator[None]:
+    previous = is_sampled()
+    _local.sampled = sampled
+    try:
+        yield
+    finally:
+        _local.sampled = previous
+
+
+def get_tracer() -> opentracing.Tracer:
+    """Return the global tracer if the current request is sampled, else a no-op."""
+    return opentracing.global_tracer() if is_sampled() else _noop_tracer
+
 
 def should_trace(info: ResolveInfo) -> bool:
     if info.field_name not in info.parent_type.fields:
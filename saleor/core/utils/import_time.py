@@ -0,0 +1,89 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Set
+
+# Modules imported by a process serving requests or running Celery tasks
+BOOT_MODULES = ["saleor.wsgi", "saleor.urls", "saleor.celeryconf"]
+
+IMPORT_SCRIPT = """
+import importlib
+import sys
+
+import django
+
+django.setup()
+for module in sys.argv[1:]:
+    importlib.import_module(module)
+print("\\n".join(sys.modules))
+"""
+
+
+@dataclass
+class ModuleImportTime:
+    name: str
+    # Both times are in microseconds, as reported by `python -X importtime`
+    self_time: int
+    cumulative_time: int
+
+    @property
+    def package(self) -> str:
+        return self.name.split(".", 1)[0]
+
+
+def run_import_script(modules: Iterable[str], import_time: bool = False):
+    """Import Django and the modules in a new interpreter.
+
+    A fresh process is needed as the modules of the current one are already
+    imported.
+    """
+    options = ["-X", "importtime"] if import_time else []
+    env = os.environ.copy()
+    env.setdefault("DJANGO_SETTINGS_MODULE", "saleor.settings")
+    return subprocess.run(
+        [sys.executable, *options, "-c", IMPORT_SCRIPT, *modules],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+
+def get_imported_modules(modules: Iterable[str] = BOOT_MODULES) -> Set[str]:
+    """Return all modules loaded by booting Django and importing the modules."""
+    result = run_import_script(modules)
+    return set(result.stdout.split())
+
+
+def parse_import_times(output: str) -> List[ModuleImportTime]:
+    import_times = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative_time, name = line[len("import time:") :].split("|")
+        if not self_time.strip().isdigit():
+            # The header of the report
+            continue
+        import_times.append(
+            ModuleImportTime(name.strip(), int(self_time), int(cumulative_time))
+        )
+    return import_times
+
+
+def profile_imports(modules: Iterable[str] = BOOT_MODULES) -> List[ModuleImportTime]:
+    """Return the import times of all modules loaded by booting Django."""
+    result = run_import_script(modules, import_time=True)
+    return parse_import_times(result.stderr)
+
+
+def get_package_import_times(
+    import_times: Iterable[ModuleImportTime],
+) -> Dict[str, int]:
+    """Sum the import times of modules by their top-level package."""
+    package_times: Dict[str, int] = defaultdict(int)
+    for import_time in import_times:
+        package_times[import_time.package] += import_time.self_time
+    return package_times
@@ -5,6 +5,7 @@ from django.core.exceptions import ValidationError
 
 from ...account import models
 from ...account.error_codes import AccountErrorCode
+from ...core.auth_cache import invalidate_users
 from ...core.permissions import AccountPermissions
 from ..core.mutations import BaseBulkMutation, ModelBulkDeleteMutation
 from ..core.types.common import AccountError, StaffError
@@ -110,3 +111,5 @@ class UserBulkSetActive(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, queryset, is_active):
         queryset.update(is_active=is_active)
+        # Updates don't send signals, which invalidate cached users
+        invalidate_users(queryset.values_list("pk", flat=True))
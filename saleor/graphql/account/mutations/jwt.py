@@ -109,6 +109,7 @@ class CreateToken(BaseMutation):
         refresh_token = create_refresh_token(user, {"csrfToken": csrf_token})
         info.context.refresh_token = refresh_token
         info.context._cached_user = user
+        info.context.user = user
         user.last_login = timezone.now()
         user.save(update_fields=["last_login"])
         return cls(
@@ -6,7 +6,7 @@ from django.contrib.auth.models import Group
 from django.core.files import File
 
 from .....account.models import User
-from ....tests.utils import get_graphql_content
+from ....tests.utils import assert_query_budget, get_graphql_content
 
 
 @pytest.mark.django_db
@@ -117,6 +117,36 @@ def test_query_staff_user(
     assert data
 
 
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_staff_user_list(
+    staff_api_client, staff_users, permission_manage_staff, count_queries
+):
+    staff_api_client.user.user_permissions.add(permission_manage_staff)
+    query = """
+        query StaffList($first: Int) {
+          staffUsers(first: $first) {
+            edges {
+              node {
+                id
+                email
+                firstName
+                lastName
+                isActive
+                avatar {
+                  alt
+                  url
+                }
+              }
+            }
+          }
+        }
+    """
+    variables = {"first": 20}
+    with assert_query_budget(3, max_repeats=1):
+        get_graphql_content(staff_api_client.post_graphql(query, variables))
+
+
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
 def test_staff_create(
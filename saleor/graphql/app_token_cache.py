@@ -0,0 +1,99 @@
+import hashlib
+from functools import partial
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from ..app.models import App, AppToken
+
+APP_TOKEN_CACHE_KEY = "app_token:{}"
+
+
+def get_token_cache_key(auth_token: str) -> str:
+    # Tokens are never used as cache keys, so they don't leak to the cache server
+    token_hash = hashlib.sha256(auth_token.encode("utf-8")).hexdigest()
+    return APP_TOKEN_CACHE_KEY.format(token_hash)
+
+
+def load_app(auth_token: str) -> Optional[App]:
+    qs = App.objects.filter(tokens__auth_token=auth_token, is_active=True)
+    return qs.first()
+
+
+def get_app_by_token(auth_token: str) -> Optional[App]:
+    """Return the active app authenticated with the token.
+
+    The app is cached together with its permission codenames, so checking
+    permissions of a cached app doesn't run any queries. Entries are removed when
+    the token is deleted or the app or its permissions change; the TTL limits the
+    staleness of entries of changes which bypass the model signals.
+    """
+    if not settings.APP_TOKEN_CACHE_ENABLED:
+        return load_app(auth_token)
+    key = get_token_cache_key(auth_token)
+    app = cache.get(key)
+    if app is not None:
+        return app
+    app = load_app(auth_token)
+    if app is not None:
+        # Permissions are stored in the app's permission cache attribute
+        app.get_permissions()
+        timeout = settings.APP_TOKEN_CACHE_TTL.total_seconds()
+        cache.set(key, app, timeout=timeout)
+    return app
+
+
+def invalidate_tokens(auth_tokens: Iterable[str]):
+    """Remove the entries of the tokens once the transaction is committed.
+
+    Removing them earlier would let a concurrent request cache the rows from
+    before the change again, e.g. a revoked token or removed permissions.
+    """
+    keys = [get_token_cache_key(token) for token in auth_tokens]
+    if keys:
+        transaction.on_commit(partial(cache.delete_many, keys))
+
+
+def invalidate_apps(**lookup):
+    # Tokens are fetched right away, e.g. permissions are gone after the clear
+    tokens = AppToken.objects.filter(**lookup).values_list("auth_token", flat=True)
+    invalidate_tokens(list(tokens))
+
+
+def handle_token_change(sender, instance, **kwargs):
+    invalidate_tokens([instance.auth_token])
+
+
+def handle_app_change(sender, instance, **kwargs):
+    invalidate_apps(app=instance)
+
+
+def handle_app_permissions_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate_apps(app=instance)
+    elif action in ("post_add", "post_remove"):
+        invalidate_apps(app__in=pk_set)
+    elif action == "pre_clear":
+        # Apps losing the permission are unknown after the clear
+        invalidate_apps(app__permissions=instance)
+
+
+def connect_invalidation_signals():
+    # The receivers query the tokens of changed apps, so they are connected only
+    # when the cache is used
+    if not settings.APP_TOKEN_CACHE_ENABLED:
+        return
+    uid = "app_token_cache"
+    post_save.connect(handle_token_change, sender=AppToken, dispatch_uid=uid)
+    post_delete.connect(handle_token_change, sender=AppToken, dispatch_uid=uid)
+    # Deleting an app deletes its tokens, which invalidates their entries
+    post_save.connect(handle_app_change, sender=App, dispatch_uid=uid)
+    m2m_changed.connect(
+        handle_app_permissions_change,
+        sender=App.permissions.through,
+        dispatch_uid=uid,
+    )
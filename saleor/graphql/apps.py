@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class GraphQLConfig(AppConfig):
+    name = "saleor.graphql"
+
+    def ready(self):
+        from ..core import auth_cache
+        from . import app_token_cache, loader_cache, response_cache
+
+        response_cache.connect_invalidation_signals()
+        loader_cache.connect_invalidation_signals()
+        app_token_cache.connect_invalidation_signals()
+        auth_cache.connect_invalidation_signals()
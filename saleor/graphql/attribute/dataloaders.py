@@ -6,6 +6,7 @@ from ..core.dataloaders import DataLoader
 
 class AttributeValuesByAttributeIdLoader(DataLoader):
     context_key = "attributevalues_by_attribute"
+    shared_cache_model = AttributeValue
 
     def batch_load(self, keys):
         attribute_values = AttributeValue.objects.filter(attribute_id__in=keys)
@@ -19,6 +20,7 @@ class AttributeValuesByAttributeIdLoader(DataLoader):
 
 class AttributesByAttributeId(DataLoader):
     context_key = "attributes_by_id"
+    shared_cache_model = Attribute
 
     def batch_load(self, keys):
         attributes = Attribute.objects.in_bulk(keys)
@@ -27,6 +29,7 @@ class AttributesByAttributeId(DataLoader):
 
 class AttributeValueByIdLoader(DataLoader):
     context_key = "attributevalue_by_id"
+    shared_cache_model = AttributeValue
 
     def batch_load(self, keys):
         attribute_values = AttributeValue.objects.in_bulk(keys)
@@ -6,6 +6,7 @@ from ..order.dataloaders import OrderByIdLoader, OrderLineByIdLoader
 
 class ChannelByIdLoader(DataLoader):
     context_key = "channel_by_id"
+    shared_cache_model = Channel
 
     def batch_load(self, keys):
         channels = Channel.objects.in_bulk(keys)
@@ -14,6 +15,7 @@ class ChannelByIdLoader(DataLoader):
 
 class ChannelBySlugLoader(DataLoader):
     context_key = "channel_by_slug"
+    shared_cache_model = Channel
 
     def batch_load(self, keys):
         channels = Channel.objects.in_bulk(keys, field_name="slug")
@@ -28,6 +28,10 @@ class ChannelContextType(DjangoObjectType):
 
     @classmethod
     def is_type_of(cls, root: ChannelContext, info):
+        # Abstract types, e.g. the federation entities, check every possible type
+        # until one matches, so other roots are passed here too
+        if not isinstance(root, ChannelContext):
+            return False
         return super().is_type_of(root.node, info)
 
     @staticmethod
@@ -1,6 +1,6 @@
 import pytest
 
-from ....tests.utils import get_graphql_content
+from ....tests.utils import assert_query_budget, get_graphql_content
 
 
 @pytest.mark.django_db
@@ -139,4 +139,5 @@ def test_user_checkout_details(user_api_client, customer_checkout, count_queries
           }
         }
     """
-    get_graphql_content(user_api_client.post_graphql(query))
+    with assert_query_budget(73):
+        get_graphql_content(user_api_client.post_graphql(query))
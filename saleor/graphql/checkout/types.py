@@ -1,4 +1,5 @@
 import graphene
+from django.conf import settings
 from promise import Promise
 
 from ...checkout import calculations, models
@@ -20,7 +21,7 @@ from ..product.resolvers import resolve_variant
 from ..shipping.dataloaders import ShippingMethodByIdLoader
 from ..shipping.types import ShippingMethod
 from ..utils import get_user_or_app_from_context
-from .dataloaders import CheckoutLinesByCheckoutTokenLoader
+from .dataloaders import CheckoutByIdLoader, CheckoutLinesByCheckoutTokenLoader
 
 
 class GatewayConfigLine(graphene.ObjectType):
@@ -76,6 +77,8 @@ class CheckoutLine(CountableDjangoObjectType):
     @staticmethod
     def resolve_total_price(root, info):
         context = info.context
+        if settings.CHECKOUT_PRICE_SNAPSHOT_ENABLED:
+            return CheckoutLine._resolve_stored_total_price(root, info)
         channel = ChannelByCheckoutLineIDLoader(context).load(root.id)
 
         def calculate_total_price_with_discounts(discounts):
@@ -92,6 +95,27 @@ class CheckoutLine(CountableDjangoObjectType):
             .then(calculate_total_price_with_discounts)
         )
 
+    @staticmethod
+    def _resolve_stored_total_price(root: models.CheckoutLine, info):
+        def get_stored_total_price(data):
+            checkout, lines, discounts = data
+            calculations.fetch_checkout_prices_if_expired(checkout, lines, discounts)
+            # The stored prices are updated on the lines of the dataloader
+            line = next((line for line in lines if line.pk == root.pk), None)
+            if line is None:
+                # The line was added after the lines of the checkout were loaded
+                return calculations.checkout_line_total(
+                    line=root, discounts=discounts, channel=checkout.channel
+                )
+            return calculations.get_stored_line_total(line, checkout.currency)
+
+        checkout = CheckoutByIdLoader(info.context).load(root.checkout_id)
+        lines = CheckoutLinesByCheckoutTokenLoader(info.context).load(root.checkout_id)
+        discounts = DiscountsByDateTimeLoader(info.context).load(
+            info.context.request_time
+        )
+        return Promise.all([checkout, lines, discounts]).then(get_stored_total_price)
+
     @staticmethod
     def resolve_requires_shipping(root: models.CheckoutLine, *_args):
         return root.is_shipping_required()
@@ -198,12 +222,14 @@ class Checkout(CountableDjangoObjectType):
     def resolve_total_price(root: models.Checkout, info):
         def calculate_total_price(data):
             lines, discounts = data
-            taxed_total = (
-                calculations.checkout_total(
+            if settings.CHECKOUT_PRICE_SNAPSHOT_ENABLED:
+                calculations.fetch_checkout_prices_if_expired(root, lines, discounts)
+                total = root.total
+            else:
+                total = calculations.checkout_total(
                     checkout=root, lines=lines, discounts=discounts
                 )
-                - root.get_total_gift_cards_balance()
-            )
+            taxed_total = total - root.get_total_gift_cards_balance()
             return max(taxed_total, zero_taxed_money(root.currency))
 
         lines = CheckoutLinesByCheckoutTokenLoader(info.context).load(root.token)
@@ -218,6 +244,9 @@ class Checkout(CountableDjangoObjectType):
     def resolve_subtotal_price(root: models.Checkout, info):
         def calculate_subtotal_price(data):
             lines, discounts = data
+            if settings.CHECKOUT_PRICE_SNAPSHOT_ENABLED:
+                calculations.fetch_checkout_prices_if_expired(root, lines, discounts)
+                return root.subtotal
             return calculations.checkout_subtotal(
                 checkout=root, lines=lines, discounts=discounts
             )
@@ -234,6 +263,9 @@ class Checkout(CountableDjangoObjectType):
     def resolve_shipping_price(root: models.Checkout, info):
         def calculate_shipping_price(data):
             lines, discounts = data
+            if settings.CHECKOUT_PRICE_SNAPSHOT_ENABLED:
+                calculations.fetch_checkout_prices_if_expired(root, lines, discounts)
+                return root.shipping_price
             return calculations.checkout_shipping_price(
                 checkout=root, lines=lines, discounts=discounts
             )
@@ -247,7 +279,9 @@ class Checkout(CountableDjangoObjectType):
 
     @staticmethod
     # TODO: We should optimize it in/after PR#5819
-    def resolve_lines(root: models.Checkout, *_args):
+    def resolve_lines(root: models.Checkout, info):
+        # Lines resolve their stored prices with the checkout of the dataloader
+        CheckoutByIdLoader(info.context).prime(root.pk, root)
         return root.lines.prefetch_related("variant")
 
     @staticmethod
@@ -0,0 +1,130 @@
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .response_cache import get_anonymous_request_key
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+COALESCE_LOCK_KEY = "graphql_coalesce_lock:{}"
+COALESCE_RESULT_KEY = "graphql_coalesce_result:{}:{}"
+POLL_INTERVAL = 0.05
+
+
+def get_timeout() -> float:
+    return settings.GRAPHQL_COALESCE_TIMEOUT.total_seconds()
+
+
+@dataclass
+class Flight:
+    """Execution of an operation shared by concurrent identical requests.
+
+    The request holding the lock executes the operation and shares its data;
+    the requests waiting for it get the shared `data`.
+    """
+
+    key: Optional[str] = None
+    token: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+
+    def share(self, data: Dict[str, Any]):
+        if self.token:
+            result_key = COALESCE_RESULT_KEY.format(self.key, self.token)
+            cache.set(result_key, data, timeout=get_timeout())
+
+
+class RequestCoalescer:
+    """Single-flight execution of identical concurrent anonymous queries.
+
+    The first request for a key takes a lock in the Django cache, so it's shared
+    by all workers. Requests arriving while the lock is held poll for the result
+    of its holder instead of executing the query. When the holder fails or
+    doesn't finish within `GRAPHQL_COALESCE_TIMEOUT`, they execute the query
+    themselves.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+        self.fallbacks = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.GRAPHQL_COALESCE_ENABLED
+
+    def get_key(
+        self,
+        request: "HttpRequest",
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> Optional[str]:
+        if not self.enabled:
+            return None
+        return get_anonymous_request_key(request, query, variables, operation_name)
+
+    @contextmanager
+    def coalesce(self, key: Optional[str]) -> Iterator[Flight]:
+        if key is None:
+            yield Flight()
+            return
+        lock_key = COALESCE_LOCK_KEY.format(key)
+        token = uuid.uuid4().hex
+        if not cache.add(lock_key, token, timeout=get_timeout()):
+            data = self.wait_for_result(key, lock_key)
+            self._record("followers" if data is not None else "fallbacks")
+            yield Flight(data=data)
+            return
+        self._record("leaders")
+        try:
+            yield Flight(key, token)
+        finally:
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+
+    @staticmethod
+    def wait_for_result(key: str, lock_key: str) -> Optional[Dict[str, Any]]:
+        leader_token = cache.get(lock_key)
+        if leader_token is None:
+            return None
+        result_key = COALESCE_RESULT_KEY.format(key, leader_token)
+        deadline = time.monotonic() + get_timeout()
+        while time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            values = cache.get_many([result_key, lock_key])
+            if result_key in values:
+                return values[result_key]
+            if values.get(lock_key) != leader_token:
+                # The result is shared before the lock is released, so the
+                # leader has failed
+                return None
+        return None
+
+    def _record(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def clear(self):
+        with self._lock:
+            self.leaders = 0
+            self.followers = 0
+            self.fallbacks = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "followers": self.followers,
+                "fallbacks": self.fallbacks,
+            }
+
+
+coalescer = RequestCoalescer()
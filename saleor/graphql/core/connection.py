@@ -1,8 +1,16 @@
 import json
-from typing import Any, Dict, Iterable, List, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import graphene
-from django.db.models import Model as DjangoModel, Q, QuerySet
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    BooleanField,
+    Expression,
+    F,
+    Model as DjangoModel,
+    Q,
+    QuerySet,
+)
 from graphene.relay.connection import Connection
 from graphene_django.types import DjangoObjectType
 from graphql.error import GraphQLError
@@ -10,6 +18,7 @@ from graphql_relay.connection.connectiontypes import Edge, PageInfo
 from graphql_relay.utils import base64, unbase64
 
 from ..core.enums import OrderDirection
+from .total_count import get_total_count
 
 ConnectionArguments = Dict[str, Any]
 
@@ -92,6 +101,73 @@ def _prepare_filter(
     return filter_kwargs
 
 
+class RowValueComparison(Expression):
+    """Compare a row of fields with a row of values, e.g. `(a, b) > (%s, %s)`."""
+
+    output_field = BooleanField()
+
+    def __init__(self, fields: List[str], values: List[str], operator: str):
+        super().__init__()
+        self.fields = [F(field) for field in fields]
+        self.values = values
+        self.operator = operator
+
+    def get_source_expressions(self):
+        return self.fields
+
+    def set_source_expressions(self, exprs):
+        self.fields = exprs
+
+    def as_sql(self, compiler, connection):
+        fields_sql = []
+        params: List[Any] = []
+        for field in self.fields:
+            field_sql, field_params = compiler.compile(field)
+            fields_sql.append(field_sql)
+            params.extend(field_params)
+        values_sql = ", ".join(["%s"] * len(self.values))
+        sql = f"({', '.join(fields_sql)}) {self.operator} ({values_sql})"
+        return sql, params + list(self.values)
+
+
+def _is_not_nullable(model, field_name: str) -> bool:
+    """Check if a field in the 'field__foreign_key_field' format can't be null."""
+    opts = model._meta
+    for name in field_name.split("__"):
+        try:
+            field = opts.pk if name == "pk" else opts.get_field(name)
+        except FieldDoesNotExist:
+            # Annotations
+            return False
+        if field.null or field.many_to_many or field.one_to_many:
+            return False
+        if field.is_relation:
+            opts = field.related_model._meta
+    return True
+
+
+def _prepare_row_value_filter(
+    cursor: List[str], sorting_fields: List[str], sorting_direction: str, model
+) -> Optional[Q]:
+    """Create a row value comparison of the sorting fields with the cursor.
+
+    Postgres can serve it with a single range scan of an index on the sorting
+    fields, unlike the equivalent alternative of conditions. Row values can't be
+    compared with nulls, so it's only used when the cursor has no null values
+    and the fields other than the first one can't be null.
+    """
+    if any(value is None for value in cursor):
+        return None
+    if not all(_is_not_nullable(model, field) for field in sorting_fields[1:]):
+        return None
+    operator = ">" if sorting_direction == "gt" else "<"
+    row_value_filter = Q(RowValueComparison(sorting_fields, cursor, operator))
+    if sorting_direction == "gt":
+        # Nulls are sorted as the greatest values
+        row_value_filter |= Q(**{f"{sorting_fields[0]}__isnull": True})
+    return row_value_filter
+
+
 def _validate_connection_args(args):
     first = args.get("first")
     last = args.get("last")
@@ -211,9 +287,13 @@ def connection_from_queryset_slice(
     sorting_direction = _get_sorting_direction(sort_by, last)
     if cursor and len(cursor) != len(sorting_fields):
         raise GraphQLError("Received cursor is invalid.")
-    filter_kwargs = (
-        _prepare_filter(cursor, sorting_fields, sorting_direction) if cursor else Q()
-    )
+    filter_kwargs: Optional[Q] = Q()
+    if cursor:
+        filter_kwargs = _prepare_row_value_filter(
+            cursor, sorting_fields, sorting_direction, qs.model
+        )
+        if filter_kwargs is None:
+            filter_kwargs = _prepare_filter(cursor, sorting_fields, sorting_direction)
     qs = qs.filter(filter_kwargs)
     qs = qs[:end_margin]
     edges, page_info = _get_edges_for_connection(edge_type, qs, args, sorting_fields)
@@ -260,10 +340,16 @@ class CountableConnection(NonNullConnection):
     total_count = graphene.Int(description="A total count of items in the collection.")
 
     @staticmethod
-    def resolve_total_count(root, *_args, **_kwargs):
+    def resolve_total_count(root, info, *_args, **_kwargs):
         if isinstance(root.iterable, list):
             return len(root.iterable)
-        return root.iterable.count()
+        total_count, strategy = get_total_count(root.iterable)
+        # The used strategy is returned in the `totalCount` response extension
+        path = ".".join(str(key) for key in info.path[:-1])
+        if not hasattr(info.context, "total_count_strategies"):
+            info.context.total_count_strategies = {}
+        info.context.total_count_strategies[path] = strategy
+        return total_count
 
 
 class CountableDjangoObjectType(DjangoObjectType):
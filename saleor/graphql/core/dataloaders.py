@@ -1,11 +1,19 @@
-from typing import Generic, Iterable, List, TypeVar, Union
+import time
+from typing import Generic, Iterable, List, Optional, Type, TypeVar, Union
 
 import opentracing
 import opentracing.tags
+from django.db.models import Model
 from django.http import HttpRequest
 from promise import Promise
 from promise.dataloader import DataLoader as BaseLoader
 
+from ...core.tracing import is_sampled
+from ..dataloader_metrics import LoaderStats
+from ..loader_cache import CACHEABLE_MODELS, loader_cache
+from ..query_budget import is_recording, resolving
+from ..resolver_tracing import get_current_tracer
+
 K = TypeVar("K")
 R = TypeVar("R")
 
@@ -13,6 +21,17 @@ R = TypeVar("R")
 class DataLoader(BaseLoader, Generic[K, R]):
     context_key = None
     context = None
+    # Values of loaders with a model set are also cached across requests, until an
+    # instance of the model is saved or deleted
+    shared_cache_model: Optional[Type[Model]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        model = cls.shared_cache_model
+        if model is not None and model._meta.label not in CACHEABLE_MODELS:
+            raise TypeError(
+                "Values of %r are not invalidated by the loader cache" % (model,)
+            )
 
     def __new__(cls, context: HttpRequest):
         key = cls.context_key
@@ -30,18 +49,48 @@ class DataLoader(BaseLoader, Generic[K, R]):
         if self.context != context:
             self.context = context
             self.user = context.user
+            self.stats = LoaderStats()
             super().__init__()
 
+    def load(self, key: K) -> Promise[R]:
+        self.stats.calls += 1
+        return super().load(key)
+
     def batch_load_fn(self, keys: Iterable[K]) -> Promise[List[R]]:
+        if not is_sampled():
+            return self._batch_load(keys)
         with opentracing.global_tracer().start_active_span(
             self.__class__.__name__
         ) as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "dataloaders")
-            results = self.batch_load(keys)
-            if not isinstance(results, Promise):
-                return Promise.resolve(results)
-            return results
+            return self._batch_load(keys)
+
+    def _batch_load(self, keys: Iterable[K]) -> Promise[List[R]]:
+        tracer = get_current_tracer()
+        start_offset = tracer.get_offset() if tracer else 0
+        start = time.perf_counter()
+        keys_count = len(keys)  # type: ignore
+        if is_recording():
+            with resolving(self.__class__.__name__):
+                results = self._load_with_shared_cache(keys)
+        else:
+            results = self._load_with_shared_cache(keys)
+        if not isinstance(results, Promise):
+            results = Promise.resolve(results)
+
+        def on_resolve(values):
+            self.stats.add_batch(keys_count, time.perf_counter() - start)
+            if tracer:
+                tracer.add_dataloader(self.__class__.__name__, keys_count, start_offset)
+            return values
+
+        return results.then(on_resolve)
+
+    def _load_with_shared_cache(self, keys: Iterable[K]):
+        if self.shared_cache_model is None or not loader_cache.enabled:
+            return self.batch_load(keys)
+        return loader_cache.load(self, keys)
 
     def batch_load(self, keys: Iterable[K]) -> Union[Promise[List[R]], List[R]]:
         raise NotImplementedError()
@@ -0,0 +1,114 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from ....app.models import App
+from ....core.permissions import OrderPermissions
+from ....tests.utils import flush_post_commit_hooks
+from ...app_token_cache import connect_invalidation_signals, get_token_cache_key
+from ...middleware import get_app
+
+
+@pytest.fixture
+def app_token_cache_enabled(settings):
+    settings.APP_TOKEN_CACHE_ENABLED = True
+    connect_invalidation_signals()
+    cache.clear()
+
+
+def test_get_app_cached(
+    app, permission_manage_orders, app_token_cache_enabled, django_assert_num_queries
+):
+    app.permissions.add(permission_manage_orders)
+    token = app.tokens.get().auth_token
+    get_app(token)
+
+    with django_assert_num_queries(0):
+        cached_app = get_app(token)
+        assert cached_app == app
+        assert cached_app.has_perm(OrderPermissions.MANAGE_ORDERS)
+
+
+def test_get_app_cache_key_does_not_contain_token(app):
+    token = app.tokens.get().auth_token
+
+    assert token not in get_token_cache_key(token)
+
+
+def test_get_app_cache_invalidated_on_token_delete(app, app_token_cache_enabled):
+    token = app.tokens.get()
+    get_app(token.auth_token)
+
+    token.delete()
+    flush_post_commit_hooks()
+
+    assert get_app(token.auth_token) is None
+
+
+def test_get_app_cache_invalidated_on_app_deactivation(app, app_token_cache_enabled):
+    token = app.tokens.get().auth_token
+    get_app(token)
+
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+    flush_post_commit_hooks()
+
+    assert get_app(token) is None
+
+
+def test_get_app_cache_invalidated_after_commit(app, app_token_cache_enabled):
+    token = app.tokens.get().auth_token
+    get_app(token)
+
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # Removing the entry before the commit would let concurrent requests cache
+    # the active app again, so it's removed only after the commit
+    assert get_app(token) == app
+    flush_post_commit_hooks()
+    assert get_app(token) is None
+
+
+def test_get_app_cache_invalidated_on_app_delete(app, app_token_cache_enabled):
+    token = app.tokens.get().auth_token
+    get_app(token)
+
+    App.objects.filter(pk=app.pk).delete()
+    flush_post_commit_hooks()
+
+    assert get_app(token) is None
+
+
+def test_get_app_cache_invalidated_on_permission_changes(
+    app, permission_manage_orders, app_token_cache_enabled
+):
+    token = app.tokens.get().auth_token
+    assert not get_app(token).has_perm(OrderPermissions.MANAGE_ORDERS)
+
+    app.permissions.add(permission_manage_orders)
+    flush_post_commit_hooks()
+    assert get_app(token).has_perm(OrderPermissions.MANAGE_ORDERS)
+
+    permission_manage_orders.app_set.clear()
+    flush_post_commit_hooks()
+    assert not get_app(token).has_perm(OrderPermissions.MANAGE_ORDERS)
+
+
+def test_get_app_not_cached_when_disabled(app, settings, django_assert_num_queries):
+    settings.APP_TOKEN_CACHE_ENABLED = False
+    token = app.tokens.get().auth_token
+    get_app(token)
+
+    with django_assert_num_queries(1):
+        get_app(token)
+
+
+def test_invalidation_signals_not_connected_when_disabled(settings):
+    settings.APP_TOKEN_CACHE_ENABLED = False
+
+    with mock.patch("saleor.graphql.app_token_cache.post_save") as mocked_post_save:
+        connect_invalidation_signals()
+
+    mocked_post_save.connect.assert_not_called()
@@ -22,7 +22,7 @@ class Mutation(BaseMutation):
 
     @classmethod
     def perform_mutation(cls, _root, info, product_id, channel):
-        # Need to mock `app_middleware`
+        # Need to mock `authenticate_app`
         info.context.app = None
 
         product = cls.get_node_or_error(
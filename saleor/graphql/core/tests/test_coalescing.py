@@ -0,0 +1,134 @@
+from datetime import timedelta
+from unittest import mock
+
+import graphene
+import pytest
+from django.core.cache import cache
+
+from ...coalescing import (
+    COALESCE_LOCK_KEY,
+    COALESCE_RESULT_KEY,
+    Flight,
+    RequestCoalescer,
+    coalescer,
+)
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCT = """
+    query GetProduct($id: ID!, $channel: String) {
+        product(id: $id, channel: $channel) {
+            name
+        }
+    }
+"""
+
+KEY = "key"
+LOCK_KEY = COALESCE_LOCK_KEY.format(KEY)
+
+
+@pytest.fixture
+def coalescing_enabled(settings):
+    settings.GRAPHQL_COALESCE_ENABLED = True
+    settings.GRAPHQL_COALESCE_TIMEOUT = timedelta(seconds=1)
+    cache.clear()
+    coalescer.clear()
+
+
+@pytest.fixture
+def product_variables(product, channel_USD):
+    return {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+
+
+def test_coalesce_first_request_executes_and_shares(coalescing_enabled):
+    request_coalescer = RequestCoalescer()
+
+    with request_coalescer.coalesce(KEY) as flight:
+        assert flight.data is None
+        assert cache.get(LOCK_KEY) == flight.token
+        flight.share({"shop": {"name": "Saleor"}})
+
+    result_key = COALESCE_RESULT_KEY.format(KEY, flight.token)
+    assert cache.get(result_key) == {"shop": {"name": "Saleor"}}
+    assert cache.get(LOCK_KEY) is None
+    assert request_coalescer.get_stats()["leaders"] == 1
+
+
+def test_coalesce_concurrent_request_gets_shared_result(coalescing_enabled):
+    request_coalescer = RequestCoalescer()
+    cache.add(LOCK_KEY, "leader")
+    cache.set(COALESCE_RESULT_KEY.format(KEY, "leader"), {"shop": {"name": "Saleor"}})
+
+    with request_coalescer.coalesce(KEY) as flight:
+        assert flight.data == {"shop": {"name": "Saleor"}}
+
+    assert cache.get(LOCK_KEY) == "leader"
+    assert request_coalescer.get_stats()["followers"] == 1
+
+
+def test_coalesce_concurrent_request_executes_when_leader_fails(coalescing_enabled):
+    request_coalescer = RequestCoalescer()
+    cache.add(LOCK_KEY, "leader")
+
+    with mock.patch(
+        "saleor.graphql.coalescing.time.sleep",
+        side_effect=lambda _: cache.delete(LOCK_KEY),
+    ):
+        with request_coalescer.coalesce(KEY) as flight:
+            assert flight.data is None
+            assert flight.token is None
+
+    assert request_coalescer.get_stats()["fallbacks"] == 1
+
+
+def test_coalesce_concurrent_request_executes_after_timeout(
+    coalescing_enabled, settings
+):
+    settings.GRAPHQL_COALESCE_TIMEOUT = timedelta(milliseconds=100)
+    request_coalescer = RequestCoalescer()
+    cache.add(LOCK_KEY, "leader")
+
+    with request_coalescer.coalesce(KEY) as flight:
+        assert flight.data is None
+
+    assert request_coalescer.get_stats()["fallbacks"] == 1
+
+
+def test_coalesce_without_key():
+    with RequestCoalescer().coalesce(None) as flight:
+        assert flight == Flight()
+
+
+def test_coalesced_query_returns_shared_result(
+    coalescing_enabled, api_client, product_variables
+):
+    shared_data = {"product": {"name": "Shared"}}
+    cache.add(LOCK_KEY, "leader")
+    cache.set(COALESCE_RESULT_KEY.format(KEY, "leader"), shared_data)
+
+    with mock.patch.object(coalescer, "get_key", return_value=KEY):
+        response = api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    content = get_graphql_content(response)
+    assert content["data"] == shared_data
+
+
+def test_query_result_shared_with_concurrent_requests(
+    coalescing_enabled, api_client, product, product_variables
+):
+    with mock.patch.object(Flight, "share") as mocked_share:
+        response = api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    content = get_graphql_content(response)
+    mocked_share.assert_called_once_with(content["data"])
+    assert coalescer.get_stats()["leaders"] == 1
+
+
+def test_authenticated_query_not_coalesced(
+    coalescing_enabled, staff_api_client, product_variables
+):
+    staff_api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    assert coalescer.get_stats()["leaders"] == 0
@@ -0,0 +1,115 @@
+from promise import Promise
+
+from ...channel.dataloaders import ChannelBySlugLoader
+from ...dataloader_metrics import (
+    LoaderStats,
+    LoaderStatsAggregator,
+    pop_loader_stats,
+    report_loader_stats,
+)
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCTS = """
+    query($channel: String) {
+        products(first: 2, channel: $channel) {
+            edges {
+                node {
+                    name
+                    category {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+reported_stats = []
+
+
+def collect_stats(stats):
+    reported_stats.append(stats)
+
+
+def test_loader_stats_count_calls_batches_and_duplicates(rf, channel_USD):
+    request = rf.get("/")
+    request.user = None
+    loader = ChannelBySlugLoader(request)
+
+    # Loads are only batched when they're made while promises are resolved, like
+    # during the execution of a query
+    Promise.resolve(None).then(
+        lambda _: loader.load_many([channel_USD.slug, "missing", channel_USD.slug])
+    ).get()
+    loader.load(channel_USD.slug).get()
+
+    stats = pop_loader_stats(request)["ChannelBySlugLoader"]
+    assert stats["calls"] == 4
+    assert stats["batches"] == 1
+    assert stats["keys"] == 2
+    assert stats["max_batch_size"] == 2
+    assert stats["duplicates"] == 2
+    assert stats["cache_hit_ratio"] == 0.5
+    assert stats["time"] > 0
+    assert loader.stats == LoaderStats()
+
+
+def test_loader_stats_in_extensions_in_debug(
+    api_client, product, channel_USD, settings
+):
+    settings.DEBUG = True
+
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    content = get_graphql_content(response)
+    stats = content["extensions"]["dataloaders"]
+    assert stats["CategoryByIdLoader"]["batches"] == 1
+
+
+def test_loader_stats_not_in_extensions(api_client, product, channel_USD, settings):
+    settings.DEBUG = False
+
+    response = api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    content = get_graphql_content(response)
+    assert "dataloaders" not in content.get("extensions", {})
+
+
+def test_loader_stats_reported_to_hook(api_client, product, channel_USD, settings):
+    settings.GRAPHQL_DATALOADER_STATS_HOOK = (
+        "saleor.graphql.core.tests.test_dataloader_metrics.collect_stats"
+    )
+    reported_stats.clear()
+
+    api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    assert len(reported_stats) == 1
+    assert reported_stats[0]["CategoryByIdLoader"]["keys"] == 1
+
+
+def test_report_loader_stats_without_hook(settings):
+    settings.GRAPHQL_DATALOADER_STATS_HOOK = None
+
+    report_loader_stats({"Loader": LoaderStats(calls=1).as_dict()})
+
+
+def test_loader_stats_aggregator():
+    aggregator = LoaderStatsAggregator()
+    first = LoaderStats(calls=3)
+    first.add_batch(2, 0.5)
+    second = LoaderStats(calls=4)
+    second.add_batch(4, 0.25)
+
+    aggregator({"Loader": first.as_dict()})
+    aggregator({"Loader": second.as_dict()})
+
+    stats = aggregator.get_stats()["Loader"]
+    assert stats["calls"] == 7
+    assert stats["batches"] == 2
+    assert stats["keys"] == 6
+    assert stats["duplicates"] == 1
+    assert stats["max_batch_size"] == 4
+    assert stats["average_batch_size"] == 3
+    assert stats["time"] == 0.75
+    aggregator.clear()
+    assert aggregator.get_stats() == {}
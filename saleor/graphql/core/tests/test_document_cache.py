@@ -0,0 +1,129 @@
+from unittest import mock
+
+import graphene
+from graphql import get_default_backend
+
+from ...document_cache import DocumentCache, document_cache, get_schema_version
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+
+class Query(graphene.ObjectType):
+    name = graphene.String()
+
+    @staticmethod
+    def resolve_name(root, info):
+        return "Saleor"
+
+
+schema = graphene.Schema(query=Query)
+
+
+def test_document_cache_returns_cached_document():
+    cache = DocumentCache(maxsize=10)
+    backend = get_default_backend()
+
+    document, errors = cache.get_document(backend, schema, "{ name }")
+    cached_document, cached_errors = cache.get_document(backend, schema, "{ name }")
+
+    assert cached_document is document
+    assert errors == cached_errors == []
+    assert cache.get_stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 10}
+
+
+def test_document_cache_executes_without_validation():
+    cache = DocumentCache(maxsize=10)
+    document, _ = cache.get_document(get_default_backend(), schema, "{ name }")
+
+    with mock.patch("graphql.backend.core.validate") as mocked_validate:
+        result = document.execute()
+
+    mocked_validate.assert_not_called()
+    assert result.data == {"name": "Saleor"}
+
+
+def test_document_cache_stores_validation_errors():
+    cache = DocumentCache(maxsize=10)
+    backend = get_default_backend()
+
+    _, errors = cache.get_document(backend, schema, "{ invalid }")
+    _, cached_errors = cache.get_document(backend, schema, "{ invalid }")
+
+    assert len(errors) == 1
+    assert cached_errors is errors
+    assert cache.hits == 1
+
+
+def test_document_cache_evicts_least_recently_used():
+    cache = DocumentCache(maxsize=2)
+    backend = get_default_backend()
+
+    cache.get_document(backend, schema, "{ name }")
+    cache.get_document(backend, schema, "query A { name }")
+    cache.get_document(backend, schema, "{ name }")
+    cache.get_document(backend, schema, "query B { name }")
+    cache.get_document(backend, schema, "{ name }")
+    cache.get_document(backend, schema, "query A { name }")
+
+    assert cache.hits == 2
+    assert cache.misses == 4
+    assert cache.get_stats()["size"] == 2
+
+
+def test_document_cache_disabled():
+    cache = DocumentCache(maxsize=0)
+    backend = get_default_backend()
+
+    first, _ = cache.get_document(backend, schema, "{ name }")
+    second, _ = cache.get_document(backend, schema, "{ name }")
+
+    assert first is not second
+    assert cache.get_stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 0}
+
+
+def test_document_cache_is_keyed_by_schema_version():
+    class OtherQuery(graphene.ObjectType):
+        name = graphene.Int()
+
+    other_schema = graphene.Schema(query=OtherQuery)
+    cache = DocumentCache(maxsize=10)
+    backend = get_default_backend()
+
+    cache.get_document(backend, schema, "{ name }")
+    cache.get_document(backend, other_schema, "{ name }")
+
+    assert get_schema_version(schema) != get_schema_version(other_schema)
+    assert cache.misses == 2
+
+
+def test_document_cache_size_setting(settings):
+    settings.GRAPHQL_QUERY_DOCUMENT_CACHE_SIZE = 1
+    cache = DocumentCache()
+    backend = get_default_backend()
+
+    cache.get_document(backend, schema, "{ name }")
+    cache.get_document(backend, schema, "query A { name }")
+
+    assert cache.get_stats()["size"] == 1
+
+
+def test_graphql_view_uses_document_cache(api_client):
+    query = "{ shop { name } }"
+
+    get_graphql_content(api_client.post_graphql(query))
+    get_graphql_content(api_client.post_graphql(query))
+
+    assert document_cache.hits == 1
+    assert document_cache.misses == 1
+
+
+def test_graphql_view_cached_invalid_query(api_client):
+    query = "{ shop { invalid } }"
+
+    first_response = api_client.post_graphql(query)
+    second_response = api_client.post_graphql(query)
+
+    assert first_response.status_code == second_response.status_code == 400
+    assert get_graphql_content_from_response(
+        first_response
+    ) == get_graphql_content_from_response(second_response)
+    assert document_cache.hits == 1
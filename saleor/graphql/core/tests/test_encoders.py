@@ -0,0 +1,64 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from prices import Money
+
+from ...encoders import encode_json, encode_orjson, get_response_encoder
+
+DATA = {
+    "amount": Decimal("10.50"),
+    "price": Money("12.34", "USD"),
+    "id": uuid.UUID("6f9a1d6e-4a7f-4f1b-8f3a-8c6d3d3f2b1a"),
+    "createdAt": datetime.datetime(2020, 1, 1, 12, tzinfo=datetime.timezone.utc),
+    "date": datetime.date(2020, 1, 1),
+    "text": "Zażółć",
+}
+
+EXPECTED = {
+    "amount": 10.5,
+    "price": {"currency": "USD", "amount": 12.34},
+    "id": "6f9a1d6e-4a7f-4f1b-8f3a-8c6d3d3f2b1a",
+    "createdAt": "2020-01-01T12:00:00+00:00",
+    "date": "2020-01-01",
+    "text": "Zażółć",
+}
+
+
+def test_encode_json():
+    assert json.loads(encode_json(DATA)) == EXPECTED
+
+
+def test_encode_orjson():
+    pytest.importorskip("orjson")
+    assert json.loads(encode_orjson(DATA)) == EXPECTED
+
+
+def test_encode_orjson_not_installed():
+    with mock.patch("saleor.graphql.encoders.orjson", None):
+        with pytest.raises(ImproperlyConfigured):
+            encode_orjson(DATA)
+
+
+def test_get_response_encoder():
+    encoder = get_response_encoder("saleor.graphql.encoders.encode_json")
+    assert encoder is encode_json
+
+
+def test_view_uses_response_encoder_setting(api_client, settings):
+    settings.GRAPHQL_RESPONSE_ENCODER = "saleor.graphql.encoders.encode_json"
+    with mock.patch(
+        "saleor.graphql.encoders.encode_json", return_value=b'{"data": {}}'
+    ) as mocked_encoder:
+        get_response_encoder.cache_clear()
+        response = api_client.post({"query": "{ __typename }"})
+    get_response_encoder.cache_clear()
+
+    mocked_encoder.assert_called_once()
+    assert mocked_encoder.call_args[0][0]["data"] == {"__typename": "Query"}
+    assert response["Content-Type"] == "application/json"
+    assert response.content == b'{"data": {}}'
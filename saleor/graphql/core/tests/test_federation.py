@@ -1,6 +1,7 @@
 import graphene
 import pytest
 
+from ...product.types import Product
 from ...tests.utils import get_graphql_content
 
 
@@ -48,3 +49,8 @@ def test_get_user_data_through_federated_query_by_email(
     assert len(content) == 1
     assert content[0]["id"] == graphene.Node.to_global_id("User", staff_user.id)
     assert content[0]["isStaff"] == staff_user.is_staff
+
+
+def test_channel_context_type_is_not_type_of_other_roots(staff_user):
+    # Types of federation entities are checked in the order of their imports
+    assert not Product.is_type_of(staff_user, None)
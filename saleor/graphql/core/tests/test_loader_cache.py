@@ -0,0 +1,146 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+
+from ....tests.utils import flush_post_commit_hooks
+from ...attribute.dataloaders import AttributeValuesByAttributeIdLoader
+from ...channel.dataloaders import ChannelBySlugLoader
+from ...loader_cache import (
+    LoaderCache,
+    connect_invalidation_signals,
+    get_loader_cache_key,
+    loader_cache,
+)
+from ..utils.reordering import perform_reordering
+
+
+@pytest.fixture
+def enabled_loader_cache(settings):
+    settings.GRAPHQL_LOADER_CACHE_ENABLED = True
+    connect_invalidation_signals()
+    cache.clear()
+    loader_cache.clear()
+    yield loader_cache
+    loader_cache.clear()
+
+
+def load_channel(rf, slug):
+    request = rf.get("/")
+    request.user = None
+    return ChannelBySlugLoader(request).load(slug).get()
+
+
+def test_loader_cache_shared_across_requests(
+    rf, channel_USD, enabled_loader_cache, django_assert_num_queries
+):
+    with django_assert_num_queries(1):
+        assert load_channel(rf, channel_USD.slug) == channel_USD
+
+    with django_assert_num_queries(0):
+        cached_channel = load_channel(rf, channel_USD.slug)
+
+    assert cached_channel == channel_USD
+    assert cached_channel is not channel_USD
+    assert enabled_loader_cache.get_stats()["hits"] == 1
+
+
+def test_loader_cache_invalidated_on_save(rf, channel_USD, enabled_loader_cache):
+    load_channel(rf, channel_USD.slug)
+
+    channel_USD.name = "New name"
+    channel_USD.save(update_fields=["name"])
+    flush_post_commit_hooks()
+
+    assert load_channel(rf, channel_USD.slug).name == "New name"
+
+
+def test_loader_cache_invalidated_after_commit(rf, channel_USD, enabled_loader_cache):
+    old_name = channel_USD.name
+    load_channel(rf, channel_USD.slug)
+
+    channel_USD.name = "New name"
+    channel_USD.save(update_fields=["name"])
+
+    # Until the transaction is committed, the cached entry stays valid
+    assert load_channel(rf, channel_USD.slug).name == old_name
+    flush_post_commit_hooks()
+    assert load_channel(rf, channel_USD.slug).name == "New name"
+
+
+def test_loader_cache_invalidated_after_reordering(
+    rf, color_attribute, enabled_loader_cache
+):
+    def load_value_slugs():
+        request = rf.get("/")
+        request.user = None
+        values = AttributeValuesByAttributeIdLoader(request).load(color_attribute.pk)
+        return [value.slug for value in values.get()]
+
+    assert load_value_slugs() == ["red", "blue"]
+    red = color_attribute.values.get(slug="red")
+
+    with transaction.atomic():
+        perform_reordering(color_attribute.values.all(), {red.pk: +1})
+    flush_post_commit_hooks()
+
+    assert load_value_slugs() == ["blue", "red"]
+
+
+def test_loader_cache_not_invalidated_when_disabled(channel_USD, settings):
+    settings.GRAPHQL_LOADER_CACHE_ENABLED = False
+
+    with mock.patch(
+        "saleor.graphql.loader_cache.bump_model_version"
+    ) as mocked_bump_model_version:
+        channel_USD.save(update_fields=["name"])
+        flush_post_commit_hooks()
+
+    mocked_bump_model_version.assert_not_called()
+
+
+def test_loader_cache_key_hashes_loader_key():
+    key = get_loader_cache_key("channel_by_slug", "version", "a b" * 100)
+
+    assert len(key) < 250
+    assert " " not in key
+    assert key != get_loader_cache_key("channel_by_slug", "version", "a b")
+
+
+def test_loader_cache_reads_other_workers_entries(
+    rf, channel_USD, enabled_loader_cache, django_assert_num_queries
+):
+    load_channel(rf, channel_USD.slug)
+    # Entries stored by another process are only available in the Django cache
+    enabled_loader_cache.clear()
+
+    with django_assert_num_queries(0):
+        assert load_channel(rf, channel_USD.slug) == channel_USD
+
+
+def test_loader_cache_does_not_cache_missing_values(rf, enabled_loader_cache):
+    assert load_channel(rf, "missing") is None
+
+    with mock.patch.object(enabled_loader_cache, "set_many") as mocked_set_many:
+        load_channel(rf, "missing")
+
+    mocked_set_many.assert_called_once_with({})
+
+
+def test_loader_cache_disabled(rf, channel_USD, settings, django_assert_num_queries):
+    settings.GRAPHQL_LOADER_CACHE_ENABLED = False
+    load_channel(rf, channel_USD.slug)
+
+    with django_assert_num_queries(1):
+        load_channel(rf, channel_USD.slug)
+
+
+def test_loader_cache_evicts_least_recently_used_entries():
+    cache_with_limit = LoaderCache(maxsize=2)
+
+    cache_with_limit._set_local({"a": 1, "b": 2})
+    cache_with_limit.get_many({"a": "a"})
+    cache_with_limit._set_local({"c": 3})
+
+    assert list(cache_with_limit._entries) == ["a", "c"]
@@ -1,17 +1,92 @@
 from unittest.mock import Mock
 
+import pytest
 from django.urls import reverse
+from graphql.language.parser import parse
 
-from ...middleware import app_middleware
+from ....core.exceptions import ReadOnlyException
+from ...middleware import authenticate_app, check_read_only
+from ...tests.utils import get_graphql_content
 
 
-def test_app_middleware_accepts_api_requests(app, rf):
+def test_authenticate_app_accepts_api_requests(app, rf):
 
     # Retrieve sample request object
     request = rf.get(reverse("api"))
     token = app.tokens.first().auth_token
     request.META = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
 
-    app_middleware(lambda root, info: info.context, Mock(), Mock(context=request))
+    authenticate_app(request, None)
 
     assert request.app == app
+
+
+def get_operation(query):
+    return parse(query).definitions[0]
+
+
+def test_check_read_only_blocks_mutations(rf, settings):
+    settings.ROOT_EMAIL = None
+    request = rf.post(reverse("api"))
+    request.user = Mock(is_anonymous=True)
+    operation = get_operation("mutation { productDelete(id: 1) { errors { field } } }")
+
+    with pytest.raises(ReadOnlyException):
+        check_read_only(request, operation)
+
+
+def test_check_read_only_allows_queries_and_checkout_mutations(rf):
+    request = rf.post(reverse("api"))
+    request.user = Mock(is_anonymous=True)
+
+    check_read_only(request, get_operation("{ shop { name } }"))
+    check_read_only(
+        request, get_operation('mutation { tokenCreate(email: "", password: "") }')
+    )
+
+
+def test_check_read_only_bypassed_for_root_user(rf, staff_user, settings):
+    settings.ROOT_EMAIL = staff_user.email
+    request = rf.post(reverse("api"))
+    request.user = staff_user
+    operation = get_operation("mutation { productDelete(id: 1) { errors { field } } }")
+
+    check_read_only(request, operation)
+
+
+QUERY_SHOP = """
+    query {
+        shop {
+            name
+        }
+    }
+"""
+
+
+def test_operation_middleware_runs_once_per_operation(api_client, settings):
+    hook = Mock()
+    settings.GRAPHQL_OPERATION_MIDDLEWARE = [
+        *settings.GRAPHQL_OPERATION_MIDDLEWARE,
+        hook,
+    ]
+
+    response = api_client.post_graphql(QUERY_SHOP)
+
+    get_graphql_content(response)
+    hook.assert_called_once()
+    request, operation = hook.call_args[0]
+    assert operation.operation == "query"
+    assert request.user.is_anonymous
+
+
+def test_operation_middleware_error_returned(api_client, settings):
+    def reject(request, operation):
+        raise ReadOnlyException("Read only")
+
+    settings.GRAPHQL_OPERATION_MIDDLEWARE = [reject]
+
+    response = api_client.post_graphql(QUERY_SHOP)
+
+    content = response.json()
+    assert content["errors"][0]["message"] == "Read only"
+    assert content["data"] is None
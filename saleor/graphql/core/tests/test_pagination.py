@@ -3,8 +3,13 @@ import math
 import graphene
 import pytest
 
+from ....order.models import Order
 from ....tests.models import Book
-from ..connection import CountableDjangoObjectType
+from ..connection import (
+    CountableDjangoObjectType,
+    _prepare_row_value_filter,
+    connection_from_queryset_slice,
+)
 from ..fields import FilterInputConnectionField
 
 
@@ -218,3 +223,43 @@ def test_pagination_backward_last_page_info(books):
     page_info = content["books"]["pageInfo"]
     assert page_info["hasNextPage"]
     assert page_info["hasPreviousPage"] is False
+
+
+@pytest.mark.parametrize("page_size", [1, 5, 8, 50])
+@pytest.mark.parametrize("direction", ["", "-"])
+def test_pagination_with_row_value_cursor(page_size, direction, books):
+    Book.objects.bulk_create([Book(name=book.name) for book in books[:10]])
+    qs = Book.objects.order_by(f"{direction}name", f"{direction}pk")
+    sort_by = {"field": ["name", "pk"], "direction": direction}
+    connection_type = BookType._meta.connection
+    end_cursor = None
+    has_next_page = True
+    names = []
+    while has_next_page:
+        args = {"first": page_size, "after": end_cursor, "sort_by": sort_by}
+        connection = connection_from_queryset_slice(
+            qs, args, connection_type=connection_type, edge_type=connection_type.Edge
+        )
+        names.extend(edge.node.name for edge in connection.edges)
+        has_next_page = connection.page_info.hasNextPage
+        end_cursor = connection.page_info.endCursor
+    assert names == list(qs.values_list("name", flat=True))
+
+
+def test_prepare_row_value_filter():
+    row_value_filter = _prepare_row_value_filter(
+        ["Book1", "1"], ["name", "pk"], "lt", Book
+    )
+    sql = str(Book.objects.filter(row_value_filter).query)
+    assert '("tests_book"."name", "tests_book"."id") < (Book1, 1)' in sql
+
+
+def test_prepare_row_value_filter_not_used_for_nullable_fields():
+    cursor = ["Doe", "John", "1"]
+    sorting_fields = ["billing_address__last_name", "billing_address__first_name", "pk"]
+    assert _prepare_row_value_filter(cursor, sorting_fields, "gt", Order) is None
+
+
+def test_prepare_row_value_filter_not_used_for_null_cursor():
+    cursor = [None, "1"]
+    assert _prepare_row_value_filter(cursor, ["name", "pk"], "gt", Book) is None
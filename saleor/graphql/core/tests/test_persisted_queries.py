@@ -0,0 +1,153 @@
+import hashlib
+import json
+
+import pytest
+from django.core.cache import cache
+
+from ...persisted_queries import PERSISTED_QUERY_CACHE_KEY
+from ...tests.fixtures import API_PATH
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_SHOP_NAME = "{ shop { name } }"
+QUERY_SHOP_NAME_HASH = hashlib.sha256(QUERY_SHOP_NAME.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture(autouse=True)
+def persisted_queries_enabled(settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = True
+
+
+def get_persisted_query_extensions(query_hash, version=1):
+    return {"persistedQuery": {"version": version, "sha256Hash": query_hash}}
+
+
+def test_persisted_query_not_found(api_client, site_settings):
+    cache.clear()
+    data = {"extensions": get_persisted_query_extensions(QUERY_SHOP_NAME_HASH)}
+
+    response = api_client.post(data)
+
+    assert response.status_code == 200
+    content = get_graphql_content_from_response(response)
+    error = content["errors"][0]
+    assert error["message"] == "PersistedQueryNotFound"
+    assert error["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+
+def test_persisted_query_registered_and_used(api_client, site_settings):
+    cache.clear()
+    extensions = get_persisted_query_extensions(QUERY_SHOP_NAME_HASH)
+
+    response = api_client.post({"query": QUERY_SHOP_NAME, "extensions": extensions})
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+    assert cache.get(PERSISTED_QUERY_CACHE_KEY.format(QUERY_SHOP_NAME_HASH)) == (
+        QUERY_SHOP_NAME
+    )
+
+    response = api_client.post({"extensions": extensions})
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_persisted_query_hash_mismatch(api_client):
+    extensions = get_persisted_query_extensions("invalid-hash")
+
+    response = api_client.post({"query": QUERY_SHOP_NAME, "extensions": extensions})
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Provided sha256Hash does not match the query."
+    )
+
+
+def test_persisted_query_too_long(api_client, settings):
+    cache.clear()
+    settings.GRAPHQL_PERSISTED_QUERY_MAX_LENGTH = len(QUERY_SHOP_NAME) - 1
+    extensions = get_persisted_query_extensions(QUERY_SHOP_NAME_HASH)
+
+    response = api_client.post({"query": QUERY_SHOP_NAME, "extensions": extensions})
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "The query is too long to be persisted."
+    assert cache.get(PERSISTED_QUERY_CACHE_KEY.format(QUERY_SHOP_NAME_HASH)) is None
+
+
+def test_persisted_query_unsupported_version(api_client):
+    extensions = get_persisted_query_extensions(QUERY_SHOP_NAME_HASH, version=2)
+
+    response = api_client.post({"query": QUERY_SHOP_NAME, "extensions": extensions})
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Unsupported persisted query version: 2."
+
+
+def test_persisted_queries_disabled(api_client, settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    extensions = get_persisted_query_extensions(QUERY_SHOP_NAME_HASH)
+
+    response = api_client.post({"query": QUERY_SHOP_NAME, "extensions": extensions})
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "PersistedQueryNotSupported"
+
+
+def test_persisted_query_get_request(client, site_settings):
+    cache.set(PERSISTED_QUERY_CACHE_KEY.format(QUERY_SHOP_NAME_HASH), QUERY_SHOP_NAME)
+    params = {
+        "extensions": json.dumps(get_persisted_query_extensions(QUERY_SHOP_NAME_HASH))
+    }
+
+    response = client.get(API_PATH, params)
+
+    content = get_graphql_content(response)
+    assert content["data"]["shop"]["name"] == site_settings.site.name
+
+
+def test_get_request_query_not_executed_when_disabled(client, settings):
+    settings.GRAPHQL_PERSISTED_QUERIES_ENABLED = False
+    settings.PLAYGROUND_ENABLED = False
+
+    response = client.get(API_PATH, {"query": QUERY_SHOP_NAME})
+
+    assert response.status_code == 405
+
+
+def test_get_request_with_query_and_variables(client, product, channel_USD):
+    query = """
+        query GetProduct($slug: String!, $channel: String) {
+            product(slug: $slug, channel: $channel) {
+                name
+            }
+        }
+    """
+    params = {
+        "query": query,
+        "variables": json.dumps({"slug": product.slug, "channel": channel_USD.slug}),
+    }
+
+    response = client.get(API_PATH, params)
+
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == product.name
+
+
+def test_get_request_mutation_not_allowed(client):
+    query = """
+        mutation {
+            tokenVerify(token: "token") {
+                isValid
+            }
+        }
+    """
+
+    response = client.get(API_PATH, {"query": query})
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "Can only perform a query operation from a GET request."
+    )
@@ -0,0 +1,105 @@
+import logging
+
+import pytest
+
+from ....product.models import Product
+from ...query_budget import get_field_path, get_sql_shape, record_queries, resolving
+from ...tests.utils import assert_query_budget, get_graphql_content
+
+QUERY_PRODUCTS = """
+    query($channel: String) {
+        products(first: 10, channel: $channel) {
+            edges {
+                node {
+                    name
+                    category {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_get_sql_shape_collapses_placeholder_lists():
+    sql = 'SELECT * FROM "product" WHERE "id" IN (%s, %s, %s) AND "slug" = %s'
+    assert get_sql_shape(sql) == (
+        'SELECT * FROM "product" WHERE "id" IN (%s, ...) AND "slug" = %s'
+    )
+
+
+def test_get_field_path_skips_list_indexes():
+    path = ["products", "edges", 0, "node", "category"]
+    assert get_field_path(path) == "products.edges.node.category"
+
+
+def test_query_log_detects_repeated_queries(product_list):
+    with record_queries() as query_log:
+        for product in product_list:
+            with resolving("products.edges.node.isAvailable"):
+                Product.objects.get(pk=product.pk)
+        Product.objects.first()
+
+    assert query_log.count == len(product_list) + 1
+    repeated = query_log.get_repeated_queries(max_repeats=1)
+    assert len(repeated) == 1
+    assert repeated[0].path == "products.edges.node.isAvailable"
+    assert repeated[0].count == len(product_list)
+
+
+def test_query_log_problems(product_list):
+    with record_queries() as query_log:
+        for product in product_list:
+            with resolving("product"):
+                Product.objects.get(pk=product.pk)
+
+    assert query_log.get_problems(max_queries=None, max_repeats=None) == []
+    problems = query_log.get_problems(max_queries=1, max_repeats=1)
+    assert problems[0] == f"Executed {len(product_list)} queries, the budget is 1."
+    assert problems[1].startswith(
+        f"Query repeated {len(product_list)} times by product:"
+    )
+
+
+def test_assert_query_budget_fails_when_exceeded(product_list):
+    with pytest.raises(AssertionError):
+        with assert_query_budget(1):
+            list(Product.objects.all())
+            list(Product.objects.all())
+
+
+def test_query_budget_attributes_queries_to_resolvers(
+    api_client, product_list, channel_USD
+):
+    with assert_query_budget(10) as query_log:
+        get_graphql_content(
+            api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+        )
+
+    paths = {path for path, _sql in query_log.queries}
+    assert "products" in paths
+    assert "CategoryByIdLoader" in paths
+
+
+def test_view_logs_operation_over_query_budget(
+    api_client, product_list, channel_USD, settings, caplog
+):
+    settings.GRAPHQL_QUERY_BUDGET = 1
+    caplog.set_level(logging.WARNING, logger="saleor.graphql.query_budget")
+
+    api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    assert "exceeds the query budget" in caplog.text
+
+
+def test_view_does_not_log_operation_within_query_budget(
+    api_client, product_list, channel_USD, settings, caplog
+):
+    settings.GRAPHQL_QUERY_BUDGET = 100
+    settings.GRAPHQL_QUERY_MAX_REPEATS = 10
+    caplog.set_level(logging.WARNING, logger="saleor.graphql.query_budget")
+
+    api_client.post_graphql(QUERY_PRODUCTS, {"channel": channel_USD.slug})
+
+    assert "exceeds the query budget" not in caplog.text
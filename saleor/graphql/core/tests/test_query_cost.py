@@ -0,0 +1,210 @@
+import pytest
+from freezegun import freeze_time
+from graphql import parse
+
+from ....core.jwt import create_access_token
+from ...query_cost import QueryCost, calculate_query_cost
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_PRODUCTS_WITH_VARIANTS = """
+    query Products($first: Int, $channel: String) {
+        products(first: $first, channel: $channel) {
+            edges {
+                node {
+                    name
+                    variants {
+                        ...VariantFragment
+                    }
+                }
+            }
+        }
+    }
+
+    fragment VariantFragment on ProductVariant {
+        name
+        ... on ProductVariant {
+            sku
+        }
+    }
+"""
+
+
+def test_calculate_query_cost_without_connections():
+    document = parse("{ shop { name domain { host } } }")
+
+    assert calculate_query_cost(document) == QueryCost(cost=4, depth=3)
+
+
+def test_calculate_query_cost_multiplies_connection_children():
+    document = parse("{ products(first: 10) { edges { node { name } } } }")
+
+    assert calculate_query_cost(document) == QueryCost(cost=31, depth=4)
+
+
+def test_calculate_query_cost_nested_connections():
+    document = parse(
+        """
+        {
+            categories(first: 10) {
+                edges {
+                    node {
+                        products(last: 5) {
+                            edges { node { name } }
+                        }
+                    }
+                }
+            }
+        }
+        """
+    )
+
+    # 1 + 10 (edges) + 10 (node) + 10 (products) + 3 * 50
+    assert calculate_query_cost(document) == QueryCost(cost=181, depth=7)
+
+
+@pytest.mark.parametrize("first, expected_cost", [(10, 61), (None, 601)])
+def test_calculate_query_cost_with_variables_and_fragments(first, expected_cost):
+    document = parse(QUERY_PRODUCTS_WITH_VARIANTS)
+
+    query_cost = calculate_query_cost(document, "Products", {"first": first})
+
+    assert query_cost == QueryCost(cost=expected_cost, depth=5)
+
+
+def test_calculate_query_cost_uses_variable_default_value():
+    document = parse(
+        """
+        query Products($first: Int = 20) {
+            products(first: $first) { edges { node { name } } }
+        }
+        """
+    )
+
+    assert calculate_query_cost(document).cost == 61
+
+
+def test_calculate_query_cost_ignores_introspection():
+    document = parse("{ __schema { types { name fields { name } } } }")
+
+    assert calculate_query_cost(document) == QueryCost(cost=0, depth=0)
+
+
+def test_query_cost_returned_in_extensions(api_client, product, channel_USD):
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    response = api_client.post_graphql(QUERY_PRODUCTS_WITH_VARIANTS, variables)
+
+    content = get_graphql_content(response)
+    assert content["extensions"]["cost"] == {"requestedQueryCost": 61, "depth": 5}
+
+
+def test_query_exceeding_max_cost_is_rejected(api_client, settings, channel_USD):
+    settings.GRAPHQL_QUERY_MAX_COST = 50
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    response = api_client.post_graphql(QUERY_PRODUCTS_WITH_VARIANTS, variables)
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "The query exceeds the maximum cost of 50 (requested: 61)."
+    )
+    assert content["extensions"]["cost"]["requestedQueryCost"] == 61
+    assert "data" not in content
+
+
+def test_query_exceeding_max_depth_is_rejected(api_client, settings, channel_USD):
+    settings.GRAPHQL_QUERY_MAX_DEPTH = 4
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    response = api_client.post_graphql(QUERY_PRODUCTS_WITH_VARIANTS, variables)
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "The query exceeds the maximum depth of 4 (requested: 5)."
+    )
+
+
+def test_staff_user_max_query_cost(
+    staff_api_client, settings, product, channel_USD, permission_manage_products
+):
+    settings.GRAPHQL_QUERY_MAX_COST = 50
+    settings.GRAPHQL_QUERY_MAX_COST_STAFF = 100
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS_WITH_VARIANTS,
+        variables,
+        permissions=[permission_manage_products],
+        check_no_permissions=False,
+    )
+
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["edges"]
+
+
+def test_app_max_query_cost(app_api_client, settings, channel_USD):
+    settings.GRAPHQL_QUERY_MAX_COST = 50
+    settings.GRAPHQL_QUERY_MAX_COST_APP = 60
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    response = app_api_client.post_graphql(QUERY_PRODUCTS_WITH_VARIANTS, variables)
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "The query exceeds the maximum cost of 60 (requested: 61)."
+    )
+
+
+def test_app_max_query_cost_lower_than_default(app_api_client, settings, channel_USD):
+    settings.GRAPHQL_QUERY_MAX_COST = 100
+    settings.GRAPHQL_QUERY_MAX_COST_APP = 60
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    response = app_api_client.post_graphql(QUERY_PRODUCTS_WITH_VARIANTS, variables)
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "The query exceeds the maximum cost of 60 (requested: 61)."
+    )
+
+
+@pytest.mark.parametrize(
+    "client_fixture", ["staff_api_client", "app_api_client", "api_client"]
+)
+def test_requestor_without_own_limit_gets_default_max_query_cost(
+    client_fixture, request, settings, channel_USD
+):
+    settings.GRAPHQL_QUERY_MAX_COST = 50
+    client = request.getfixturevalue(client_fixture)
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    response = client.post_graphql(QUERY_PRODUCTS_WITH_VARIANTS, variables)
+
+    assert response.status_code == 400
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == (
+        "The query exceeds the maximum cost of 50 (requested: 61)."
+    )
+
+
+def test_query_exceeding_max_cost_with_expired_token(
+    api_client, customer_user, settings, channel_USD
+):
+    settings.GRAPHQL_QUERY_MAX_COST = 50
+    with freeze_time("2018-05-31 12:00:01"):
+        token = create_access_token(customer_user)
+    variables = {"first": 10, "channel": channel_USD.slug}
+
+    response = api_client.post_graphql(
+        QUERY_PRODUCTS_WITH_VARIANTS, variables, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Signature has expired"
+    assert content["errors"][0]["extensions"]["exception"]["code"] == (
+        "ExpiredSignatureError"
+    )
@@ -0,0 +1,140 @@
+from unittest import mock
+
+from freezegun import freeze_time
+
+from ....core.jwt import create_access_token
+from ...resolver_tracing import ResolverTracer, get_current_tracer, trace_resolvers
+from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_PRODUCTS = """
+    query($channel: String) {
+        products(first: 2, channel: $channel) {
+            edges {
+                node {
+                    name
+                    category {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_tracing_returned_for_staff_with_permission(
+    staff_api_client, permission_manage_settings, product, channel_USD
+):
+    staff_api_client.user.user_permissions.add(permission_manage_settings)
+
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS,
+        {"channel": channel_USD.slug},
+        HTTP_X_SALEOR_RESOLVER_TIMINGS="1",
+    )
+
+    content = get_graphql_content(response)
+    tracing = content["extensions"]["tracing"]
+    assert tracing["version"] == 1
+    assert tracing["duration"] > 0
+    paths = [resolver["path"] for resolver in tracing["execution"]["resolvers"]]
+    assert ["products"] in paths
+    assert ["products", "edges", 0, "node", "category"] in paths
+    resolver = tracing["execution"]["resolvers"][paths.index(["products"])]
+    assert resolver["parentType"] == "Query"
+    assert resolver["fieldName"] == "products"
+    assert resolver["duration"] >= 0
+    assert "CategoryByIdLoader" in [loader["name"] for loader in tracing["dataloaders"]]
+
+
+def test_tracing_not_returned_without_permission(
+    staff_api_client, product, channel_USD
+):
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS,
+        {"channel": channel_USD.slug},
+        HTTP_X_SALEOR_RESOLVER_TIMINGS="1",
+    )
+
+    content = get_graphql_content(response)
+    assert "tracing" not in content["extensions"]
+
+
+def test_tracing_not_returned_without_header(
+    staff_api_client, permission_manage_settings, product, channel_USD
+):
+    staff_api_client.user.user_permissions.add(permission_manage_settings)
+
+    response = staff_api_client.post_graphql(
+        QUERY_PRODUCTS, {"channel": channel_USD.slug}
+    )
+
+    content = get_graphql_content(response)
+    assert "tracing" not in content["extensions"]
+
+
+def test_tracing_returned_for_app_with_permission(
+    app_api_client, permission_manage_settings, product, channel_USD
+):
+    app_api_client.app.permissions.add(permission_manage_settings)
+
+    response = app_api_client.post_graphql(
+        QUERY_PRODUCTS,
+        {"channel": channel_USD.slug},
+        HTTP_X_SALEOR_RESOLVER_TIMINGS="true",
+    )
+
+    content = get_graphql_content(response)
+    assert content["extensions"]["tracing"]["execution"]["resolvers"]
+
+
+def test_tracing_not_returned_with_expired_token(
+    api_client, staff_user, permission_manage_settings, product, channel_USD
+):
+    staff_user.user_permissions.add(permission_manage_settings)
+    with freeze_time("2018-05-31 12:00:01"):
+        token = create_access_token(staff_user)
+
+    response = api_client.post_graphql(
+        QUERY_PRODUCTS,
+        {"channel": channel_USD.slug},
+        HTTP_AUTHORIZATION=f"JWT {token}",
+        HTTP_X_SALEOR_RESOLVER_TIMINGS="1",
+    )
+
+    assert response.status_code == 200
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"] == "Signature has expired"
+    assert "tracing" not in content["extensions"]
+
+
+def test_trace_resolvers_restores_previous_tracer():
+    tracer = ResolverTracer()
+
+    with trace_resolvers(tracer):
+        assert get_current_tracer() is tracer
+        with trace_resolvers(None):
+            assert get_current_tracer() is None
+        assert get_current_tracer() is tracer
+
+    assert get_current_tracer() is None
+
+
+def test_resolver_tracer_result():
+    tracer = ResolverTracer()
+    info = mock.Mock(
+        path=["shop", "name"],
+        parent_type="Shop",
+        field_name="name",
+        return_type="String!",
+    )
+
+    tracer.add_resolver(info, tracer.get_offset())
+    tracer.add_dataloader("ShopLoader", 1, tracer.get_offset())
+    result = tracer.get_result()
+
+    assert result["startTime"].endswith("Z")
+    assert result["execution"]["resolvers"][0]["path"] == ["shop", "name"]
+    assert result["execution"]["resolvers"][0]["returnType"] == "String!"
+    assert result["dataloaders"][0]["name"] == "ShopLoader"
+    assert result["dataloaders"][0]["keys"] == 1
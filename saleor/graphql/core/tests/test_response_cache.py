@@ -0,0 +1,163 @@
+import graphene
+import pytest
+from django.core.cache import cache
+
+from ....tests.utils import flush_post_commit_hooks
+from ...response_cache import connect_invalidation_signals, response_cache
+from ...tests.utils import get_graphql_content
+
+QUERY_PRODUCT = """
+    query GetProduct($id: ID!, $channel: String) {
+        product(id: $id, channel: $channel) {
+            name
+        }
+    }
+"""
+
+QUERY_CHECKOUT = """
+    query GetCheckout($token: UUID!) {
+        checkout(token: $token) {
+            email
+        }
+    }
+"""
+
+
+@pytest.fixture
+def response_cache_enabled(settings):
+    settings.GRAPHQL_RESPONSE_CACHE_ENABLED = True
+    connect_invalidation_signals()
+    cache.clear()
+    response_cache.clear()
+
+
+@pytest.fixture
+def product_variables(product, channel_USD):
+    # Tags of the tables written by the fixtures are replaced after the commit,
+    # which would otherwise invalidate the first response the test caches
+    flush_post_commit_hooks()
+    return {
+        "id": graphene.Node.to_global_id("Product", product.pk),
+        "channel": channel_USD.slug,
+    }
+
+
+def test_anonymous_query_response_cached(
+    response_cache_enabled,
+    api_client,
+    product,
+    product_variables,
+    django_assert_num_queries,
+):
+    response = api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == product.name
+
+    with django_assert_num_queries(0):
+        response = api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == product.name
+    assert content["extensions"]["cost"]["requestedQueryCost"] == 2
+    assert response_cache.get_stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_cached_response_invalidated_on_save(
+    response_cache_enabled, api_client, product, product_variables
+):
+    api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+    flush_post_commit_hooks()
+
+    response = api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+    assert response_cache.get_stats()["hits"] == 0
+
+
+def test_cached_response_invalidated_after_commit(
+    response_cache_enabled, api_client, product, product_variables
+):
+    api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    product.name = "New name"
+    product.save(update_fields=["name"])
+
+    # Until the transaction is committed, other requests see the old rows
+    api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    assert response_cache.get_stats()["hits"] == 1
+
+    # The test client runs the commit hooks after the request
+    response = api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == "New name"
+    assert response_cache.get_stats()["hits"] == 1
+
+
+def test_table_not_invalidated_with_cache_disabled(product):
+    versions = response_cache.get_tag_versions()
+
+    product.save(update_fields=["name"])
+    flush_post_commit_hooks()
+
+    assert response_cache.get_tag_versions() == versions
+
+
+def test_cached_response_invalidated_on_related_model_change(
+    response_cache_enabled, api_client, product, product_variables
+):
+    api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    product.channel_listings.all().delete()
+    flush_post_commit_hooks()
+
+    response = api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    content = get_graphql_content(response)
+    assert content["data"]["product"] is None
+
+
+def test_cache_key_depends_on_variables(
+    response_cache_enabled, api_client, product, product_variables, channel_PLN
+):
+    api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    product_variables["channel"] = channel_PLN.slug
+    response = api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    content = get_graphql_content(response)
+    assert content["data"]["product"] is None
+    assert response_cache.get_stats()["hits"] == 0
+
+
+def test_authenticated_query_response_not_cached(
+    response_cache_enabled, user_api_client, product, product_variables
+):
+    user_api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    user_api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    assert response_cache.get_stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0}
+
+
+def test_response_using_not_cacheable_models_not_cached(
+    response_cache_enabled, api_client, checkout
+):
+    variables = {"token": str(checkout.token)}
+    api_client.post_graphql(QUERY_CHECKOUT, variables)
+    checkout.email = "new@example.com"
+    checkout.save(update_fields=["email"])
+    flush_post_commit_hooks()
+
+    response = api_client.post_graphql(QUERY_CHECKOUT, variables)
+
+    content = get_graphql_content(response)
+    assert content["data"]["checkout"]["email"] == "new@example.com"
+    assert response_cache.get_stats()["hits"] == 0
+
+
+def test_response_cache_disabled(api_client, product, product_variables):
+    response_cache.clear()
+
+    api_client.post_graphql(QUERY_PRODUCT, product_variables)
+    api_client.post_graphql(QUERY_PRODUCT, product_variables)
+
+    assert response_cache.get_stats()["misses"] == 0
@@ -0,0 +1,87 @@
+from unittest import mock
+
+from django.core.cache import cache
+
+from ....product.models import Product
+from ...tests.utils import get_graphql_content
+from ..total_count import (
+    CountStrategy,
+    get_count_cache_key,
+    get_estimated_count,
+    get_total_count,
+)
+
+QUERY_PRODUCTS_COUNT = """
+    query($channel: String) {
+        products(first: 1, channel: $channel) {
+            totalCount
+        }
+    }
+"""
+
+
+def test_get_total_count_exact(product_list, settings):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = CountStrategy.EXACT
+
+    assert get_total_count(Product.objects.all()) == (
+        len(product_list),
+        CountStrategy.EXACT,
+    )
+
+
+def test_get_total_count_cached(product_list, settings):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = CountStrategy.CACHED
+    qs = Product.objects.all()
+    cache.delete(get_count_cache_key(qs))
+
+    assert get_total_count(qs) == (len(product_list), CountStrategy.CACHED)
+    product_list[0].delete()
+    assert get_total_count(qs) == (len(product_list), CountStrategy.CACHED)
+
+
+def test_get_count_cache_key_depends_on_filters():
+    all_products_key = get_count_cache_key(Product.objects.all())
+    filtered_key = get_count_cache_key(Product.objects.filter(name="Test"))
+
+    assert all_products_key != filtered_key
+    assert get_count_cache_key(Product.objects.none()) is None
+
+
+def test_get_total_count_estimate_above_threshold(product_list, settings):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = CountStrategy.ESTIMATE
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 1000
+
+    with mock.patch(
+        "saleor.graphql.core.total_count.get_estimated_count", return_value=5000
+    ):
+        assert get_total_count(Product.objects.all()) == (5000, CountStrategy.ESTIMATE)
+
+
+def test_get_total_count_estimate_below_threshold(product_list, settings):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = CountStrategy.ESTIMATE
+    settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = 1000
+
+    assert get_total_count(Product.objects.all()) == (
+        len(product_list),
+        CountStrategy.EXACT,
+    )
+
+
+def test_get_estimated_count(product_list):
+    assert get_estimated_count(Product.objects.all()) >= 0
+    assert get_estimated_count(Product.objects.none()) == 0
+
+
+def test_total_count_strategy_in_extensions(
+    api_client, product_list, channel_USD, settings
+):
+    settings.GRAPHQL_TOTAL_COUNT_STRATEGY = CountStrategy.CACHED
+    cache.clear()
+
+    response = api_client.post_graphql(
+        QUERY_PRODUCTS_COUNT, {"channel": channel_USD.slug}
+    )
+
+    content = get_graphql_content(response)
+    assert isinstance(content["data"]["products"]["totalCount"], int)
+    assert content["extensions"]["totalCount"] == {"products": CountStrategy.CACHED}
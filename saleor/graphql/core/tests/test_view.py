@@ -1,7 +1,14 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import graphene
 import pytest
+from asgiref.testing import ApplicationCommunicator
+from django.conf.urls import url
+from django.core.handlers.asgi import ASGIHandler
+from django.http import HttpResponse
 from django.test import override_settings
 
 from ....demo.views import EXAMPLE_QUERY
@@ -13,6 +20,7 @@ from ...tests.fixtures import (
     API_PATH,
 )
 from ...tests.utils import get_graphql_content, get_graphql_content_from_response
+from ...views import AsyncGraphQLView, GraphQLView
 
 
 def test_batch_queries(category, product, api_client, channel_USD):
@@ -309,3 +317,257 @@ def test_example_query(api_client, product):
     response = api_client.post_graphql(EXAMPLE_QUERY)
     content = get_graphql_content(response)
     assert content["data"]["products"]["edges"][0]["node"]["name"] == product.name
+
+
+QUERY_VARIANT_PRODUCT_NAME = """
+    query GetVariant($id: ID!, $channel: String) {
+        productVariant(id: $id, channel: $channel) {
+            product {
+                name
+            }
+        }
+    }
+"""
+
+MUTATION_PRODUCT_UPDATE_NAME = """
+    mutation UpdateProduct($id: ID!, $name: String) {
+        productUpdate(id: $id, input: {name: $name}) {
+            product {
+                name
+            }
+        }
+    }
+"""
+
+
+@mock.patch(
+    "saleor.graphql.views.GraphQLView.execute_graphql_request",
+    side_effect=GraphQLView.execute_graphql_request,
+    autospec=True,
+)
+def test_batch_identical_queries_executed_once(
+    mocked_execute, api_client, variant, channel_USD
+):
+    entry = {
+        "query": QUERY_VARIANT_PRODUCT_NAME,
+        "variables": {
+            "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+            "channel": channel_USD.slug,
+        },
+    }
+
+    response = api_client.post([entry, entry])
+
+    batch_content = get_graphql_content(response)
+    assert batch_content[0] == batch_content[1]
+    assert batch_content[0]["data"]["productVariant"]["product"]["name"] == (
+        variant.product.name
+    )
+    assert mocked_execute.call_count == 1
+
+
+def test_batch_dataloaders_dropped_after_mutation(
+    staff_api_client, permission_manage_products, variant, channel_USD
+):
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    product_id = graphene.Node.to_global_id("Product", variant.product_id)
+    query_entry = {
+        "query": QUERY_VARIANT_PRODUCT_NAME,
+        "variables": {
+            "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+            "channel": channel_USD.slug,
+        },
+    }
+    mutation_entry = {
+        "query": MUTATION_PRODUCT_UPDATE_NAME,
+        "variables": {"id": product_id, "name": "New name"},
+    }
+
+    response = staff_api_client.post([query_entry, mutation_entry, query_entry])
+
+    batch_content = get_graphql_content(response)
+    old_name = variant.product.name
+    assert batch_content[0]["data"]["productVariant"]["product"]["name"] == old_name
+    assert batch_content[2]["data"]["productVariant"]["product"]["name"] == (
+        "New name"
+    )
+
+
+def test_batch_queries_executed_concurrently(
+    transactional_db, api_client, settings, category, variant, channel_USD
+):
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 2
+    data = [
+        {
+            "query": "query GetCategory($id: ID!) { category(id: $id) { name } }",
+            "variables": {"id": graphene.Node.to_global_id("Category", category.pk)},
+        },
+        {
+            "query": QUERY_VARIANT_PRODUCT_NAME,
+            "variables": {
+                "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+                "channel": channel_USD.slug,
+            },
+        },
+    ]
+
+    with mock.patch(
+        "saleor.graphql.views.get_batch_executor",
+        return_value=ThreadPoolExecutor(max_workers=2),
+    ) as mocked_get_executor:
+        response = api_client.post(data)
+
+    mocked_get_executor.assert_called_once()
+    batch_content = get_graphql_content(response)
+    assert batch_content[0]["data"]["category"]["name"] == category.name
+    assert batch_content[1]["data"]["productVariant"]["product"]["name"] == (
+        variant.product.name
+    )
+
+
+QUERY_PRODUCT_CATEGORY_NAME = """
+    query GetProduct($id: ID!, $channel: String) {
+        product(id: $id, channel: $channel) {
+            category {
+                name
+            }
+        }
+    }
+"""
+
+
+def test_batch_queries_executed_concurrently_use_own_dataloaders(
+    transactional_db, api_client, settings, product, variant, channel_USD
+):
+    settings.GRAPHQL_BATCH_MAX_WORKERS = 2
+    settings.DEBUG = True
+    data = [
+        {
+            "query": QUERY_VARIANT_PRODUCT_NAME,
+            "variables": {
+                "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+                "channel": channel_USD.slug,
+            },
+        },
+        {
+            "query": QUERY_PRODUCT_CATEGORY_NAME,
+            "variables": {
+                "id": graphene.Node.to_global_id("Product", product.pk),
+                "channel": channel_USD.slug,
+            },
+        },
+    ]
+    # Both entries wait for each other, so they are executed at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    entry_requests = []
+    get_response = GraphQLView.get_response
+
+    def get_response_concurrently(view, request, data):
+        entry_requests.append(request)
+        barrier.wait()
+        return get_response(view, request, data)
+
+    with mock.patch.object(
+        GraphQLView, "get_response", get_response_concurrently
+    ), mock.patch(
+        "saleor.graphql.views.get_batch_executor",
+        return_value=ThreadPoolExecutor(max_workers=2),
+    ):
+        response = api_client.post(data)
+
+    variant_content, product_content = get_graphql_content(response)
+    assert variant_content["data"]["productVariant"]["product"]["name"] == (
+        variant.product.name
+    )
+    assert product_content["data"]["product"]["category"]["name"] == (
+        product.category.name
+    )
+    first_request, second_request = entry_requests
+    assert first_request is not second_request
+    assert first_request.dataloaders is not second_request.dataloaders
+    # Every entry reports only the dataloaders it used
+    variant_loaders = variant_content["extensions"]["dataloaders"]
+    product_loaders = product_content["extensions"]["dataloaders"]
+    assert "ProductByIdLoader" in variant_loaders
+    assert "CategoryByIdLoader" in product_loaders
+    assert "CategoryByIdLoader" not in variant_loaders
+
+
+# URLs of the ASGI tests, which serve the API with the async view
+urlpatterns = [url(r"^graphql/", AsyncGraphQLView.as_view(), name="api")]
+
+
+async def post_asgi(application, path: str, body: bytes) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"content-type", b"application/json"),
+        ],
+        "client": ("127.0.0.1", 0),
+        "server": ("testserver", 80),
+    }
+    communicator = ApplicationCommunicator(application, scope)
+    await communicator.send_input({"type": "http.request", "body": body})
+    response_start = await communicator.receive_output(timeout=10)
+    await communicator.receive_output(timeout=10)
+    return response_start["status"]
+
+
+def test_async_view_requests_overlap_through_asgi_handler(settings):
+    settings.ROOT_URLCONF = __name__
+    # Both requests must be handled at the same time to pass the barrier,
+    # requests handled one after another would fail after the timeout
+    barrier = threading.Barrier(2, timeout=5)
+
+    def handle_query(view, request):
+        barrier.wait()
+        return HttpResponse()
+
+    async def post_concurrently(application):
+        body = b'{"query": "{ __typename }"}'
+        return await asyncio.gather(
+            post_asgi(application, API_PATH, body),
+            post_asgi(application, API_PATH, body),
+        )
+
+    with mock.patch.object(GraphQLView, "handle_query", handle_query), mock.patch(
+        "saleor.graphql.views.get_async_executor",
+        return_value=ThreadPoolExecutor(max_workers=2),
+    ):
+        statuses = asyncio.run(post_concurrently(ASGIHandler()))
+
+    assert statuses == [200, 200]
+
+
+def test_async_view_is_coroutine():
+    view = AsyncGraphQLView.as_view()
+
+    assert asyncio.iscoroutinefunction(view)
+    assert view.view_class is AsyncGraphQLView
+    assert view.csrf_exempt
+
+
+def test_async_view_executes_query_in_thread_pool(rf):
+    view = AsyncGraphQLView.as_view()
+    request = rf.post(
+        API_PATH, {"query": "{ __typename }"}, content_type="application/json"
+    )
+
+    with mock.patch(
+        "saleor.graphql.views.get_async_executor",
+        return_value=ThreadPoolExecutor(max_workers=1),
+    ) as mocked_get_executor:
+        response = asyncio.run(view(request))
+
+    mocked_get_executor.assert_called_once()
+    content = get_graphql_content(response)
+    assert content["data"] == {"__typename": "Query"}
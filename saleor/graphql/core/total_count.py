@@ -0,0 +1,70 @@
+import hashlib
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import QuerySet
+
+TOTAL_COUNT_CACHE_KEY = "graphql_total_count:{}"
+
+
+class CountStrategy:
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+
+
+def get_count_cache_key(qs: QuerySet) -> Optional[str]:
+    try:
+        sql, params = qs.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    query_hash = hashlib.sha256(f"{sql}:{params!r}".encode("utf-8")).hexdigest()
+    return TOTAL_COUNT_CACHE_KEY.format(query_hash)
+
+
+def get_cached_count(qs: QuerySet) -> int:
+    cache_key = get_count_cache_key(qs)
+    if cache_key is None:
+        return 0
+    count = cache.get(cache_key)
+    if count is None:
+        count = qs.count()
+        cache.set(
+            cache_key,
+            count,
+            timeout=settings.GRAPHQL_TOTAL_COUNT_CACHE_TTL.total_seconds(),
+        )
+    return count
+
+
+def get_estimated_count(qs: QuerySet) -> int:
+    """Return the number of rows the query planner expects the queryset to return."""
+    try:
+        sql, params = qs.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_total_count(qs: QuerySet) -> Tuple[int, str]:
+    """Count the items of a connection with the strategy set in the settings.
+
+    Planner estimates are inaccurate for small results, so the exact count is
+    used when the estimate is below `GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD`.
+    Returns the count and the name of the strategy that was used.
+    """
+    qs = qs.order_by()
+    strategy = settings.GRAPHQL_TOTAL_COUNT_STRATEGY
+    if strategy == CountStrategy.CACHED:
+        return get_cached_count(qs), CountStrategy.CACHED
+    if strategy == CountStrategy.ESTIMATE:
+        estimate = get_estimated_count(qs)
+        if estimate >= settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD:
+            return estimate, CountStrategy.ESTIMATE
+    return qs.count(), CountStrategy.EXACT
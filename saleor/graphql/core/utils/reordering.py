@@ -6,6 +6,8 @@ from django.db import transaction
 from django.db.models import F, QuerySet
 from django.utils.functional import cached_property
 
+from ...loader_cache import invalidate_model
+
 __all__ = ["perform_reordering"]
 
 
@@ -140,6 +142,9 @@ class Reordering:
         # Update everything that was changed
         self.qs.model.objects.bulk_update(batch, ["sort_order"])
 
+        # Bulk updates don't send the signals invalidating cached loader values
+        invalidate_model(self.qs.model)
+
     def run(self):
 
         for pk, move in self.operations.items():
@@ -0,0 +1,113 @@
+import threading
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+LoaderStatsHook = Callable[[Dict[str, dict]], None]
+
+
+@dataclass
+class LoaderStats:
+    """Usage of a dataloader during one operation.
+
+    Keys requested again in the same request are served from the loader's own
+    cache; they are counted as duplicates and never reach the batch function.
+    """
+
+    calls: int = 0
+    batches: int = 0
+    keys: int = 0
+    max_batch_size: int = 0
+    time: float = 0.0
+
+    @property
+    def duplicates(self) -> int:
+        return max(self.calls - self.keys, 0)
+
+    def add_batch(self, size: int, duration: float):
+        self.batches += 1
+        self.keys += size
+        self.max_batch_size = max(self.max_batch_size, size)
+        self.time += duration
+
+    def as_dict(self) -> dict:
+        return {
+            **asdict(self),
+            "duplicates": self.duplicates,
+            "cache_hit_ratio": self.duplicates / self.calls if self.calls else 0.0,
+        }
+
+
+def pop_loader_stats(request: "HttpRequest") -> Dict[str, dict]:
+    """Return the stats of the loaders used by the request and reset them.
+
+    Loaders are shared by the entries of a batched request; resetting the stats
+    makes every entry report only its own usage.
+    """
+    stats = {}
+    for loader in getattr(request, "dataloaders", {}).values():
+        if loader.stats.calls or loader.stats.batches:
+            stats[loader.__class__.__name__] = loader.stats.as_dict()
+            loader.stats = LoaderStats()
+    return stats
+
+
+@lru_cache(maxsize=None)
+def get_loader_stats_hook(hook_path: str) -> LoaderStatsHook:
+    return import_string(hook_path)
+
+
+def report_loader_stats(stats: Dict[str, dict]):
+    """Pass the stats of an operation to the `GRAPHQL_DATALOADER_STATS_HOOK`."""
+    hook_path = settings.GRAPHQL_DATALOADER_STATS_HOOK
+    if hook_path and stats:
+        get_loader_stats_hook(hook_path)(stats)
+
+
+class LoaderStatsAggregator:
+    """Process-level totals of the dataloader stats, usable as the stats hook."""
+
+    FIELDS = ("calls", "batches", "keys", "duplicates", "time")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[str, Dict[str, float]] = {}
+
+    def __call__(self, stats: Dict[str, dict]):
+        with self._lock:
+            for name, loader_stats in stats.items():
+                totals = self._totals.setdefault(
+                    name, {field: 0 for field in self.FIELDS + ("max_batch_size",)}
+                )
+                for field in self.FIELDS:
+                    totals[field] += loader_stats[field]
+                totals["max_batch_size"] = max(
+                    totals["max_batch_size"], loader_stats["max_batch_size"]
+                )
+
+    def get_stats(self, name: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            totals = {
+                loader_name: {
+                    **values,
+                    "average_batch_size": (
+                        values["keys"] / values["batches"] if values["batches"] else 0
+                    ),
+                }
+                for loader_name, values in self._totals.items()
+                if name is None or loader_name == name
+            }
+        return totals
+
+    def clear(self):
+        with self._lock:
+            self._totals.clear()
+
+
+aggregate_loader_stats = LoaderStatsAggregator()
@@ -0,0 +1,121 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from graphql import GraphQLDocument
+from graphql.validation import validate
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+CacheEntry = Tuple[GraphQLDocument, List[Exception]]
+
+_schema_versions: "weakref.WeakKeyDictionary[GraphQLSchema, str]" = (
+    weakref.WeakKeyDictionary()
+)
+_schema_versions_lock = threading.Lock()
+
+
+def get_schema_version(schema: "GraphQLSchema") -> str:
+    """Return a fingerprint of the printed schema.
+
+    The fingerprint is computed once per schema instance, documents validated
+    against a different schema never share cache entries.
+    """
+    with _schema_versions_lock:
+        version = _schema_versions.get(schema)
+        if version is None:
+            version = hashlib.sha256(str(schema).encode("utf-8")).hexdigest()
+            _schema_versions[schema] = version
+        return version
+
+
+def get_query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class DocumentCache:
+    """Process-local LRU cache of parsed and validated GraphQL documents.
+
+    The size is read from the `GRAPHQL_QUERY_DOCUMENT_CACHE_SIZE` setting on every
+    write, setting it to 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, str], CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.GRAPHQL_QUERY_DOCUMENT_CACHE_SIZE
+
+    def get_document(self, backend, schema, query: str) -> CacheEntry:
+        """Return a parsed document and its validation errors.
+
+        Documents returned from the cache are already validated, their `execute`
+        skips the validation step. Syntax errors raised by the backend are not
+        cached and are propagated to the caller.
+        """
+        if self.maxsize <= 0:
+            return self._build_entry(backend, schema, query)
+
+        key = (get_schema_version(schema), get_query_hash(query))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = self._build_entry(backend, schema, query)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    @staticmethod
+    def _build_entry(backend, schema, query: str) -> CacheEntry:
+        document = backend.document_from_string(schema, query)
+        errors: List[Exception]
+        try:
+            errors = list(validate(schema, document.document_ast))
+        except Exception as e:
+            # Scalars may raise while parsing literals during validation
+            errors = [e]
+        validated_document = GraphQLDocument(
+            schema=document.schema,
+            document_string=document.document_string,
+            document_ast=document.document_ast,
+            execute=partial(document.execute, validate=False),
+        )
+        return validated_document, errors
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+document_cache = DocumentCache()
@@ -0,0 +1,54 @@
+import datetime
+import decimal
+import json
+import uuid
+from functools import lru_cache
+from typing import Any, Callable
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+from prices import Money
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ResponseEncoder = Callable[[Any], bytes]
+
+_django_encoder = DjangoJSONEncoder()
+
+
+def default(obj):
+    """Serialize values which are not supported by the JSON encoders.
+
+    Decimals and money amounts are returned as floats, the same way the API
+    returns them in the `Decimal` and `Money` types.
+    """
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    if isinstance(obj, Money):
+        return {"currency": obj.currency, "amount": float(obj.amount)}
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    return _django_encoder.default(obj)
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode the response with the standard library encoder."""
+    return json.dumps(data, default=default, separators=(",", ":")).encode("utf-8")
+
+
+def encode_orjson(data: Any) -> bytes:
+    """Encode the response with `orjson` which needs to be installed separately."""
+    if orjson is None:
+        raise ImproperlyConfigured("The orjson package is not installed.")
+    return orjson.dumps(data, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=None)
+def get_response_encoder(encoder_path: str) -> ResponseEncoder:
+    return import_string(encoder_path)
@@ -0,0 +1,200 @@
+import hashlib
+import pickle
+import threading
+import uuid
+from collections import OrderedDict
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Type
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from promise import Promise
+
+if TYPE_CHECKING:
+    from .core.dataloaders import DataLoader
+
+LOADER_CACHE_KEY = "graphql_loader:{}:{}:{}"
+LOADER_VERSION_KEY = "graphql_loader_version:{}"
+
+# Loaders may only share values of these models; saving or deleting their
+# instances invalidates the cached values.
+CACHEABLE_MODELS = (
+    "attribute.Attribute",
+    "attribute.AttributeValue",
+    "channel.Channel",
+    "product.ProductType",
+    "shipping.ShippingMethod",
+)
+
+
+def get_cacheable_models() -> List[Type[Model]]:
+    return [apps.get_model(label) for label in CACHEABLE_MODELS]
+
+
+def get_version_key(model: Type[Model]) -> str:
+    return LOADER_VERSION_KEY.format(model._meta.label_lower)
+
+
+def get_loader_cache_key(context_key: str, version: str, key: Any) -> str:
+    # Keys may come from clients, e.g. channel slugs, so they are hashed to keep
+    # the cache keys short and valid for every cache backend
+    key_hash = hashlib.sha256(str(key).encode("utf-8")).hexdigest()
+    return LOADER_CACHE_KEY.format(context_key, version, key_hash)
+
+
+class LoaderCache:
+    """Cross-request cache of values loaded by dataloaders of rarely changed data.
+
+    Loaders opt in by setting `shared_cache_model`. Values are kept in a
+    process-local LRU and in the Django cache, under keys including the version
+    of the loader's model. Saving or deleting an instance of the model replaces
+    the version, which invalidates the entries of all workers. Local entries are
+    pickled, so requests never share model instances.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.GRAPHQL_LOADER_CACHE_ENABLED
+
+    @property
+    def maxsize(self) -> int:
+        if self._maxsize is not None:
+            return self._maxsize
+        return settings.GRAPHQL_LOADER_CACHE_SIZE
+
+    @staticmethod
+    def get_version(model: Type[Model]) -> str:
+        version_key = get_version_key(model)
+        version = cache.get(version_key)
+        if version is None:
+            cache.add(version_key, uuid.uuid4().hex, timeout=None)
+            version = cache.get(version_key)
+        return version
+
+    def load(self, loader: "DataLoader", keys: Iterable[Any]):
+        """Return values cached for the keys and load the missing ones."""
+        keys = list(keys)
+        version = self.get_version(loader.shared_cache_model)  # type: ignore
+        cache_keys = {
+            key: get_loader_cache_key(loader.context_key, version, key)  # type: ignore
+            for key in keys
+        }
+        cached = self.get_many(cache_keys)
+        missing = [key for key in keys if key not in cached]
+        if not missing:
+            return [cached[key] for key in keys]
+
+        def store(values: List[Any]):
+            loaded = dict(zip(missing, values))
+            self.set_many(
+                {
+                    cache_keys[key]: value
+                    for key, value in loaded.items()
+                    if value is not None
+                }
+            )
+            return [cached[key] if key in cached else loaded[key] for key in keys]
+
+        results = loader.batch_load(missing)
+        if isinstance(results, Promise):
+            return results.then(store)
+        return store(results)
+
+    def get_many(self, cache_keys: Dict[Any, str]) -> Dict[Any, Any]:
+        values = {}
+        remote_keys = {}
+        with self._lock:
+            for key, cache_key in cache_keys.items():
+                entry = self._entries.get(cache_key)
+                if entry is None:
+                    remote_keys[cache_key] = key
+                else:
+                    self._entries.move_to_end(cache_key)
+                    values[key] = pickle.loads(entry)
+        if remote_keys:
+            remote_values = cache.get_many(remote_keys)
+            self._set_local(remote_values)
+            for cache_key, value in remote_values.items():
+                values[remote_keys[cache_key]] = value
+        with self._lock:
+            self.hits += len(values)
+            self.misses += len(cache_keys) - len(values)
+        return values
+
+    def set_many(self, values: Dict[str, Any]):
+        if not values:
+            return
+        timeout = settings.GRAPHQL_LOADER_CACHE_TTL.total_seconds()
+        cache.set_many(values, timeout=timeout)
+        self._set_local(values)
+
+    def _set_local(self, values: Dict[str, Any]):
+        if self.maxsize <= 0:
+            return
+        entries = {key: pickle.dumps(value) for key, value in values.items()}
+        with self._lock:
+            for key, entry in entries.items():
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+
+loader_cache = LoaderCache()
+
+
+def bump_model_version(model: Type[Model]):
+    cache.set(get_version_key(model), uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_model(model: Type[Model]):
+    """Invalidate the values cached for the model once the transaction commits.
+
+    Bumping the version earlier would let a request running before the commit
+    load the old rows and cache them under the new version. Writes which don't
+    send model signals, such as `bulk_update`, have to call it explicitly.
+    """
+    if not loader_cache.enabled or model._meta.label not in CACHEABLE_MODELS:
+        return
+    transaction.on_commit(partial(bump_model_version, model))
+
+
+def handle_model_change(sender, **kwargs):
+    invalidate_model(sender)
+
+
+def connect_invalidation_signals():
+    # The receivers disable the fast delete path of the cached models, so they
+    # are connected only when the cache is used
+    if not settings.GRAPHQL_LOADER_CACHE_ENABLED:
+        return
+    for model in get_cacheable_models():
+        uid = f"graphql_loader_cache_{model._meta.label_lower}"
+        post_save.connect(handle_model_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(handle_model_change, sender=model, dispatch_uid=uid)
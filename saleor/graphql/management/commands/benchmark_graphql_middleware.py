@@ -0,0 +1,103 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from graphene_django.settings import graphene_settings
+from graphene_django.views import instantiate_middleware
+from graphql.language.parser import parse
+from graphql.utils.get_operation_ast import get_operation_ast
+
+from ...views import API_PATH, GraphQLView
+
+QUERY_PRODUCTS = """
+    query($channel: String, $first: Int) {
+        products(first: $first, channel: $channel) {
+            edges {
+                node {
+                    id
+                    name
+                    slug
+                    productType {
+                        id
+                        name
+                    }
+                    category {
+                        id
+                        name
+                    }
+                    variants {
+                        id
+                        name
+                        sku
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+class FieldCounter:
+    def __init__(self):
+        self.count = 0
+
+    def resolve(self, next_, root, info, **kwargs):
+        self.count += 1
+        return next_(root, info, **kwargs)
+
+
+class Command(BaseCommand):
+    help = (
+        "Execute a large product listing with and without the graphene field "
+        "middleware and print how much the middleware chain adds to the execution."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--channel", default=settings.DEFAULT_CHANNEL_SLUG)
+        parser.add_argument("--products", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def execute_query(self, middleware):
+        view = GraphQLView()
+        request = RequestFactory().post(str(API_PATH))
+        operation = get_operation_ast(parse(QUERY_PRODUCTS))
+        view.run_operation_middleware(request, operation)
+        start = time.perf_counter()
+        result = view.schema.execute(
+            QUERY_PRODUCTS,
+            context=request,
+            variables=self.variables,
+            middleware=middleware,
+        )
+        duration = time.perf_counter() - start
+        if result.errors:
+            raise result.errors[0]
+        return duration
+
+    def handle(self, **options):
+        self.variables = {"channel": options["channel"], "first": options["products"]}
+        counter = FieldCounter()
+        self.execute_query([counter])
+        self.stdout.write(f"Resolved fields: {counter.count}")
+
+        configured = list(instantiate_middleware(graphene_settings.MIDDLEWARE))
+        chains = {"none": []}
+        for middleware in configured:
+            chains[middleware.__class__.__name__] = [middleware]
+        chains["all"] = configured
+
+        baseline = None
+        for name, middleware in chains.items():
+            # The first execution warms up the caches
+            self.execute_query(middleware)
+            total = sum(
+                self.execute_query(middleware) for _ in range(options["repeat"])
+            )
+            average = total / options["repeat"] * 1000
+            if baseline is None:
+                baseline = average
+            self.stdout.write(
+                f"{name}: {average:.2f} ms (+{average - baseline:.2f} ms, "
+                f"{(average - baseline) / counter.count * 1000:.2f} us per field)"
+            )
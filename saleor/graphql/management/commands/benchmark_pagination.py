@@ -0,0 +1,74 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from graphql_relay.connection.connectiontypes import Edge
+
+from ....order.models import Order
+from ....product.models import Product
+from ...core.connection import (
+    _get_edges_for_connection,
+    _prepare_filter,
+    _prepare_row_value_filter,
+    from_global_cursor,
+)
+
+SORTING_FIELDS = {
+    "orders": (Order, ["created", "status", "pk"]),
+    "products": (Product, ["name", "slug"]),
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Page through orders or products sorted like in the API and compare the "
+        "time of fetching pages with row value and OR chain cursor filters. "
+        "The database should contain at least the given number of rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", choices=sorted(SORTING_FIELDS))
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument(
+            "--report-every",
+            type=int,
+            default=1000,
+            help="Print the average time of a page every given number of pages.",
+        )
+
+    def handle(self, **options):
+        model, sorting_fields = SORTING_FIELDS[options["model"]]
+        page_size = options["page_size"]
+        qs = model.objects.order_by(*sorting_fields)
+        args = {"first": page_size}
+
+        timings = {"row value": 0.0, "OR chain": 0.0}
+        cursor = None
+        for page in range(1, options["rows"] // page_size + 1):
+            filters = {"row value": Q(), "OR chain": Q()}
+            if cursor:
+                filters = {
+                    "row value": _prepare_row_value_filter(
+                        cursor, sorting_fields, "gt", model
+                    ),
+                    "OR chain": _prepare_filter(cursor, sorting_fields, "gt"),
+                }
+            for name, filter_kwargs in filters.items():
+                start = time.perf_counter()
+                page_qs = qs.filter(filter_kwargs)[: page_size + 1]
+                _edges, page_info = _get_edges_for_connection(
+                    Edge, page_qs, args, sorting_fields
+                )
+                timings[name] += time.perf_counter() - start
+
+            last_page = not page_info["has_next_page"]
+            if last_page or page % options["report_every"] == 0:
+                summary = ", ".join(
+                    f"{name}: {total / page * 1000:.2f} ms"
+                    for name, total in timings.items()
+                )
+                self.stdout.write(f"Page {page}, average time of a page: {summary}")
+            if last_page:
+                break
+            cursor = from_global_cursor(page_info["end_cursor"])
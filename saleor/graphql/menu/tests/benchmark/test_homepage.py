@@ -1,6 +1,6 @@
 import pytest
 
-from ....tests.utils import get_graphql_content
+from ....tests.utils import assert_query_budget, get_graphql_content
 
 
 @pytest.mark.django_db
@@ -47,7 +47,8 @@ def test_retrieve_main_menu(api_client, site_with_top_menu, count_queries):
         }
     """
 
-    get_graphql_content(api_client.post_graphql(query))
+    with assert_query_budget(5):
+        get_graphql_content(api_client.post_graphql(query))
 
 
 @pytest.mark.django_db
@@ -1,5 +1,3 @@
-import json
-
 import graphene
 import pytest
 from django.core.exceptions import ValidationError
@@ -1146,17 +1144,13 @@ def test_menu_cannot_get_menu_item_not_from_same_menu(
         QUERY_REORDER_MENU, {"moves": moves, "menu": menu_id}, [permission_manage_menus]
     )
 
-    assert json.loads(response.content) == {
-        "data": {
-            "menuItemMove": {
-                "errors": [
-                    {
-                        "field": "item",
-                        "message": f"Couldn't resolve to a node: {node_id}",
-                    }
-                ],
-                "menu": None,
-            }
+    content = get_graphql_content(response)
+    assert content["data"] == {
+        "menuItemMove": {
+            "errors": [
+                {"field": "item", "message": f"Couldn't resolve to a node: {node_id}"}
+            ],
+            "menu": None,
         }
     }
 
@@ -1179,11 +1173,10 @@ def test_menu_cannot_pass_an_invalid_menu_item_node_type(
         QUERY_REORDER_MENU, {"moves": moves, "menu": menu_id}, [permission_manage_menus]
     )
 
-    assert json.loads(response.content) == {
-        "data": {
-            "menuItemMove": {
-                "errors": [{"field": "item", "message": "Must receive a MenuItem id"}],
-                "menu": None,
-            }
+    content = get_graphql_content(response)
+    assert content["data"] == {
+        "menuItemMove": {
+            "errors": [{"field": "item", "message": "Must receive a MenuItem id"}],
+            "menu": None,
         }
     }
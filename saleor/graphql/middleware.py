@@ -7,10 +7,15 @@ from django.contrib.auth import authenticate
 from django.contrib.auth.models import AnonymousUser
 from django.utils.functional import SimpleLazyObject
 from graphql import ResolveInfo
+from graphql.language.ast import OperationDefinition
+from promise import Promise
 
 from ..app.models import App
 from ..core.exceptions import ReadOnlyException
-from ..core.tracing import should_trace
+from ..core.tracing import is_sampled, should_trace
+from .app_token_cache import get_app_by_token
+from .query_budget import get_field_path, is_recording, resolving
+from .resolver_tracing import get_current_tracer
 from .views import API_PATH, GraphQLView
 
 
@@ -20,21 +25,17 @@ def get_user(request):
     return request._cached_user
 
 
-class JWTMiddleware:
-    def resolve(self, next, root, info, **kwargs):
-        request = info.context
+def authenticate_user(request, operation: Optional[OperationDefinition]):
+    def user():
+        return get_user(request) or AnonymousUser()
 
-        def user():
-            return get_user(request) or AnonymousUser()
-
-        request.user = SimpleLazyObject(lambda: user())
-        return next(root, info, **kwargs)
+    request.user = SimpleLazyObject(lambda: user())
 
 
 class OpentracingGrapheneMiddleware:
     @staticmethod
     def resolve(next_, root, info: ResolveInfo, **kwargs):
-        if not should_trace(info):
+        if not is_sampled() or not should_trace(info):
             return next_(root, info, **kwargs)
         operation = f"{info.parent_type.name}.{info.field_name}"
         with opentracing.global_tracer().start_active_span(operation) as scope:
@@ -45,16 +46,45 @@ class OpentracingGrapheneMiddleware:
             return next_(root, info, **kwargs)
 
 
-def get_app(auth_token) -> Optional[App]:
-    qs = App.objects.filter(tokens__auth_token=auth_token, is_active=True)
-    return qs.first()
+class ResolverTracingMiddleware:
+    @staticmethod
+    def resolve(next_, root, info: ResolveInfo, **kwargs):
+        tracer = get_current_tracer()
+        if tracer is None or not should_trace(info):
+            return next_(root, info, **kwargs)
+        start_offset = tracer.get_offset()
+        result = next_(root, info, **kwargs)
+        if not isinstance(result, Promise):
+            tracer.add_resolver(info, start_offset)
+            return result
+
+        def on_resolve(value):
+            tracer.add_resolver(info, start_offset)
+            return value
+
+        def on_reject(error):
+            tracer.add_resolver(info, start_offset)
+            raise error
+
+        return result.then(on_resolve, on_reject)
+
 
+class QueryBudgetMiddleware:
+    @staticmethod
+    def resolve(next_, root, info: ResolveInfo, **kwargs):
+        if not is_recording():
+            return next_(root, info, **kwargs)
+        with resolving(get_field_path(info.path)):
+            return next_(root, info, **kwargs)
 
-def app_middleware(next, root, info, **kwargs):
 
+def get_app(auth_token) -> Optional[App]:
+    return get_app_by_token(auth_token)
+
+
+def authenticate_app(request, operation: Optional[OperationDefinition]):
     app_auth_header = "HTTP_AUTHORIZATION"
     prefix = "bearer"
-    request = info.context
 
     if request.path == API_PATH:
         if not hasattr(request, "app"):
@@ -64,52 +94,44 @@ def app_middleware(next, root, info, **kwargs):
                 auth_prefix, auth_token = auth
                 if auth_prefix.lower() == prefix:
                     request.app = SimpleLazyObject(lambda: get_app(auth_token))
-    return next(root, info, **kwargs)
-
-
-class ReadOnlyMiddleware:
-    ALLOWED_MUTATIONS = [
-        "checkoutAddPromoCode",
-        "checkoutBillingAddressUpdate",
-        "checkoutComplete",
-        "checkoutCreate",
-        "checkoutCustomerAttach",
-        "checkoutCustomerDetach",
-        "checkoutEmailUpdate",
-        "checkoutLineDelete",
-        "checkoutLinesAdd",
-        "checkoutLinesUpdate",
-        "checkoutRemovePromoCode",
-        "checkoutPaymentCreate",
-        "checkoutShippingAddressUpdate",
-        "checkoutShippingMethodUpdate",
-        "tokenCreate",
-        "tokenVerify",
-    ]
 
-    @staticmethod
-    def resolve(next_, root, info, **kwargs):
-        operation = info.operation.operation
-        if operation != "mutation":
-            return next_(root, info, **kwargs)
 
-        # Bypass users authenticated with ROOT_EMAIL
-        request = info.context
-        user = getattr(request, "user", None)
-        if user and not user.is_anonymous:
-            user_email = user.email
-            root_email = getattr(settings, "ROOT_EMAIL", None)
-            if root_email and user_email == root_email:
-                return next_(root, info, **kwargs)
-
-        for selection in info.operation.selection_set.selections:
-            selection_name = str(selection.name.value)
-            blocked = selection_name not in ReadOnlyMiddleware.ALLOWED_MUTATIONS
-            if blocked:
-                raise ReadOnlyException(
-                    "Be aware admin pirate! API runs in read-only mode!"
-                )
-        return next_(root, info, **kwargs)
+READ_ONLY_ALLOWED_MUTATIONS = [
+    "checkoutAddPromoCode",
+    "checkoutBillingAddressUpdate",
+    "checkoutComplete",
+    "checkoutCreate",
+    "checkoutCustomerAttach",
+    "checkoutCustomerDetach",
+    "checkoutEmailUpdate",
+    "checkoutLineDelete",
+    "checkoutLinesAdd",
+    "checkoutLinesUpdate",
+    "checkoutRemovePromoCode",
+    "checkoutPaymentCreate",
+    "checkoutShippingAddressUpdate",
+    "checkoutShippingMethodUpdate",
+    "tokenCreate",
+    "tokenVerify",
+]
+
+
+def check_read_only(request, operation: Optional[OperationDefinition]):
+    if operation is None or operation.operation != "mutation":
+        return
+
+    # Bypass users authenticated with ROOT_EMAIL
+    user = getattr(request, "user", None)
+    if user and not user.is_anonymous:
+        root_email = getattr(settings, "ROOT_EMAIL", None)
+        if root_email and user.email == root_email:
+            return
+
+    for selection in operation.selection_set.selections:
+        if selection.name.value not in READ_ONLY_ALLOWED_MUTATIONS:
+            raise ReadOnlyException(
+                "Be aware admin pirate! API runs in read-only mode!"
+            )
 
 
 def process_view(self, request, view_func, *args):
@@ -31,7 +31,13 @@ def filter_orders(qs, info, created, status):
 
 
 def resolve_orders(info, created, status, channel_slug, **_kwargs):
-    qs = models.Order.objects.confirmed()
+    # The order list shows the billing address and the payment status, and the
+    # access to the address is checked against the user of each order
+    qs = (
+        models.Order.objects.confirmed()
+        .select_related("user", "billing_address")
+        .prefetch_related("payments")
+    )
     if channel_slug:
         qs = qs.filter(channel__slug=str(channel_slug))
     return filter_orders(qs, info, created, status)
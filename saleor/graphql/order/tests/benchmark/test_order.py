@@ -4,7 +4,7 @@ from ....checkout.tests.benchmark.test_checkout_mutations import (
     FRAGMENT_ADDRESS,
     FRAGMENT_PRODUCT_VARIANT,
 )
-from ....tests.utils import get_graphql_content
+from ....tests.utils import assert_query_budget, get_graphql_content
 
 FRAGMENT_ORDER_DETAILS = (
     FRAGMENT_ADDRESS
@@ -62,4 +62,45 @@ def test_user_order_details(user_api_client, order_with_lines, count_queries):
     variables = {
         "token": order_with_lines.token,
     }
-    get_graphql_content(user_api_client.post_graphql(query, variables))
+    with assert_query_budget(22):
+        get_graphql_content(user_api_client.post_graphql(query, variables))
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_staff_order_list(
+    staff_api_client, permission_manage_orders, order_list, address, count_queries
+):
+    for order in order_list:
+        order.billing_address = address.get_copy()
+        order.save(update_fields=["billing_address"])
+    staff_api_client.user.user_permissions.add(permission_manage_orders)
+    query = """
+        query OrderList($first: Int) {
+          orders(first: $first) {
+            edges {
+              node {
+                id
+                number
+                created
+                billingAddress {
+                  firstName
+                  lastName
+                }
+                paymentStatus
+                status
+                total {
+                  gross {
+                    amount
+                    currency
+                  }
+                }
+                userEmail
+              }
+            }
+          }
+        }
+    """
+    variables = {"first": 20}
+    with assert_query_budget(4, max_repeats=1):
+        get_graphql_content(staff_api_client.post_graphql(query, variables))
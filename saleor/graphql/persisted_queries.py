@@ -0,0 +1,84 @@
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from graphql.error import GraphQLError
+
+from .document_cache import get_query_hash
+
+PERSISTED_QUERY_CACHE_KEY = "graphql_persisted_query:{}"
+PERSISTED_QUERY_VERSION = 1
+
+
+class PersistedQueryError(GraphQLError):
+    code = "PERSISTED_QUERY_ERROR"
+
+    def __init__(self, message):
+        super().__init__(message, extensions={"code": self.code})
+
+
+class PersistedQueryNotFound(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_FOUND"
+
+    def __init__(self):
+        # Apollo clients recognize the miss by this exact message and resend
+        # the request with the full query text
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryNotSupported(PersistedQueryError):
+    code = "PERSISTED_QUERY_NOT_SUPPORTED"
+
+    def __init__(self):
+        super().__init__("PersistedQueryNotSupported")
+
+
+def get_persisted_query(query_hash: str) -> Optional[str]:
+    return cache.get(PERSISTED_QUERY_CACHE_KEY.format(query_hash))
+
+
+def persist_query(query_hash: str, query: str):
+    cache.set(
+        PERSISTED_QUERY_CACHE_KEY.format(query_hash),
+        query,
+        timeout=settings.GRAPHQL_PERSISTED_QUERY_TTL.total_seconds(),
+    )
+
+
+def resolve_persisted_query(query: Optional[str], extensions) -> Optional[str]:
+    """Return the query text for a request using automatic persisted queries.
+
+    Requests without the `persistedQuery` extension are returned untouched. When
+    only the hash is sent, the query is looked up in the cache; when both the hash
+    and the query are sent, the query is verified and registered under the hash.
+    """
+    if not isinstance(extensions, dict):
+        return query
+    persisted_query = extensions.get("persistedQuery")
+    if not persisted_query:
+        return query
+    if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+        raise PersistedQueryNotSupported()
+    if not isinstance(persisted_query, dict):
+        raise PersistedQueryError("Invalid persisted query extension.")
+
+    version = persisted_query.get("version")
+    if version != PERSISTED_QUERY_VERSION:
+        raise PersistedQueryError(f"Unsupported persisted query version: {version}.")
+
+    query_hash = persisted_query.get("sha256Hash")
+    if not query_hash or not isinstance(query_hash, str):
+        raise PersistedQueryError("Must provide a persisted query sha256Hash.")
+
+    if not query:
+        query = get_persisted_query(query_hash)
+        if query is None:
+            raise PersistedQueryNotFound()
+        return query
+
+    if not isinstance(query, str) or get_query_hash(query) != query_hash:
+        raise PersistedQueryError("Provided sha256Hash does not match the query.")
+    if len(query) > settings.GRAPHQL_PERSISTED_QUERY_MAX_LENGTH:
+        raise PersistedQueryError("The query is too long to be persisted.")
+    persist_query(query_hash, query)
+    return query
@@ -115,6 +115,7 @@ class ProductChannelListingByProductIdAndChannelSlugLoader(
 
 class ProductTypeByIdLoader(DataLoader):
     context_key = "product_type_by_id"
+    shared_cache_model = ProductType
 
     def batch_load(self, keys):
         product_types = ProductType.objects.in_bulk(keys)
@@ -1,7 +1,7 @@
 import graphene
 import pytest
 
-from ....tests.utils import get_graphql_content
+from ....tests.utils import assert_query_budget, get_graphql_content
 
 
 @pytest.mark.django_db
@@ -115,4 +115,5 @@ def test_category_view(api_client, category_with_products, count_queries, channe
         "id": graphene.Node.to_global_id("Category", category_with_products.pk),
         "channel": channel_USD.slug,
     }
-    get_graphql_content(api_client.post_graphql(query, variables))
+    with assert_query_budget(22, max_repeats=2):
+        get_graphql_content(api_client.post_graphql(query, variables))
@@ -1,7 +1,7 @@
 import pytest
 
 from ....core.enums import ReportingPeriod
-from ....tests.utils import get_graphql_content
+from ....tests.utils import assert_query_budget, get_graphql_content
 
 
 @pytest.mark.django_db
@@ -28,7 +28,8 @@ def test_retrieve_product_list(
           }
         }
     """
-    get_graphql_content(api_client.post_graphql(query))
+    with assert_query_budget(4):
+        get_graphql_content(api_client.post_graphql(query))
 
 
 @pytest.mark.django_db
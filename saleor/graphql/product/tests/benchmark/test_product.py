@@ -1,7 +1,7 @@
 import pytest
 from graphene import Node
 
-from ....tests.utils import get_graphql_content
+from ....tests.utils import assert_query_budget, get_graphql_content
 
 
 @pytest.mark.django_db
@@ -156,7 +156,8 @@ def test_product_details(product, api_client, count_queries, channel_USD):
         "id": Node.to_global_id("Product", product.pk),
         "channel": channel_USD.slug,
     }
-    get_graphql_content(api_client.post_graphql(query, variables))
+    with assert_query_budget(20):
+        get_graphql_content(api_client.post_graphql(query, variables))
 
 
 @pytest.mark.django_db
@@ -182,7 +183,8 @@ def test_retrieve_product_attributes(
     """
 
     variables = {"channel": channel_USD.slug}
-    get_graphql_content(api_client.post_graphql(query, variables))
+    with assert_query_budget(7, max_repeats=1):
+        get_graphql_content(api_client.post_graphql(query, variables))
 
 
 @pytest.mark.django_db
@@ -252,14 +254,9 @@ def test_retrieve_channel_listings(
     """
 
     variables = {"channel": channel_USD.slug}
-    get_graphql_content(
-        staff_api_client.post_graphql(
-            query,
-            variables,
-            permissions=(permission_manage_products,),
-            check_no_permissions=False,
-        )
-    )
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    with assert_query_budget(14, max_repeats=2):
+        get_graphql_content(staff_api_client.post_graphql(query, variables))
 
 
 @pytest.mark.django_db
@@ -288,4 +285,62 @@ def test_retrive_products_with_product_types_and_attributes(
         }
     """
     variables = {"channel": channel_USD.slug}
-    get_graphql_content(api_client.post_graphql(query, variables))
+    with assert_query_budget(5, max_repeats=1):
+        get_graphql_content(api_client.post_graphql(query, variables))
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_staff_product_list(
+    product_list,
+    staff_api_client,
+    permission_manage_products,
+    count_queries,
+    channel_USD,
+):
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    query = """
+        query ProductList($first: Int, $channel: String) {
+          products(first: $first, channel: $channel) {
+            edges {
+              node {
+                id
+                name
+                thumbnail {
+                  url
+                }
+                productType {
+                  id
+                  name
+                  hasVariants
+                }
+                channelListings {
+                  isPublished
+                  publicationDate
+                  isAvailableForPurchase
+                  availableForPurchase
+                  visibleInListings
+                  channel {
+                    id
+                    name
+                    slug
+                    currencyCode
+                  }
+                }
+                attributes {
+                  attribute {
+                    id
+                  }
+                  values {
+                    id
+                    name
+                  }
+                }
+              }
+            }
+          }
+        }
+    """
+    variables = {"first": 20, "channel": channel_USD.slug}
+    with assert_query_budget(13, max_repeats=1):
+        get_graphql_content(staff_api_client.post_graphql(query, variables))
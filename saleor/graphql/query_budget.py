@@ -0,0 +1,126 @@
+import logging
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Union
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# Lists of placeholders, e.g. in `IN (%s, %s)` clauses, depend on the number of
+# values and are collapsed, so the same query for a different number of objects
+# has the same shape
+PLACEHOLDERS_RE = re.compile(r"%s(?:, %s)+")
+
+_local = threading.local()
+
+
+class RepeatedQuery(NamedTuple):
+    path: str
+    sql: str
+    count: int
+
+
+def get_sql_shape(sql: str) -> str:
+    return PLACEHOLDERS_RE.sub("%s, ...", sql)
+
+
+def get_field_path(path: Sequence[Union[str, int]]) -> str:
+    """Return the resolver path without list indexes, e.g. `products.edges.node`."""
+    return ".".join(key for key in path if isinstance(key, str))
+
+
+def get_current_path() -> str:
+    return getattr(_local, "path", "")
+
+
+def is_recording() -> bool:
+    return getattr(_local, "recording", 0) > 0
+
+
+@contextmanager
+def resolving(path: str) -> Iterator[None]:
+    """Attribute the queries executed in the block to the given resolver path."""
+    previous = get_current_path()
+    _local.path = path
+    try:
+        yield
+    finally:
+        _local.path = previous
+
+
+class QueryLog:
+    """Execute wrapper collecting the shapes of SQL queries and their origin."""
+
+    def __init__(self):
+        self.queries: Counter = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries[(get_current_path(), get_sql_shape(sql))] += 1
+        return execute(sql, params, many, context)
+
+    @property
+    def count(self) -> int:
+        return sum(self.queries.values())
+
+    def get_repeated_queries(self, max_repeats: int) -> List[RepeatedQuery]:
+        """Return queries executed more than `max_repeats` times by one resolver.
+
+        A query repeated for every element of a list usually means the resolver
+        bypasses the dataloaders.
+        """
+        return [
+            RepeatedQuery(path, sql, count)
+            for (path, sql), count in self.queries.most_common()
+            if count > max_repeats
+        ]
+
+    def get_problems(
+        self, max_queries: Optional[int], max_repeats: Optional[int]
+    ) -> List[str]:
+        problems = []
+        if max_queries and self.count > max_queries:
+            problems.append(
+                f"Executed {self.count} queries, the budget is {max_queries}."
+            )
+        if max_repeats:
+            for query in self.get_repeated_queries(max_repeats):
+                problems.append(
+                    f"Query repeated {query.count} times by "
+                    f"{query.path or 'unknown resolver'}: {query.sql}"
+                )
+        return problems
+
+
+@contextmanager
+def record_queries(enabled: bool = True) -> Iterator[Optional[QueryLog]]:
+    if not enabled:
+        yield None
+        return
+    query_log = QueryLog()
+    _local.recording = getattr(_local, "recording", 0) + 1
+    try:
+        with connection.execute_wrapper(query_log):
+            yield query_log
+    finally:
+        _local.recording -= 1
+
+
+def is_query_budget_enabled() -> bool:
+    return bool(settings.GRAPHQL_QUERY_BUDGET or settings.GRAPHQL_QUERY_MAX_REPEATS)
+
+
+def check_query_budget(query_log: QueryLog, operation_name: Optional[str]):
+    """Log a warning for each problem found in the queries of an operation."""
+    problems = query_log.get_problems(
+        settings.GRAPHQL_QUERY_BUDGET, settings.GRAPHQL_QUERY_MAX_REPEATS
+    )
+    for problem in problems:
+        logger.warning(
+            "Operation %s exceeds the query budget. %s",
+            operation_name or "<anonymous>",
+            problem,
+        )
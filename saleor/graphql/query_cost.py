@@ -0,0 +1,172 @@
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Set
+
+from django.conf import settings
+from graphql.error import GraphQLError
+from graphql.language import ast
+from graphql.utils.get_operation_ast import get_operation_ast
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+PAGINATION_ARGUMENTS = ("first", "last")
+
+
+class QueryCost(NamedTuple):
+    cost: int
+    depth: int
+
+
+class QueryCostError(GraphQLError):
+    pass
+
+
+class _QueryCostCalculator:
+    def __init__(self, document_ast: ast.Document, variables: Dict[str, Any]):
+        self.variables = variables
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document_ast.definitions
+            if isinstance(definition, ast.FragmentDefinition)
+        }
+
+    def calculate(
+        self,
+        selection_set: Optional[ast.SelectionSet],
+        multiplier: int = 1,
+        depth: int = 0,
+        visited_fragments: Optional[Set[str]] = None,
+    ) -> QueryCost:
+        if selection_set is None:
+            return QueryCost(cost=0, depth=depth)
+        visited_fragments = visited_fragments or set()
+        total_cost = 0
+        max_depth = depth
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                if selection.name.value.startswith("__"):
+                    continue
+                child_multiplier = multiplier * self.get_page_size(selection)
+                cost, child_depth = self.calculate(
+                    selection.selection_set,
+                    child_multiplier,
+                    depth + 1,
+                    visited_fragments,
+                )
+                total_cost += multiplier + cost
+            elif isinstance(selection, ast.InlineFragment):
+                cost, child_depth = self.calculate(
+                    selection.selection_set, multiplier, depth, visited_fragments
+                )
+                total_cost += cost
+            elif isinstance(selection, ast.FragmentSpread):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited_fragments:
+                    continue
+                cost, child_depth = self.calculate(
+                    fragment.selection_set,
+                    multiplier,
+                    depth,
+                    visited_fragments | {name},
+                )
+                total_cost += cost
+            else:
+                continue
+            max_depth = max(max_depth, child_depth)
+        return QueryCost(cost=total_cost, depth=max_depth)
+
+    def get_page_size(self, field: ast.Field) -> int:
+        """Return the number of items requested from a connection field.
+
+        Sizes passed in variables that were not provided fall back to the maximum
+        page size allowed by the API.
+        """
+        for argument in field.arguments or []:
+            if argument.name.value not in PAGINATION_ARGUMENTS:
+                continue
+            value = argument.value
+            size: Any
+            if isinstance(value, ast.Variable):
+                size = self.variables.get(value.name.value)
+            elif isinstance(value, ast.IntValue):
+                size = value.value
+            else:
+                size = None
+            try:
+                return max(int(size), 1)
+            except (TypeError, ValueError):
+                return settings.GRAPHENE["RELAY_CONNECTION_MAX_LIMIT"]  # type: ignore
+        return 1
+
+
+def calculate_query_cost(
+    document_ast: ast.Document,
+    operation_name: Optional[str] = None,
+    variables: Optional[Dict[str, Any]] = None,
+) -> QueryCost:
+    """Estimate the cost of an operation before it is executed.
+
+    Every field costs one unit multiplied by the `first`/`last` arguments of all
+    connections above it, e.g. `products(first: 10) { edges { node { name } } }`
+    costs 1 + 10 + 10 + 10 = 31. Introspection fields are free.
+    """
+    operation = get_operation_ast(document_ast, operation_name)
+    if operation is None:
+        return QueryCost(cost=0, depth=0)
+
+    variables = dict(variables) if isinstance(variables, dict) else {}
+    for definition in operation.variable_definitions or []:
+        name = definition.variable.name.value
+        if name not in variables and isinstance(definition.default_value, ast.IntValue):
+            variables[name] = definition.default_value.value
+
+    calculator = _QueryCostCalculator(document_ast, variables)
+    return calculator.calculate(operation.selection_set)
+
+
+def get_requestor_max_query_cost(request: "HttpRequest") -> int:
+    from .middleware import get_app, get_user
+
+    max_cost = settings.GRAPHQL_QUERY_MAX_COST
+    auth = request.META.get("HTTP_AUTHORIZATION", "").split()
+    if len(auth) == 2 and auth[0].lower() == "bearer":
+        if get_app(auth[1]):
+            return settings.GRAPHQL_QUERY_MAX_COST_APP or max_cost
+    user = get_user(request)
+    if user and user.is_staff:
+        return settings.GRAPHQL_QUERY_MAX_COST_STAFF or max_cost
+    return max_cost
+
+
+def validate_query_cost(request: "HttpRequest", query_cost: QueryCost):
+    """Raise an error if the operation is more expensive than allowed.
+
+    Limits equal to 0 are disabled, staff users and apps without their own limit
+    get the default one. The requestor is only authenticated when the cost
+    exceeds the lowest configured limit, cheap operations do not hit the database.
+    """
+    max_depth = settings.GRAPHQL_QUERY_MAX_DEPTH
+    if max_depth and query_cost.depth > max_depth:
+        raise QueryCostError(
+            f"The query exceeds the maximum depth of {max_depth} "
+            f"(requested: {query_cost.depth})."
+        )
+
+    default_max_cost = settings.GRAPHQL_QUERY_MAX_COST
+    limits = [
+        limit
+        for limit in (
+            default_max_cost,
+            settings.GRAPHQL_QUERY_MAX_COST_STAFF or default_max_cost,
+            settings.GRAPHQL_QUERY_MAX_COST_APP or default_max_cost,
+        )
+        if limit
+    ]
+    if not limits or query_cost.cost <= min(limits):
+        return
+    max_cost = get_requestor_max_query_cost(request)
+    if max_cost and query_cost.cost > max_cost:
+        raise QueryCostError(
+            f"The query exceeds the maximum cost of {max_cost} "
+            f"(requested: {query_cost.cost})."
+        )
@@ -0,0 +1,115 @@
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from jwt.exceptions import PyJWTError
+
+from ..core.permissions import SitePermissions
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+RESOLVER_TIMINGS_HEADER = "HTTP_X_SALEOR_RESOLVER_TIMINGS"
+TRACING_PERMISSION = SitePermissions.MANAGE_SETTINGS
+TRACING_VERSION = 1
+
+_local = threading.local()
+
+
+def format_timestamp(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+class ResolverTracer:
+    """Collect timings of resolvers and dataloader batches of one operation.
+
+    Offsets and durations are in nanoseconds and follow the Apollo tracing
+    format, the result is returned in `extensions.tracing`.
+    """
+
+    def __init__(self):
+        self.start_time = datetime.now(timezone.utc)
+        self.start = time.perf_counter_ns()
+        self.resolvers: List[Dict[str, Any]] = []
+        self.dataloaders: List[Dict[str, Any]] = []
+
+    def get_offset(self) -> int:
+        return time.perf_counter_ns() - self.start
+
+    def add_resolver(self, info, start_offset: int):
+        self.resolvers.append(
+            {
+                "path": list(info.path),
+                "parentType": str(info.parent_type),
+                "fieldName": info.field_name,
+                "returnType": str(info.return_type),
+                "startOffset": start_offset,
+                "duration": self.get_offset() - start_offset,
+            }
+        )
+
+    def add_dataloader(self, name: str, keys: int, start_offset: int):
+        self.dataloaders.append(
+            {
+                "name": name,
+                "keys": keys,
+                "startOffset": start_offset,
+                "duration": self.get_offset() - start_offset,
+            }
+        )
+
+    def get_result(self) -> dict:
+        duration = self.get_offset()
+        end_time = datetime.now(timezone.utc)
+        return {
+            "version": TRACING_VERSION,
+            "startTime": format_timestamp(self.start_time),
+            "endTime": format_timestamp(end_time),
+            "duration": duration,
+            "execution": {"resolvers": self.resolvers},
+            "dataloaders": self.dataloaders,
+        }
+
+
+def get_current_tracer() -> Optional[ResolverTracer]:
+    return getattr(_local, "tracer", None)
+
+
+@contextmanager
+def trace_resolvers(tracer: Optional[ResolverTracer]):
+    """Make the tracer current for the operation executed in this thread.
+
+    The tracer is kept per thread rather than on the request, so entries of a
+    batched request executed concurrently are traced separately.
+    """
+    previous = get_current_tracer()
+    _local.tracer = tracer
+    try:
+        yield tracer
+    finally:
+        _local.tracer = previous
+
+
+def is_tracing_requested(request: "HttpRequest") -> bool:
+    """Check if the requestor asked for tracing and is allowed to get it.
+
+    The header is checked first, so regular requests are not authenticated here.
+    Requestors which can't be authenticated, e.g. with an expired token, are not
+    allowed to get tracing; the error is raised again by the resolvers.
+    """
+    from .middleware import get_app, get_user
+
+    if request.META.get(RESOLVER_TIMINGS_HEADER, "").lower() not in ("1", "true"):
+        return False
+    auth = request.META.get("HTTP_AUTHORIZATION", "").split()
+    if len(auth) == 2 and auth[0].lower() == "bearer":
+        app = get_app(auth[1])
+        if app:
+            return app.has_perm(TRACING_PERMISSION)
+    try:
+        user = get_user(request)
+    except PyJWTError:
+        return False
+    return bool(user and user.is_staff and user.has_perm(TRACING_PERMISSION))
@@ -0,0 +1,263 @@
+import hashlib
+import json
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+)
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .document_cache import get_query_hash
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+RESPONSE_CACHE_KEY = "graphql_response:{}"
+RESPONSE_CACHE_TAG_KEY = "graphql_response_tag:{}"
+
+# Responses are only cached when all the tables they were built from belong to
+# these apps; writes to their models invalidate the cached responses.
+CACHEABLE_APP_LABELS = (
+    "attribute",
+    "channel",
+    "discount",
+    "menu",
+    "page",
+    "plugins",
+    "product",
+    "site",
+    "sites",
+)
+
+TABLE_NAME_RE = re.compile(r'\b(?:FROM|JOIN)\s+"([^"]+)"', re.IGNORECASE)
+WRITE_STATEMENTS = ("INSERT", "UPDATE", "DELETE")
+
+
+def get_cacheable_models() -> List[Type[Model]]:
+    return [
+        model
+        for model in apps.get_models(include_auto_created=True)
+        if model._meta.app_label in CACHEABLE_APP_LABELS
+    ]
+
+
+@lru_cache(maxsize=None)
+def get_cacheable_tables() -> FrozenSet[str]:
+    return frozenset(model._meta.db_table for model in get_cacheable_models())
+
+
+def get_anonymous_request_key(
+    request: "HttpRequest",
+    query: str,
+    variables: Optional[Dict[str, Any]],
+    operation_name: Optional[str],
+) -> Optional[str]:
+    """Return a hash identifying the response of an anonymous request or None.
+
+    Only requests without credentials have a key. Besides the operation, the key
+    includes the variables (and so the channel) and the country and currency
+    detected for the client.
+    """
+    if "HTTP_AUTHORIZATION" in request.META:
+        return None
+    key_data = {
+        "query": get_query_hash(query),
+        "variables": variables,
+        "operation_name": operation_name,
+        "country": str(getattr(request, "country", "")),
+        "currency": getattr(request, "currency", None),
+    }
+    try:
+        key = json.dumps(key_data, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def get_tag_key(table: str) -> str:
+    return RESPONSE_CACHE_TAG_KEY.format(table)
+
+
+class QueryRecorder:
+    """Collect the tables read by the queries executed on a connection.
+
+    The tag versions are read before the operation is executed, a write that
+    happens while the operation runs makes the stored response stale right away.
+    """
+
+    def __init__(self, tag_versions: Dict[str, str]):
+        self.tag_versions = tag_versions
+        self.tables: Set[str] = set()
+        self.has_writes = False
+
+    def __call__(self, execute, sql, params, many, context):
+        if sql.lstrip().upper().startswith(WRITE_STATEMENTS):
+            self.has_writes = True
+        self.tables.update(TABLE_NAME_RE.findall(sql))
+        return execute(sql, params, many, context)
+
+    @property
+    def is_cacheable(self) -> bool:
+        return not self.has_writes and self.tables <= get_cacheable_tables()
+
+
+class ResponseCache:
+    """Cache of complete responses to anonymous queries.
+
+    Entries are stored in the Django cache and tagged with the tables the
+    response was built from. Every save or delete of a model from one of the
+    `CACHEABLE_APP_LABELS` apps replaces the version of its table tag, which
+    invalidates all entries built from that table. Bulk updates do not send
+    signals; entries affected by them expire after `GRAPHQL_RESPONSE_CACHE_TTL`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return settings.GRAPHQL_RESPONSE_CACHE_ENABLED
+
+    def get_cache_key(
+        self,
+        request: "HttpRequest",
+        query: str,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> Optional[str]:
+        """Return the key of a cacheable request or None."""
+        if not self.enabled:
+            return None
+        key = get_anonymous_request_key(request, query, variables, operation_name)
+        if key is None:
+            return None
+        return RESPONSE_CACHE_KEY.format(key)
+
+    def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        entry = cache.get(cache_key)
+        if entry is not None:
+            tags = entry["tags"]
+            current_versions = cache.get_many([get_tag_key(tag) for tag in tags])
+            if all(
+                current_versions.get(get_tag_key(tag)) == version
+                for tag, version in tags.items()
+            ):
+                self._record(hit=True)
+                return entry["data"]
+        self._record(hit=False)
+        return None
+
+    def set(self, cache_key: str, data: Dict[str, Any], recorder: QueryRecorder):
+        if not recorder.is_cacheable:
+            return
+        tags = {table: recorder.tag_versions.get(table) for table in recorder.tables}
+        if None in tags.values():
+            return
+        cache.set(
+            cache_key,
+            {"data": data, "tags": tags},
+            timeout=settings.GRAPHQL_RESPONSE_CACHE_TTL.total_seconds(),
+        )
+
+    @staticmethod
+    def get_tag_versions() -> Dict[str, str]:
+        tables = get_cacheable_tables()
+        keys = {get_tag_key(table): table for table in tables}
+        versions = cache.get_many(keys)
+        missing = [key for key in keys if key not in versions]
+        if missing:
+            for key in missing:
+                cache.add(key, uuid.uuid4().hex, timeout=None)
+            versions.update(cache.get_many(missing))
+        return {keys[key]: version for key, version in versions.items()}
+
+    @contextmanager
+    def record_queries(self, cache_key: Optional[str]) -> Iterator[Any]:
+        if cache_key is None:
+            yield None
+            return
+        recorder = QueryRecorder(self.get_tag_versions())
+        with connection.execute_wrapper(recorder):
+            yield recorder
+
+    def _record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+response_cache = ResponseCache()
+
+
+def invalidate_table(table: str):
+    cache.set(get_tag_key(table), uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_table_on_commit(table: str):
+    # A request running before the commit would otherwise cache the old rows
+    # under the new version of the table
+    transaction.on_commit(partial(invalidate_table, table))
+
+
+def handle_model_change(sender, **kwargs):
+    if settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        invalidate_table_on_commit(sender._meta.db_table)
+
+
+def handle_m2m_change(sender, action, **kwargs):
+    if settings.GRAPHQL_RESPONSE_CACHE_ENABLED and action in (
+        "post_add",
+        "post_remove",
+        "post_clear",
+    ):
+        invalidate_table_on_commit(sender._meta.db_table)
+
+
+def connect_invalidation_signals():
+    # The receivers disable the fast delete path of the cacheable models, so
+    # they are connected only when the cache is used
+    if not settings.GRAPHQL_RESPONSE_CACHE_ENABLED:
+        return
+    # Receivers are connected per model, so deletes of other models can still
+    # use the fast delete path which skips the signals
+    for model in get_cacheable_models():
+        uid = f"graphql_response_cache_{model._meta.label_lower}"
+        post_save.connect(handle_model_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(handle_model_change, sender=model, dispatch_uid=uid)
+        if model._meta.auto_created:
+            m2m_changed.connect(handle_m2m_change, sender=model, dispatch_uid=uid)
@@ -8,6 +8,7 @@ from ..core.dataloaders import DataLoader
 
 class ShippingMethodByIdLoader(DataLoader):
     context_key = "shippingmethod_by_id"
+    shared_cache_model = ShippingMethod
 
     def batch_load(self, keys):
         shipping_methods = ShippingMethod.objects.in_bulk(keys)
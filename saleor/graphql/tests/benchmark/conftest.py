@@ -0,0 +1,93 @@
+import fcntl
+import json
+import os
+import statistics
+import time
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from ...query_budget import record_queries
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# Record the results as the new baselines instead of comparing against them
+UPDATE_BASELINES = bool(os.environ.get("GRAPHQL_BENCHMARK_UPDATE"))
+ROUNDS = int(os.environ.get("GRAPHQL_BENCHMARK_ROUNDS", 5))
+# Number of SQL queries an operation may execute above its baseline
+QUERY_TOLERANCE = int(os.environ.get("GRAPHQL_BENCHMARK_QUERY_TOLERANCE", 0))
+# Timings depend on the machine, so they're only compared when the relative
+# tolerance is set, e.g. to 0.25 to fail operations over 25% slower than the
+# baseline recorded on the same machine
+TIME_TOLERANCE = os.environ.get("GRAPHQL_BENCHMARK_TIME_TOLERANCE")
+
+
+def load_baselines() -> Dict[str, Dict[str, Any]]:
+    with open(BASELINES_PATH) as baselines_file:
+        return json.load(baselines_file)
+
+
+def save_baseline(name: str, result: Dict[str, Any]):
+    # Workers of pytest-xdist update the file concurrently
+    with open(BASELINES_PATH, "r+") as baselines_file:
+        fcntl.flock(baselines_file, fcntl.LOCK_EX)
+        baselines = json.load(baselines_file)
+        baselines[name] = result
+        baselines_file.seek(0)
+        json.dump(baselines, baselines_file, indent=2, sort_keys=True)
+        baselines_file.write("\n")
+        baselines_file.truncate()
+
+
+def check_regressions(
+    name: str, result: Dict[str, Any], baseline: Optional[Dict[str, Any]]
+):
+    if baseline is None:
+        # A missing baseline would let a new operation skip the checks unnoticed
+        pytest.fail(
+            f"No benchmark baseline for {name}, record it with "
+            "GRAPHQL_BENCHMARK_UPDATE=1."
+        )
+    max_queries = baseline["queries"] + QUERY_TOLERANCE
+    assert result["queries"] <= max_queries, (
+        f"{name} executed {result['queries']} SQL queries, the baseline is "
+        f"{baseline['queries']}."
+    )
+    if TIME_TOLERANCE:
+        max_time = baseline["time"] * (1 + float(TIME_TOLERANCE))
+        assert result["time"] <= max_time, (
+            f"{name} took {result['time']:.2f} ms, the baseline is "
+            f"{baseline['time']:.2f} ms."
+        )
+
+
+@pytest.fixture
+def graphql_benchmark(request):
+    """Measure an operation and compare it with its baseline.
+
+    The operation is executed once to warm up process-level caches, once to
+    count its SQL queries and then `ROUNDS` times to take the median wall-clock
+    time in milliseconds. The result of the first execution is returned.
+    """
+    name = request.node.name
+
+    def benchmark(operation: Callable[[], Any], rounds: int = ROUNDS) -> Any:
+        response = operation()
+        with record_queries() as query_log:
+            operation()
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            operation()
+            timings.append((time.perf_counter() - start) * 1000)
+        result = {
+            "queries": query_log.count,  # type: ignore
+            "time": round(statistics.median(timings), 2),
+        }
+        if UPDATE_BASELINES:
+            save_baseline(name, result)
+        else:
+            check_regressions(name, result, load_baselines().get(name))
+        return response
+
+    return benchmark
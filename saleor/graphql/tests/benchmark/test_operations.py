@@ -0,0 +1,381 @@
+import graphene
+import pytest
+
+from ..utils import get_graphql_content
+
+FRAGMENT_PRICE = """
+    fragment Price on TaxedMoney {
+        gross {
+            amount
+            currency
+        }
+        net {
+            amount
+        }
+    }
+"""
+
+QUERY_STOREFRONT_PRODUCTS = (
+    FRAGMENT_PRICE
+    + """
+    query StorefrontProducts($channel: String) {
+        products(first: 20, channel: $channel) {
+            totalCount
+            edges {
+                node {
+                    id
+                    name
+                    slug
+                    thumbnail {
+                        url
+                    }
+                    category {
+                        id
+                        name
+                    }
+                    isAvailable
+                    pricing {
+                        onSale
+                        priceRange {
+                            start {
+                                ...Price
+                            }
+                            stop {
+                                ...Price
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+)
+
+
+@pytest.mark.django_db
+def test_storefront_products(
+    api_client, product_list, channel_USD, graphql_benchmark
+):
+    variables = {"channel": channel_USD.slug}
+
+    response = graphql_benchmark(
+        lambda: api_client.post_graphql(QUERY_STOREFRONT_PRODUCTS, variables)
+    )
+
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == len(product_list)
+
+
+QUERY_STOREFRONT_PRODUCT_DETAILS = (
+    FRAGMENT_PRICE
+    + """
+    query StorefrontProductDetails($slug: String, $channel: String) {
+        product(slug: $slug, channel: $channel) {
+            id
+            name
+            description
+            productType {
+                id
+                name
+            }
+            pricing {
+                priceRange {
+                    start {
+                        ...Price
+                    }
+                }
+            }
+            variants {
+                id
+                name
+                sku
+                quantityAvailable
+                pricing {
+                    onSale
+                    price {
+                        ...Price
+                    }
+                }
+                attributes {
+                    attribute {
+                        name
+                    }
+                    values {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+)
+
+
+@pytest.mark.django_db
+def test_storefront_product_details(
+    api_client, product, channel_USD, graphql_benchmark
+):
+    variables = {"slug": product.slug, "channel": channel_USD.slug}
+
+    response = graphql_benchmark(
+        lambda: api_client.post_graphql(QUERY_STOREFRONT_PRODUCT_DETAILS, variables)
+    )
+
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["name"] == product.name
+
+
+QUERY_STOREFRONT_CHECKOUT = (
+    FRAGMENT_PRICE
+    + """
+    query StorefrontCheckout($token: UUID) {
+        checkout(token: $token) {
+            token
+            email
+            lines {
+                id
+                quantity
+                totalPrice {
+                    ...Price
+                }
+                variant {
+                    id
+                    name
+                    product {
+                        name
+                    }
+                }
+            }
+            subtotalPrice {
+                ...Price
+            }
+            totalPrice {
+                ...Price
+            }
+            availableShippingMethods {
+                id
+                name
+            }
+            availablePaymentGateways {
+                id
+                name
+            }
+        }
+    }
+"""
+)
+
+
+@pytest.mark.django_db
+def test_storefront_checkout(api_client, checkout_with_items, graphql_benchmark):
+    variables = {"token": str(checkout_with_items.token)}
+
+    response = graphql_benchmark(
+        lambda: api_client.post_graphql(QUERY_STOREFRONT_CHECKOUT, variables)
+    )
+
+    content = get_graphql_content(response)
+    lines = content["data"]["checkout"]["lines"]
+    assert len(lines) == checkout_with_items.lines.count()
+
+
+QUERY_STOREFRONT_ME = (
+    FRAGMENT_PRICE
+    + """
+    query StorefrontMe {
+        me {
+            id
+            email
+            defaultShippingAddress {
+                city
+                country {
+                    code
+                }
+            }
+            orders(first: 10) {
+                edges {
+                    node {
+                        id
+                        number
+                        status
+                        total {
+                            ...Price
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+)
+
+
+@pytest.mark.django_db
+def test_storefront_me(user_api_client, order_list, graphql_benchmark):
+    response = graphql_benchmark(
+        lambda: user_api_client.post_graphql(QUERY_STOREFRONT_ME)
+    )
+
+    content = get_graphql_content(response)
+    assert len(content["data"]["me"]["orders"]["edges"]) == len(order_list)
+
+
+QUERY_DASHBOARD_ORDERS = (
+    FRAGMENT_PRICE
+    + """
+    query DashboardOrders {
+        orders(first: 20) {
+            totalCount
+            edges {
+                node {
+                    id
+                    number
+                    created
+                    status
+                    paymentStatus
+                    userEmail
+                    billingAddress {
+                        firstName
+                        lastName
+                    }
+                    total {
+                        ...Price
+                    }
+                }
+            }
+        }
+    }
+"""
+)
+
+
+@pytest.mark.django_db
+def test_dashboard_orders(
+    staff_api_client, permission_manage_orders, order_list, graphql_benchmark
+):
+    staff_api_client.user.user_permissions.add(permission_manage_orders)
+
+    response = graphql_benchmark(
+        lambda: staff_api_client.post_graphql(QUERY_DASHBOARD_ORDERS)
+    )
+
+    content = get_graphql_content(response)
+    assert content["data"]["orders"]["totalCount"] == len(order_list)
+
+
+QUERY_DASHBOARD_ORDER_DETAILS = (
+    FRAGMENT_PRICE
+    + """
+    query DashboardOrderDetails($id: ID!) {
+        order(id: $id) {
+            id
+            number
+            status
+            user {
+                email
+            }
+            lines {
+                id
+                productName
+                variantName
+                quantity
+                quantityFulfilled
+                unitPrice {
+                    ...Price
+                }
+                variant {
+                    id
+                    quantityAvailable
+                }
+            }
+            fulfillments {
+                id
+                status
+            }
+            events {
+                id
+                type
+            }
+            subtotal {
+                ...Price
+            }
+            total {
+                ...Price
+            }
+            totalCaptured {
+                amount
+            }
+        }
+    }
+"""
+)
+
+
+@pytest.mark.django_db
+def test_dashboard_order_details(
+    staff_api_client,
+    permission_manage_orders,
+    permission_manage_users,
+    order_with_lines,
+    graphql_benchmark,
+):
+    staff_api_client.user.user_permissions.add(
+        permission_manage_orders, permission_manage_users
+    )
+    variables = {"id": graphene.Node.to_global_id("Order", order_with_lines.pk)}
+
+    response = graphql_benchmark(
+        lambda: staff_api_client.post_graphql(QUERY_DASHBOARD_ORDER_DETAILS, variables)
+    )
+
+    content = get_graphql_content(response)
+    assert len(content["data"]["order"]["lines"]) == order_with_lines.lines.count()
+
+
+QUERY_DASHBOARD_PRODUCTS = """
+    query DashboardProducts($channel: String) {
+        products(first: 20, channel: $channel) {
+            totalCount
+            edges {
+                node {
+                    id
+                    name
+                    thumbnail {
+                        url
+                    }
+                    productType {
+                        id
+                        name
+                        hasVariants
+                    }
+                    channelListings {
+                        isPublished
+                        channel {
+                            slug
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+def test_dashboard_products(
+    staff_api_client,
+    permission_manage_products,
+    product_list,
+    channel_USD,
+    graphql_benchmark,
+):
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"channel": channel_USD.slug}
+
+    response = graphql_benchmark(
+        lambda: staff_api_client.post_graphql(QUERY_DASHBOARD_PRODUCTS, variables)
+    )
+
+    content = get_graphql_content(response)
+    assert content["data"]["products"]["totalCount"] == len(product_list)
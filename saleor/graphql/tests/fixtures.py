@@ -11,6 +11,7 @@ from django.test.client import MULTIPART_CONTENT, Client
 from ...account.models import User
 from ...core.jwt import create_access_token
 from ...tests.utils import flush_post_commit_hooks
+from ..document_cache import document_cache
 from ..views import handled_errors_logger, unhandled_errors_logger
 from .utils import assert_no_permission
 
@@ -116,6 +117,11 @@ class ApiClient(Client):
         return super().post(API_PATH, *args, **kwargs)
 
 
+@pytest.fixture(autouse=True)
+def clear_document_cache():
+    document_cache.clear()
+
+
 @pytest.fixture
 def app_api_client(app):
     return ApiClient(app=app)
@@ -1,7 +1,11 @@
 import json
+from contextlib import contextmanager
+from typing import Optional
 
 from django.core.serializers.json import DjangoJSONEncoder
 
+from ..query_budget import record_queries
+
 
 def get_graphql_content_from_response(response):
     return json.loads(response.content.decode("utf8"))
@@ -53,3 +57,16 @@ def get_multipart_request_body(query, variables, file, file_name):
         "map": json.dumps({file_name: ["variables.file"]}, cls=DjangoJSONEncoder),
         file_name: file,
     }
+
+
+@contextmanager
+def assert_query_budget(max_queries: int, max_repeats: Optional[int] = None):
+    """Fail if the block executes more SQL queries than the budget.
+
+    With `max_repeats`, it also fails when a single resolver executes the same
+    query more times than that, which usually means an N+1 problem.
+    """
+    with record_queries() as query_log:
+        yield query_log
+    problems = query_log.get_problems(max_queries, max_repeats)  # type: ignore
+    assert not problems, "\n".join(problems)
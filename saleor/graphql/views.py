@@ -1,18 +1,25 @@
+import asyncio
+import copy
 import fnmatch
 import json
 import logging
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial, update_wrapper
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import opentracing
 import opentracing.tags
 from django.conf import settings
-from django.db import connection
+from django.db import close_old_connections, connection
 from django.db.backends.postgresql.base import DatabaseWrapper
-from django.http import HttpRequest, HttpResponseNotAllowed, JsonResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
 from django.shortcuts import render
 from django.urls import reverse
 from django.utils.functional import SimpleLazyObject
+from django.utils.module_loading import import_string
 from django.views.generic import View
 from graphene_django.settings import graphene_settings
 from graphene_django.views import instantiate_middleware
@@ -23,10 +30,27 @@ from graphql.error import (
     format_error as format_graphql_error,
 )
 from graphql.execution import ExecutionResult
+from graphql.language.ast import OperationDefinition
+from graphql.utils.get_operation_ast import get_operation_ast
 from jwt.exceptions import PyJWTError
 
+from ..checkout.price_context import checkout_price_context
 from ..core.exceptions import PermissionDenied, ReadOnlyException
+from ..core.tracing import get_tracer, is_sampled, sampling, should_sample_request
 from ..core.utils import is_valid_ipv4, is_valid_ipv6
+from .coalescing import coalescer
+from .dataloader_metrics import pop_loader_stats, report_loader_stats
+from .document_cache import document_cache
+from .encoders import ResponseEncoder, get_response_encoder
+from .persisted_queries import (
+    PersistedQueryError,
+    PersistedQueryNotFound,
+    resolve_persisted_query,
+)
+from .query_budget import check_query_budget, is_query_budget_enabled, record_queries
+from .query_cost import QueryCostError, calculate_query_cost, validate_query_cost
+from .resolver_tracing import ResolverTracer, is_tracing_requested, trace_resolvers
+from .response_cache import response_cache
 
 API_PATH = SimpleLazyObject(lambda: reverse("api"))
 
@@ -45,6 +69,40 @@ def tracing_wrapper(execute, sql, params, many, context):
         return execute(sql, params, many, context)
 
 
+# Request attributes holding the state of the executed operation, e.g. the
+# dataloaders with their stats and the totalCount strategies
+OPERATION_REQUEST_ATTRIBUTES = ("dataloaders", "total_count_strategies")
+
+_batch_executor: Optional[ThreadPoolExecutor] = None
+_batch_executor_lock = threading.Lock()
+
+
+def get_batch_executor() -> ThreadPoolExecutor:
+    global _batch_executor
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            _batch_executor = ThreadPoolExecutor(
+                max_workers=settings.GRAPHQL_BATCH_MAX_WORKERS,
+                thread_name_prefix="graphql-batch",
+            )
+        return _batch_executor
+
+
+_async_executor: Optional[ThreadPoolExecutor] = None
+_async_executor_lock = threading.Lock()
+
+
+def get_async_executor() -> ThreadPoolExecutor:
+    global _async_executor
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = ThreadPoolExecutor(
+                max_workers=settings.GRAPHQL_ASYNC_MAX_WORKERS,
+                thread_name_prefix="graphql-async",
+            )
+        return _async_executor
+
+
 class GraphQLView(View):
     # This class is our implementation of `graphene_django.views.GraphQLView`,
     # which was extended to support the following features:
@@ -58,12 +116,21 @@ class GraphQLView(View):
     executor = None
     backend = None
     middleware = None
+    operation_middleware = None
     root_value = None
+    response_encoder: Optional[ResponseEncoder] = None
 
     HANDLED_EXCEPTIONS = (GraphQLError, PyJWTError, ReadOnlyException, PermissionDenied)
 
     def __init__(
-        self, schema=None, executor=None, middleware=None, root_value=None, backend=None
+        self,
+        schema=None,
+        executor=None,
+        middleware=None,
+        root_value=None,
+        backend=None,
+        response_encoder=None,
+        operation_middleware=None,
     ):
         super().__init__()
         if schema is None:
@@ -75,19 +142,27 @@ class GraphQLView(View):
         self.schema = self.schema or schema
         if middleware is not None:
             self.middleware = list(instantiate_middleware(middleware))
+        if operation_middleware is None:
+            operation_middleware = settings.GRAPHQL_OPERATION_MIDDLEWARE
+        self.operation_middleware = [
+            import_string(hook) if isinstance(hook, str) else hook
+            for hook in operation_middleware
+        ]
         self.executor = executor
         self.root_value = root_value
         self.backend = backend
+        if response_encoder is not None:
+            self.response_encoder = response_encoder
 
     def dispatch(self, request, *args, **kwargs):
         # Handle options method the GraphQlView restricts it.
-        if request.method == "GET":
+        if request.method == "GET" and not self.is_get_query(request):
             if settings.PLAYGROUND_ENABLED:
                 return self.render_playground(request)
             return HttpResponseNotAllowed(["OPTIONS", "POST"])
         if request.method == "OPTIONS":
             response = self.options(request, *args, **kwargs)
-        elif request.method == "POST":
+        elif request.method in ("GET", "POST"):
             response = self.handle_query(request)
         else:
             return HttpResponseNotAllowed(["GET", "OPTIONS", "POST"])
@@ -109,26 +184,58 @@ class GraphQLView(View):
     def render_playground(self, request):
         return render(request, "graphql/playground.html", {})
 
-    def _handle_query(self, request: HttpRequest) -> JsonResponse:
+    @staticmethod
+    def is_get_query(request: HttpRequest) -> bool:
+        """Check if a GET request carries a query, e.g. a persisted query hash.
+
+        Queries are executed from GET requests only with persisted queries enabled.
+        """
+        if not settings.GRAPHQL_PERSISTED_QUERIES_ENABLED:
+            return False
+        return "query" in request.GET or "extensions" in request.GET
+
+    def encode_response(self, data: Any) -> bytes:
+        """Serialize the response data with the configured encoder.
+
+        The encoder is a callable returning bytes, it's set either on the view or
+        by a dotted path in the `GRAPHQL_RESPONSE_ENCODER` setting.
+        """
+        encoder = self.response_encoder or get_response_encoder(
+            settings.GRAPHQL_RESPONSE_ENCODER
+        )
+        return encoder(data)
+
+    def get_json_response(self, data: Any, status: int = 200) -> HttpResponse:
+        return HttpResponse(
+            self.encode_response(data), status=status, content_type="application/json"
+        )
+
+    def _handle_query(self, request: HttpRequest) -> HttpResponse:
         try:
             data = self.parse_body(request)
         except ValueError:
-            return JsonResponse(
-                data={"errors": [self.format_error("Unable to parse query.")]},
-                status=400,
+            return self.get_json_response(
+                {"errors": [self.format_error("Unable to parse query.")]}, status=400
             )
 
         if isinstance(data, list):
-            responses = [self.get_response(request, entry) for entry in data]
+            responses = self.get_batch_responses(request, data)
             result: Union[list, Optional[dict]] = [
                 response for response, code in responses
             ]
             status_code = max((code for response, code in responses), default=200)
         else:
             result, status_code = self.get_response(request, data)
-        return JsonResponse(data=result, status=status_code, safe=False)
+        return self.get_json_response(result, status=status_code)
 
-    def handle_query(self, request: HttpRequest) -> JsonResponse:
+    def handle_query(self, request: HttpRequest) -> HttpResponse:
+        sampled = should_sample_request(request)
+        with sampling(sampled):
+            if not sampled:
+                return self._handle_query(request)
+            return self._handle_traced_query(request)
+
+    def _handle_traced_query(self, request: HttpRequest) -> HttpResponse:
         with opentracing.global_tracer().start_active_span("http") as scope:
             span = scope.span
             span.set_tag(opentracing.tags.COMPONENT, "http")
@@ -175,12 +282,102 @@ class GraphQLView(View):
                 status_code = 400
             else:
                 response["data"] = execution_result.data
+            if execution_result.extensions:
+                response["extensions"] = execution_result.extensions
             result: Optional[Dict[str, List[Any]]] = response
         else:
             result = None
 
         return result, status_code
 
+    def get_batch_responses(
+        self, request: HttpRequest, data: list
+    ) -> List[Tuple[Optional[Dict[str, List[Any]]], int]]:
+        """Execute all entries of a batched request.
+
+        Entries share the request and therefore its dataloaders; the loaders are
+        dropped after a mutation, so later entries never read stale data.
+        Identical queries which are not separated by a mutation are executed only
+        once. When the batch contains only
+        queries and `GRAPHQL_BATCH_MAX_WORKERS` is greater than 1, the entries
+        are executed concurrently on a thread pool, each with its own copy of
+        the request, as dataloaders aren't thread-safe.
+        """
+        operation_types = [self.get_entry_operation_type(request, e) for e in data]
+        unique_entries: Dict[str, int] = {}
+        entry_indexes = []
+        for index, (entry, operation_type) in enumerate(zip(data, operation_types)):
+            if operation_type == "query":
+                key = json.dumps(entry, sort_keys=True, default=str)
+                entry_indexes.append(unique_entries.setdefault(key, index))
+            else:
+                # Queries sent after a mutation may return different results
+                unique_entries.clear()
+                entry_indexes.append(index)
+
+        to_execute = sorted(set(entry_indexes))
+        read_only = all(operation_type == "query" for operation_type in operation_types)
+        if read_only and len(to_execute) > 1 and settings.GRAPHQL_BATCH_MAX_WORKERS > 1:
+            executor = get_batch_executor()
+            futures = {
+                index: executor.submit(
+                    self._get_response_in_thread,
+                    self.get_entry_request(request),
+                    data[index],
+                    is_sampled(),
+                )
+                for index in to_execute
+            }
+            responses = {index: future.result() for index, future in futures.items()}
+        else:
+            responses = {}
+            for index in to_execute:
+                responses[index] = self.get_response(request, data[index])
+                if operation_types[index] != "query":
+                    request.__dict__.pop("dataloaders", None)
+        return [responses[index] for index in entry_indexes]
+
+    @staticmethod
+    def get_entry_request(request: HttpRequest) -> HttpRequest:
+        """Return a copy of the request without the state of its operations."""
+        entry_request = copy.copy(request)
+        for name in OPERATION_REQUEST_ATTRIBUTES:
+            entry_request.__dict__.pop(name, None)
+        return entry_request
+
+    def _get_response_in_thread(self, request: HttpRequest, data: dict, sampled: bool):
+        try:
+            with sampling(sampled):
+                return self.get_response(request, data)
+        finally:
+            # Worker threads open their own database connections
+            connection.close()
+
+    def get_entry_operation_type(
+        self, request: HttpRequest, data: dict
+    ) -> Optional[str]:
+        """Return the operation type of a batch entry or None if it's unknown."""
+        if not isinstance(data, dict):
+            return None
+        query, _variables, operation_name = self.get_graphql_params(request, data)
+        if not query or not isinstance(query, str):
+            return None
+        try:
+            document, errors = document_cache.get_document(
+                self.backend, self.schema, query
+            )
+        except (ValueError, GraphQLSyntaxError):
+            return None
+        if errors:
+            return None
+        return document.get_operation_type(operation_name)
+
+    @staticmethod
+    def trace_sql_queries():
+        if not is_sampled():
+            return nullcontext()
+        return connection.execute_wrapper(tracing_wrapper)
+
     def get_root_value(self):
         return self.root_value
 
@@ -192,6 +389,9 @@ class GraphQLView(View):
         If no query was given or query is not a string, it returns an error.
         If the query is invalid, it returns an error as well.
         Otherwise, it returns the parsed gql document.
+
+        Parsed and validated documents are kept in a process-local LRU cache, so
+        repeated queries skip both steps.
         """
         if not query or not isinstance(query, str):
             return (
@@ -203,54 +403,191 @@ class GraphQLView(View):
 
         # Attempt to parse the query, if it fails, return the error
         try:
-            return (
-                self.backend.document_from_string(  # type: ignore
-                    self.schema, query
-                ),
-                None,
+            document, validation_errors = document_cache.get_document(
+                self.backend, self.schema, query
             )
         except (ValueError, GraphQLSyntaxError) as e:
             return None, ExecutionResult(errors=[e], invalid=True)
 
+        if validation_errors:
+            return None, ExecutionResult(errors=validation_errors, invalid=True)
+        return document, None
+
     def execute_graphql_request(self, request: HttpRequest, data: dict):
-        with opentracing.global_tracer().start_active_span("graphql_query") as scope:
+        # Tags of the no-op span of requests which aren't sampled are discarded
+        sampled = is_sampled()
+        with get_tracer().start_active_span("graphql_query") as scope:
             span = scope.span
-            span.set_tag(opentracing.tags.COMPONENT, "GraphQL")
+            if sampled:
+                span.set_tag(opentracing.tags.COMPONENT, "GraphQL")
 
             query, variables, operation_name = self.get_graphql_params(request, data)
+            try:
+                query = resolve_persisted_query(query, data.get("extensions"))
+            except PersistedQueryNotFound as e:
+                return ExecutionResult(errors=[e])
+            except PersistedQueryError as e:
+                return ExecutionResult(errors=[e], invalid=True)
 
             document, error = self.parse_query(query)
             if error:
                 return error
 
-            if document is not None:
-                raw_query_string = document.document_string[
-                    : settings.OPENTRACING_MAX_QUERY_LENGTH_LOG
-                ]
-                span.set_tag("graphql.query", raw_query_string)
-
-            extra_options: Dict[str, Optional[Any]] = {}
-
-            if self.executor:
-                # We only include it optionally since
-                # executor is not a valid argument in all backends
-                extra_options["executor"] = self.executor
+            operation_type = document.get_operation_type(  # type: ignore
+                operation_name
+            )
+            if request.method == "GET" and operation_type != "query":
+                return ExecutionResult(
+                    errors=[
+                        GraphQLError(
+                            "Can only perform a query operation from a GET request."
+                        )
+                    ],
+                    invalid=True,
+                )
+
+            operation = get_operation_ast(
+                document.document_ast, operation_name  # type: ignore
+            )
             try:
-                with connection.execute_wrapper(tracing_wrapper):
-                    return document.execute(  # type: ignore
-                        root=self.get_root_value(),
-                        variables=variables,
-                        operation_name=operation_name,
-                        context=request,
-                        middleware=self.middleware,
-                        **extra_options,
-                    )
+                self.run_operation_middleware(request, operation)
             except Exception as e:
+                return ExecutionResult(errors=[e])
+
+            query_cost = calculate_query_cost(
+                document.document_ast, operation_name, variables  # type: ignore
+            )
+            extensions = {
+                "cost": {
+                    "requestedQueryCost": query_cost.cost,
+                    "depth": query_cost.depth,
+                }
+            }
+            try:
+                validate_query_cost(request, query_cost)
+            except QueryCostError as e:
+                return ExecutionResult(errors=[e], invalid=True, extensions=extensions)
+            except self.HANDLED_EXCEPTIONS as e:
+                # Requestors are authenticated to get their limit, e.g. the token
+                # may have expired
+                return ExecutionResult(errors=[e], extensions=extensions)
+
+            cache_key = None
+            if operation_type == "query":
+                cache_key = response_cache.get_cache_key(
+                    request, query, variables, operation_name  # type: ignore
+                )
+            if cache_key:
+                cached_data = response_cache.get(cache_key)
+                if sampled:
+                    span.set_tag("graphql.response_cache.hit", cached_data is not None)
+                if cached_data is not None:
+                    return ExecutionResult(data=cached_data, extensions=extensions)
+
+            coalesce_key = None
+            if operation_type == "query":
+                coalesce_key = coalescer.get_key(
+                    request, query, variables, operation_name  # type: ignore
+                )
+            with coalescer.coalesce(coalesce_key) as flight:
+                if flight.data is not None:
+                    if sampled:
+                        span.set_tag("graphql.coalesced", True)
+                    return ExecutionResult(data=flight.data, extensions=extensions)
+                result = self.execute_document(
+                    request,
+                    span,
+                    document,  # type: ignore
+                    variables,
+                    operation_name,
+                    cache_key,
+                    extensions,
+                )
+                if not result.errors and not result.invalid:
+                    flight.share(result.data)
+            return result
+
+    def execute_document(
+        self,
+        request: HttpRequest,
+        span: opentracing.Span,
+        document: GraphQLDocument,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        cache_key: Optional[str],
+        extensions: Dict[str, Any],
+    ) -> ExecutionResult:
+        sampled = is_sampled()
+        if sampled:
+            raw_query_string = document.document_string[
+                : settings.OPENTRACING_MAX_QUERY_LENGTH_LOG
+            ]
+            span.set_tag("graphql.query", raw_query_string)
+
+        extra_options: Dict[str, Optional[Any]] = {}
+
+        if self.executor:
+            # We only include it optionally since
+            # executor is not a valid argument in all backends
+            extra_options["executor"] = self.executor
+        tracer = ResolverTracer() if is_tracing_requested(request) else None
+        price_context = (
+            checkout_price_context()
+            if settings.CHECKOUT_PRICE_CONTEXT_ENABLED
+            else nullcontext()
+        )
+        try:
+            with self.trace_sql_queries():
+                with record_queries(is_query_budget_enabled()) as query_log:
+                    with response_cache.record_queries(cache_key) as recorder:
+                        with trace_resolvers(tracer), price_context:
+                            result = document.execute(  # type: ignore
+                                root=self.get_root_value(),
+                                variables=variables,
+                                operation_name=operation_name,
+                                context=request,
+                                middleware=self.middleware,
+                                **extra_options,
+                            )
+        except Exception as e:
+            if sampled:
                 span.set_tag(opentracing.tags.ERROR, True)
-                return ExecutionResult(errors=[e], invalid=True)
+            return ExecutionResult(errors=[e], invalid=True, extensions=extensions)
+        if query_log:
+            check_query_budget(query_log, operation_name)
+        total_count_strategies = request.__dict__.pop("total_count_strategies", None)
+        if total_count_strategies:
+            extensions["totalCount"] = total_count_strategies
+        if recorder and not result.errors and not result.invalid:
+            response_cache.set(cache_key, result.data, recorder)  # type: ignore
+        loader_stats = pop_loader_stats(request)
+        report_loader_stats(loader_stats)
+        if loader_stats and (settings.DEBUG or tracer):
+            extensions["dataloaders"] = loader_stats
+        if tracer:
+            extensions["tracing"] = tracer.get_result()
+        result.extensions.update(extensions)
+        return result
+
+    def run_operation_middleware(
+        self, request: HttpRequest, operation: Optional[OperationDefinition]
+    ):
+        """Run checks which depend only on the request and the operation.
+
+        Hooks run once per operation, so they don't add to the cost of resolving
+        every field like the graphene middleware does.
+        """
+        for hook in self.operation_middleware:  # type: ignore
+            hook(request, operation)
 
     @staticmethod
     def parse_body(request: HttpRequest):
+        if request.method == "GET":
+            data: Dict[str, Any] = request.GET.dict()
+            for key in ("variables", "extensions"):
+                if isinstance(data.get(key), str):
+                    data[key] = json.loads(data[key])
+            return data
         content_type = request.content_type
         if content_type == "application/graphql":
             return {"query": request.body.decode("utf-8")}
@@ -297,7 +634,10 @@ class GraphQLView(View):
         else:
             unhandled_errors_logger.error("A query failed unexpectedly", exc_info=exc)
 
-        result["extensions"] = {"exception": {"code": type(exc).__name__}}
+        result["extensions"] = {
+            **result.get("extensions", {}),
+            "exception": {"code": type(exc).__name__},
+        }
         if settings.DEBUG:
             lines = []
 
@@ -310,6 +650,43 @@ class GraphQLView(View):
         return result
 
 
+class AsyncGraphQLView(GraphQLView):
+    """GraphQL view for ASGI servers.
+
+    Requests are executed on a bounded thread pool (`GRAPHQL_ASYNC_MAX_WORKERS`),
+    so the event loop keeps accepting requests while the ORM, payment gateways
+    and tax APIs block the workers. All `MIDDLEWARE` must support async
+    handlers; a sync-only middleware makes Django handle the requests one at
+    a time on a single thread.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+
+        async def async_view(request, *args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                get_async_executor(),
+                partial(cls._run_in_thread, view, request, *args, **kwargs),
+            )
+
+        update_wrapper(async_view, view)
+        # Wrapping the coroutine with `csrf_exempt` would make it synchronous
+        async_view.csrf_exempt = True  # type: ignore
+        return async_view
+
+    @staticmethod
+    def _run_in_thread(view, request, *args, **kwargs):
+        # Pool threads keep their database connections between requests, they
+        # are closed when broken or older than CONN_MAX_AGE
+        close_old_connections()
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+
 def get_key(key):
     try:
         int_key = int(key)
@@ -178,6 +178,12 @@ class Order(ModelWithMetadata):
     class Meta:
         ordering = ("-pk",)
         permissions = ((OrderPermissions.MANAGE_ORDERS.codename, "Manage orders."),)
+        indexes = [
+            # Used by the cursor-based pagination of orders sorted by creation date
+            models.Index(
+                fields=["created", "status", "id"], name="order_created_sort_idx"
+            )
+        ]
 
     def save(self, *args, **kwargs):
         if not self.token:
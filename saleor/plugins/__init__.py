@@ -1,8 +1,42 @@
-import importlib
+import importlib.util
+import os
 from typing import List
 
 from .checks import check_plugins  # NOQA: F401
 
+default_app_config = "saleor.plugins.apps.PluginConfig"
+
+
+def get_plugin_package(module_path: str) -> str:
+    """Return the package of a plugin module without importing the module.
+
+    Plugin modules import the SDKs of their services, so importing them only to
+    read `__package__` would load every SDK when the Celery worker boots.
+    """
+    parent, _, name = module_path.rpartition(".")
+    if not parent:
+        return module_path
+    spec = importlib.util.find_spec(parent)
+    if spec is None:
+        raise ImportError("No module named %s" % module_path)
+    for location in spec.submodule_search_locations or []:
+        if os.path.isdir(os.path.join(location, name)):
+            return module_path
+    return parent
+
+
+def has_module(package: str, name: str) -> bool:
+    """Check if a package contains a module without executing the package."""
+    spec = importlib.util.find_spec(package)
+    if spec is None:
+        return False
+    for location in spec.submodule_search_locations or []:
+        if os.path.exists(os.path.join(location, f"{name}.py")) or os.path.isdir(
+            os.path.join(location, name)
+        ):
+            return True
+    return False
+
 
 def discover_plugins_modules(plugins: List[str]):
     plugins_modules = []
@@ -14,6 +48,5 @@ def discover_plugins_modules(plugins: List[str]):
                 "%s doesn't look like a module path" % dotted_path
             ) from err
 
-        module = importlib.import_module(module_path)
-        plugins_modules.append(module.__package__)
+        plugins_modules.append(get_plugin_package(module_path))
     return plugins_modules
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class PluginConfig(AppConfig):
+    name = "saleor.plugins"
+
+    def ready(self):
+        from .manager import connect_invalidation_signals
+
+        connect_invalidation_signals()
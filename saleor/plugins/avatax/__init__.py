@@ -14,6 +14,7 @@ from requests.auth import HTTPBasicAuth
 
 from ...checkout import base_calculations
 from ...core.taxes import TaxError
+from .client import avatax_client
 
 if TYPE_CHECKING:
     # flake8: noqa
@@ -81,7 +82,9 @@ def api_post_request(
     response = None
     try:
         auth = HTTPBasicAuth(config.username_or_account, config.password_or_license)
-        response = requests.post(url, auth=auth, data=json.dumps(data), timeout=TIMEOUT)
+        response = avatax_client.post(
+            url, auth=auth, data=json.dumps(data), timeout=TIMEOUT
+        )
         logger.debug("Hit to Avatax to calculate taxes %s", url)
         json_response = response.json()
         if "error" in response:  # type: ignore
@@ -105,7 +108,7 @@ def api_get_request(
     response = None
     try:
         auth = HTTPBasicAuth(username_or_account, password_or_license)
-        response = requests.get(url, auth=auth, timeout=TIMEOUT)
+        response = avatax_client.get(url, auth=auth, timeout=TIMEOUT)
         json_response = response.json()
         logger.debug("[GET] Hit to %s", url)
         if "error" in json_response:  # type: ignore
@@ -0,0 +1,117 @@
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+API_PATH_PREFIX = "/api/v2/"
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_session() -> requests.Session:
+    # Only idempotent methods are retried by default, so a tax transaction
+    # isn't created twice when Avatax doesn't respond to a POST request
+    retry = Retry(
+        total=settings.AVATAX_HTTP_MAX_RETRIES,
+        backoff_factor=settings.AVATAX_HTTP_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.AVATAX_HTTP_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_endpoint(method: str, url: str) -> str:
+    path = urlsplit(url).path
+    if path.startswith(API_PATH_PREFIX):
+        path = path[len(API_PATH_PREFIX) :]
+    return f"{method} {path}"
+
+
+class AvataxClient:
+    """Process-wide HTTP session for the Avatax API.
+
+    Requests reuse the pooled keep-alive connections, so a tax calculation
+    doesn't pay for a new TCP and TLS handshake. A forked process, e.g. a Celery
+    worker, creates its own session instead of sharing the parent's sockets.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._pid: Optional[int] = None
+        self._latency: Dict[str, Dict[str, float]] = {}
+
+    def get_session(self) -> requests.Session:
+        pid = os.getpid()
+        with self._lock:
+            if self._session is None or self._pid != pid:
+                self._session = create_session()
+                self._pid = pid
+            return self._session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        session = self.get_session()
+        start = time.monotonic()
+        failed = True
+        try:
+            response = session.request(method, url, **kwargs)
+            failed = False
+            return response
+        finally:
+            self.record_latency(
+                get_endpoint(method, url), time.monotonic() - start, failed
+            )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def record_latency(self, endpoint: str, duration: float, failed: bool = False):
+        with self._lock:
+            stats = self._latency.setdefault(
+                endpoint, {"requests": 0, "errors": 0, "total": 0.0, "max": 0.0}
+            )
+            stats["requests"] += 1
+            stats["errors"] += int(failed)
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+
+    def close(self):
+        with self._lock:
+            if self._session is not None and self._pid == os.getpid():
+                self._session.close()
+            self._session = None
+            self._pid = None
+
+    def clear(self):
+        with self._lock:
+            self._latency.clear()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the number of requests and their latency in seconds by endpoint."""
+        with self._lock:
+            return {
+                endpoint: {
+                    **stats,
+                    "average": stats["total"] / stats["requests"],
+                }
+                for endpoint, stats in self._latency.items()
+            }
+
+
+avatax_client = AvataxClient()
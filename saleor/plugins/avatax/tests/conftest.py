@@ -0,0 +1,70 @@
+import json
+import threading
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ..client import avatax_client
+
+
+@pytest.fixture(autouse=True)
+def avatax_client_session():
+    # Pooled connections are bound to the cassette recorded by the test
+    yield avatax_client
+    avatax_client.close()
+    avatax_client.clear()
+
+
+class AvataxServerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.respond()
+
+    def do_POST(self):
+        self.respond()
+
+    def respond(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        server = self.server
+        path = self.path[len("/api/v2/") :]
+        server.requests.append((self.command, path, self.client_address, body))
+        responses = server.responses[path]
+        status, data = responses.pop(0) if responses else (404, {"error": {}})
+        content = data if isinstance(data, bytes) else json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def no_backoff(settings):
+    settings.AVATAX_HTTP_BACKOFF_FACTOR = 0
+
+
+@pytest.fixture
+def avatax_server():
+    """Run a local stand-in for the Avatax API.
+
+    Responses are queued by the API path, e.g.
+    `avatax_server.responses["utilities/ping"].append((200, {...}))`. Bytes are
+    sent as the raw response body.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AvataxServerHandler)
+    server.daemon_threads = True
+    server.responses = defaultdict(list)
+    server.requests = []
+    server.url = "http://127.0.0.1:%s/api/v2/" % server.server_port
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    avatax_client.close()
+    server.shutdown()
+    server.server_close()
@@ -1,11 +1,10 @@
 import datetime
-from json import JSONDecodeError
-from unittest.mock import Mock, patch
+from unittest.mock import patch
+from urllib.parse import urljoin
 
 import pytest
 from django.core.exceptions import ValidationError
 from prices import Money, TaxedMoney
-from requests import RequestException
 
 from ....checkout.utils import add_variant_to_checkout
 from ....core.prices import quantize_price
@@ -687,68 +686,58 @@ def test_get_tax_code_from_object_meta(product, settings, plugin_configuration):
     assert tax_type.description == "DESC"
 
 
-def test_api_get_request_handles_request_errors(product, monkeypatch):
-    mocked_response = Mock(side_effect=RequestException())
-    monkeypatch.setattr("saleor.plugins.avatax.requests.get", mocked_response)
-
+def test_api_get_request_handles_request_errors(no_backoff):
     config = AvataxConfiguration(
         username_or_account="test", password_or_license="test", use_sandbox=False,
     )
-    url = "https://www.avatax.api.com/some-get-path"
+    # Nothing listens on the port, so the connection is refused
+    url = "http://127.0.0.1:1/api/v2/some-get-path"
 
     response = api_get_request(
         url, config.username_or_account, config.password_or_license
     )
 
     assert response == {}
-    assert mocked_response.called
-
 
-def test_api_get_request_handles_json_errors(product, monkeypatch):
-    mocked_response = Mock(side_effect=JSONDecodeError("", "", 0))
-    monkeypatch.setattr("saleor.plugins.avatax.requests.get", mocked_response)
 
+def test_api_get_request_handles_json_errors(avatax_server):
+    avatax_server.responses["some-get-path"].append((200, b"Not JSON"))
     config = AvataxConfiguration(
         username_or_account="test", password_or_license="test", use_sandbox=False,
     )
-    url = "https://www.avatax.api.com/some-get-path"
+    url = urljoin(avatax_server.url, "some-get-path")
 
     response = api_get_request(
         url, config.username_or_account, config.password_or_license
     )
 
     assert response == {}
-    assert mocked_response.called
+    assert len(avatax_server.requests) == 1
 
 
-def test_api_post_request_handles_request_errors(product, monkeypatch):
-    mocked_response = Mock(side_effect=RequestException())
-    monkeypatch.setattr("saleor.plugins.avatax.requests.post", mocked_response)
-
+def test_api_post_request_handles_request_errors(no_backoff):
     config = AvataxConfiguration(
         username_or_account="test", password_or_license="test", use_sandbox=False,
     )
-    url = "https://www.avatax.api.com/some-get-path"
+    # Nothing listens on the port, so the connection is refused
+    url = "http://127.0.0.1:1/api/v2/some-post-path"
 
     response = api_post_request(url, {}, config)
 
-    assert mocked_response.called
     assert response == {}
 
 
-def test_api_post_request_handles_json_errors(product, monkeypatch):
-    mocked_response = Mock(side_effect=JSONDecodeError("", "", 0))
-    monkeypatch.setattr("saleor.plugins.avatax.requests.post", mocked_response)
-
+def test_api_post_request_handles_json_errors(avatax_server):
+    avatax_server.responses["some-post-path"].append((200, b"Not JSON"))
     config = AvataxConfiguration(
         username_or_account="test", password_or_license="test", use_sandbox=False,
     )
-    url = "https://www.avatax.api.com/some-get-path"
+    url = urljoin(avatax_server.url, "some-post-path")
 
     response = api_post_request(url, {}, config)
 
-    assert mocked_response.called
     assert response == {}
+    assert len(avatax_server.requests) == 1
 
 
 def test_get_order_request_data_checks_when_taxes_are_included_to_price(
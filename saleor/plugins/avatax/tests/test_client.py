@@ -0,0 +1,104 @@
+from urllib.parse import urljoin
+
+from .. import AvataxConfiguration, api_get_request, api_post_request
+from ..client import avatax_client
+
+
+def test_api_get_request_reuses_connection(avatax_server):
+    ping = {"authenticated": True}
+    avatax_server.responses["utilities/ping"] += [(200, ping), (200, ping)]
+    url = urljoin(avatax_server.url, "utilities/ping")
+
+    first_response = api_get_request(url, "test", "test")
+    second_response = api_get_request(url, "test", "test")
+
+    assert first_response == second_response == ping
+    first_request, second_request = avatax_server.requests
+    # Both requests were sent from the same client socket
+    assert first_request[2] == second_request[2]
+
+
+def test_api_get_request_retries_server_errors(avatax_server, no_backoff):
+    avatax_server.responses["utilities/ping"] += [
+        (503, {}),
+        (200, {"authenticated": True}),
+    ]
+    url = urljoin(avatax_server.url, "utilities/ping")
+
+    response = api_get_request(url, "test", "test")
+
+    assert response == {"authenticated": True}
+    assert len(avatax_server.requests) == 2
+
+
+def test_api_get_request_stops_retrying(avatax_server, no_backoff, settings):
+    settings.AVATAX_HTTP_MAX_RETRIES = 1
+    error = {"error": {"message": "Unavailable"}}
+    avatax_server.responses["utilities/ping"] += [(503, error)] * 3
+    url = urljoin(avatax_server.url, "utilities/ping")
+
+    response = api_get_request(url, "test", "test")
+
+    assert response == error
+    assert len(avatax_server.requests) == 2
+
+
+def test_api_post_request_is_not_retried(avatax_server, no_backoff):
+    error = {"error": {"message": "Unavailable"}}
+    avatax_server.responses["transactions/createoradjust"] += [
+        (503, error),
+        (200, {}),
+    ]
+    url = urljoin(avatax_server.url, "transactions/createoradjust")
+    config = AvataxConfiguration(username_or_account="test", password_or_license="")
+
+    response = api_post_request(url, {"createTransactionModel": {}}, config)
+
+    assert response == error
+    assert len(avatax_server.requests) == 1
+
+
+def test_avatax_client_records_latency_by_endpoint(avatax_server):
+    avatax_server.responses["utilities/ping"] += [(200, {})] * 2
+    avatax_server.responses["transactions/createoradjust"].append((200, {}))
+    config = AvataxConfiguration(username_or_account="test", password_or_license="")
+
+    api_get_request(urljoin(avatax_server.url, "utilities/ping"), "test", "test")
+    api_get_request(urljoin(avatax_server.url, "utilities/ping"), "test", "test")
+    api_post_request(
+        urljoin(avatax_server.url, "transactions/createoradjust"), {}, config
+    )
+
+    stats = avatax_client.get_stats()
+    assert set(stats) == {"GET utilities/ping", "POST transactions/createoradjust"}
+    ping_stats = stats["GET utilities/ping"]
+    assert ping_stats["requests"] == 2
+    assert ping_stats["errors"] == 0
+    assert 0 < ping_stats["average"] <= ping_stats["max"] <= ping_stats["total"]
+
+
+def test_avatax_client_records_failed_requests(no_backoff):
+    url = "http://127.0.0.1:1/api/v2/utilities/ping"
+
+    response = api_get_request(url, "test", "test")
+
+    assert response == {}
+    assert avatax_client.get_stats()["GET utilities/ping"]["errors"] == 1
+
+
+def test_avatax_client_session_uses_pool_size(settings):
+    settings.AVATAX_HTTP_POOL_SIZE = 3
+
+    session = avatax_client.get_session()
+
+    adapter = session.get_adapter("https://rest.avatax.com/api/v2/")
+    assert adapter._pool_maxsize == 3
+    assert avatax_client.get_session() is session
+
+
+def test_avatax_client_new_session_in_forked_process(monkeypatch):
+    session = avatax_client.get_session()
+
+    monkeypatch.setattr("saleor.plugins.avatax.client.os.getpid", lambda: -1)
+
+    assert avatax_client.get_session() is not session
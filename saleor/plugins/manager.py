@@ -1,19 +1,33 @@
+import inspect
+import threading
+import uuid
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import opentracing
+from django.apps import apps
 from django.conf import settings
+from django.core.cache import cache
 from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.http import HttpResponse, HttpResponseNotFound
 from django.utils.module_loading import import_string
 from django_countries.fields import Country
 from prices import Money, MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ..checkout import base_calculations
+from ..checkout.price_context import (
+    get_checkout_key,
+    get_checkout_line_key,
+    memoize_price,
+)
 from ..core.payments import PaymentInterface
 from ..core.prices import quantize_price
 from ..core.taxes import TaxType, zero_taxed_money
+from ..core.tracing import is_sampled
 from ..discount import DiscountInfo
+from .base_plugin import BasePlugin
 from .models import PluginConfiguration
 
 if TYPE_CHECKING:
@@ -32,7 +46,15 @@ if TYPE_CHECKING:
         TokenConfig,
     )
     from ..product.models import Product, ProductType
-    from .base_plugin import BasePlugin
+
+
+# Default implementations of the hooks, stored at import time so plugins patching
+# `BasePlugin` methods, e.g. in tests, are still run
+DEFAULT_HOOKS = {
+    name: value
+    for name, value in vars(BasePlugin).items()
+    if inspect.isfunction(value) and not name.startswith("_")
+}
 
 
 class PluginsManager(PaymentInterface):
@@ -53,20 +75,61 @@ class PluginsManager(PaymentInterface):
                 plugin_config = PluginClass.DEFAULT_CONFIGURATION
                 active = PluginClass.get_default_active()
             self.plugins.append(PluginClass(configuration=plugin_config, active=active))
+        # Prices calculated by managers with the same plugins are interchangeable
+        self.plugins_key = tuple(
+            (plugin.PLUGIN_ID, plugin.active) for plugin in self.plugins
+        )
+        # Hooks are dispatched only to the plugins implementing them
+        self.hook_plugins = {
+            hook: self._get_plugins_implementing(hook) for hook in DEFAULT_HOOKS
+        }
+
+    def _get_plugins_implementing(self, method_name: str) -> List["BasePlugin"]:
+        """Return the active plugins overriding the method of `BasePlugin`."""
+        default_method = DEFAULT_HOOKS.get(method_name)
+        return [
+            plugin
+            for plugin in self.get_active_plugins()
+            if getattr(type(plugin), method_name, NotImplemented)
+            not in (NotImplemented, default_method)
+        ]
 
     def __run_method_on_plugins(
         self, method_name: str, default_value: Any, *args, **kwargs
     ):
         """Try to run a method with the given name on each declared plugin."""
+        plugins = self.hook_plugins.get(method_name)
+        if plugins is None:
+            plugins = self.hook_plugins[method_name] = self._get_plugins_implementing(
+                method_name
+            )
+        if not plugins:
+            return default_value
+        if not is_sampled():
+            return self.__run_method_on_each_plugin(
+                plugins, method_name, default_value, *args, **kwargs
+            )
         with opentracing.global_tracer().start_active_span(
             f"ExtensionsManager.{method_name}"
         ):
-            value = default_value
-            for plugin in self.plugins:
-                value = self.__run_method_on_single_plugin(
-                    plugin, method_name, value, *args, **kwargs
-                )
-            return value
+            return self.__run_method_on_each_plugin(
+                plugins, method_name, default_value, *args, **kwargs
+            )
+
+    def __run_method_on_each_plugin(
+        self,
+        plugins: List["BasePlugin"],
+        method_name: str,
+        default_value: Any,
+        *args,
+        **kwargs,
+    ):
+        value = default_value
+        for plugin in plugins:
+            value = self.__run_method_on_single_plugin(
+                plugin, method_name, value, *args, **kwargs
+            )
+        return value
 
     def __run_method_on_single_plugin(
         self,
@@ -105,7 +168,18 @@ class PluginsManager(PaymentInterface):
         lines: Iterable["CheckoutLine"],
         discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
+        return memoize_price(
+            self.plugins_key,
+            lambda: get_checkout_key("total", checkout, lines, discounts),
+            lambda: self._calculate_checkout_total(checkout, lines, discounts),
+        )
 
+    def _calculate_checkout_total(
+        self,
+        checkout: "Checkout",
+        lines: Iterable["CheckoutLine"],
+        discounts: Iterable[DiscountInfo],
+    ) -> TaxedMoney:
         default_value = base_calculations.base_checkout_total(
             subtotal=self.calculate_checkout_subtotal(checkout, lines, discounts),
             shipping_price=self.calculate_checkout_shipping(checkout, lines, discounts),
@@ -124,6 +198,18 @@ class PluginsManager(PaymentInterface):
         checkout: "Checkout",
         lines: Iterable["CheckoutLine"],
         discounts: Iterable[DiscountInfo],
+    ) -> TaxedMoney:
+        return memoize_price(
+            self.plugins_key,
+            lambda: get_checkout_key("subtotal", checkout, lines, discounts),
+            lambda: self._calculate_checkout_subtotal(checkout, lines, discounts),
+        )
+
+    def _calculate_checkout_subtotal(
+        self,
+        checkout: "Checkout",
+        lines: Iterable["CheckoutLine"],
+        discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
         line_totals = [
             self.calculate_checkout_line_total(line, discounts, checkout.channel)
@@ -144,6 +230,18 @@ class PluginsManager(PaymentInterface):
         checkout: "Checkout",
         lines: Iterable["CheckoutLine"],
         discounts: Iterable[DiscountInfo],
+    ) -> TaxedMoney:
+        return memoize_price(
+            self.plugins_key,
+            lambda: get_checkout_key("shipping", checkout, lines, discounts),
+            lambda: self._calculate_checkout_shipping(checkout, lines, discounts),
+        )
+
+    def _calculate_checkout_shipping(
+        self,
+        checkout: "Checkout",
+        lines: Iterable["CheckoutLine"],
+        discounts: Iterable[DiscountInfo],
     ) -> TaxedMoney:
         default_value = base_calculations.base_checkout_shipping_price(checkout, lines)
         return quantize_price(
@@ -175,6 +273,20 @@ class PluginsManager(PaymentInterface):
         checkout_line: "CheckoutLine",
         discounts: Iterable[DiscountInfo],
         channel: "Channel",
+    ):
+        return memoize_price(
+            self.plugins_key,
+            lambda: get_checkout_line_key(checkout_line, discounts, channel),
+            lambda: self._calculate_checkout_line_total(
+                checkout_line, discounts, channel
+            ),
+        )
+
+    def _calculate_checkout_line_total(
+        self,
+        checkout_line: "CheckoutLine",
+        discounts: Iterable[DiscountInfo],
+        channel: "Channel",
     ):
         default_value = base_calculations.base_checkout_line_total(
             checkout_line, channel, discounts
@@ -542,6 +654,71 @@ class PluginsManager(PaymentInterface):
         )
 
 
+PLUGINS_CONFIGURATION_VERSION_KEY = "plugins_configuration_version"
+
+
+def get_configuration_version() -> str:
+    version = cache.get(PLUGINS_CONFIGURATION_VERSION_KEY)
+    if version is None:
+        # Another worker may set the version first, so it's read again
+        cache.add(PLUGINS_CONFIGURATION_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(PLUGINS_CONFIGURATION_VERSION_KEY)
+    return version
+
+
+def bump_configuration_version():
+    cache.set(PLUGINS_CONFIGURATION_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+class ManagerCache:
+    """Process-wide cache of plugins managers.
+
+    Building a manager imports every plugin and queries their configurations, so
+    a manager is reused by all requests of the process until the version of the
+    plugin configurations stored in the Django cache changes. The version is
+    bumped once a transaction saving or deleting a configuration is committed.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._managers: Dict[Tuple[str, ...], Tuple[str, PluginsManager]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, manager_path: str, plugins: List[str]) -> PluginsManager:
+        key = (manager_path, *plugins)
+        # The version is read before the configurations, so a change made while
+        # the manager is built is picked up by the next request
+        version = get_configuration_version()
+        with self._lock:
+            cached = self._managers.get(key)
+            if cached is not None and cached[0] == version:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        manager = import_string(manager_path)(plugins)
+        with self._lock:
+            self._managers[key] = (version, manager)
+        return manager
+
+    def clear(self):
+        with self._lock:
+            self._managers.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "managers": len(self._managers),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+manager_cache = ManagerCache()
+
+
 def get_plugins_manager(
     manager_path: str = None, plugins: List[str] = None
 ) -> PluginsManager:
@@ -549,5 +726,27 @@ def get_plugins_manager(
         manager_path = settings.PLUGINS_MANAGER
     if plugins is None:
         plugins = settings.PLUGINS
+    if settings.PLUGINS_MANAGER_CACHE_ENABLED:
+        return manager_cache.get(manager_path, plugins)
     manager = import_string(manager_path)
     return manager(plugins)
+
+
+def handle_configuration_change(sender, **kwargs):
+    # Bumping before the commit would let a concurrent request build a manager
+    # from the old configurations and cache it with the new version
+    transaction.on_commit(bump_configuration_version)
+
+
+def connect_invalidation_signals():
+    uid = "plugins_manager_cache"
+    post_save.connect(
+        handle_configuration_change, sender=PluginConfiguration, dispatch_uid=uid
+    )
+    post_delete.connect(
+        handle_configuration_change, sender=PluginConfiguration, dispatch_uid=uid
+    )
+    if apps.is_installed("django_prices_vatlayer"):
+        # The Vatlayer plugin keeps the rates it has read for its lifetime
+        VAT = apps.get_model("django_prices_vatlayer", "VAT")
+        post_save.connect(handle_configuration_change, sender=VAT, dispatch_uid=uid)
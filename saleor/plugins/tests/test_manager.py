@@ -1,18 +1,27 @@
 import json
 from decimal import Decimal
+from unittest import mock
 
 import pytest
+from django.core.cache import cache
 from django.http import HttpResponseNotFound, JsonResponse
 from django_countries.fields import Country
 from prices import Money, TaxedMoney
 
 from ...core.taxes import TaxType
 from ...payment.interface import PaymentGateway
-from ..manager import PluginsManager, get_plugins_manager
+from ...tests.utils import flush_post_commit_hooks
+from ..manager import (
+    PLUGINS_CONFIGURATION_VERSION_KEY,
+    PluginsManager,
+    get_plugins_manager,
+    manager_cache,
+)
 from ..models import PluginConfiguration
 from ..tests.sample_plugins import (
     ActiveDummyPaymentGateway,
     ActivePaymentGateway,
+    ActivePlugin,
     InactivePaymentGateway,
     PluginInactive,
     PluginSample,
@@ -27,6 +36,99 @@ def test_get_plugins_manager():
     assert len(manager.plugins) == 1
 
 
+def test_manager_dispatches_hooks_to_implementing_active_plugins():
+    plugins = [
+        "saleor.plugins.tests.sample_plugins.PluginSample",
+        "saleor.plugins.tests.sample_plugins.PluginInactive",
+        "saleor.plugins.tests.sample_plugins.ActivePlugin",
+    ]
+
+    manager = PluginsManager(plugins=plugins)
+
+    plugin_sample = manager.get_plugin(PluginSample.PLUGIN_ID)
+    assert manager.hook_plugins["apply_taxes_to_product"] == [plugin_sample]
+    assert manager.hook_plugins["order_created"] == []
+
+
+@mock.patch("saleor.plugins.manager.is_sampled")
+def test_manager_hook_without_plugins_returns_default_value(mocked_is_sampled):
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ActivePlugin"]
+    )
+
+    with mock.patch.object(ActivePlugin, "fetch_taxes_data") as mocked_hook:
+        assert manager.fetch_taxes_data() is False
+
+    mocked_hook.assert_not_called()
+    mocked_is_sampled.assert_not_called()
+
+
+@pytest.fixture
+def manager_cache_enabled(settings):
+    settings.PLUGINS_MANAGER_CACHE_ENABLED = True
+    settings.PLUGINS = ["saleor.plugins.tests.sample_plugins.PluginSample"]
+    cache.delete(PLUGINS_CONFIGURATION_VERSION_KEY)
+    manager_cache.clear()
+    yield
+    manager_cache.clear()
+
+
+def test_get_plugins_manager_reuses_cached_manager(
+    manager_cache_enabled, plugin_configuration, django_assert_num_queries
+):
+    manager = get_plugins_manager()
+
+    with django_assert_num_queries(0):
+        assert get_plugins_manager() is manager
+    assert manager_cache.get_stats() == {"managers": 1, "hits": 1, "misses": 1}
+
+
+def test_get_plugins_manager_rebuilt_after_configuration_change(
+    manager_cache_enabled, plugin_configuration
+):
+    manager = get_plugins_manager()
+    assert manager.get_plugin(PluginSample.PLUGIN_ID).active
+
+    plugin_configuration.active = False
+    plugin_configuration.save(update_fields=["active"])
+    flush_post_commit_hooks()
+
+    new_manager = get_plugins_manager()
+    assert new_manager is not manager
+    assert not new_manager.get_plugin(PluginSample.PLUGIN_ID).active
+
+
+def test_get_plugins_manager_rebuilt_after_commit(
+    manager_cache_enabled, plugin_configuration
+):
+    manager = get_plugins_manager()
+
+    plugin_configuration.active = False
+    plugin_configuration.save(update_fields=["active"])
+
+    # Bumping the version before the commit would let concurrent requests cache
+    # a manager with the old configuration, so it's bumped only after the commit
+    assert get_plugins_manager() is manager
+    flush_post_commit_hooks()
+    assert get_plugins_manager() is not manager
+
+
+def test_get_plugins_manager_cache_keyed_by_plugins(manager_cache_enabled, settings):
+    manager = get_plugins_manager()
+
+    settings.PLUGINS = []
+
+    new_manager = get_plugins_manager()
+    assert new_manager is not manager
+    assert not new_manager.plugins
+
+
+def test_get_plugins_manager_cache_disabled(plugin_configuration, settings):
+    settings.PLUGINS_MANAGER_CACHE_ENABLED = False
+
+    assert get_plugins_manager() is not get_plugins_manager()
+
+
 @pytest.mark.parametrize(
     "plugins, total_amount",
     [(["saleor.plugins.tests.sample_plugins.PluginSample"], "1.0"), ([], "15.0")],
@@ -1,3 +1,4 @@
+from .. import discover_plugins_modules, has_module
 from ..anonymize.plugin import AnonymizePlugin
 from ..base_plugin import ConfigurationTypeField
 from ..manager import get_plugins_manager
@@ -221,3 +222,16 @@ def test_change_user_address_in_anonymize_plugin_reset_phone(address, settings):
         address=address, address_type=None, user=None, previous_value=address
     )
     assert not new_address.phone
+
+
+def test_discover_plugins_modules():
+    plugins = [
+        "saleor.plugins.webhook.plugin.WebhookPlugin",
+        "saleor.payment.gateways.stripe.plugin.StripeGatewayPlugin",
+    ]
+
+    packages = discover_plugins_modules(plugins)
+
+    assert packages == ["saleor.plugins.webhook", "saleor.payment.gateways.stripe"]
+    assert has_module("saleor.plugins.webhook", "tasks")
+    assert not has_module("saleor.payment.gateways.stripe", "tasks")
@@ -2,9 +2,7 @@ import logging
 from enum import Enum
 from urllib.parse import urlparse, urlunparse
 
-import boto3
 import requests
-from google.cloud import pubsub_v1
 from requests.exceptions import RequestException
 
 from ...celeryconf import app
@@ -69,6 +67,10 @@ def send_webhook_using_http(target_url, message, domain, signature, event_type):
 
 
 def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_type):
+    # The SDKs are imported on use as they take long to import and most
+    # processes never send webhooks to these targets
+    import boto3
+
     parts = urlparse(target_url)
     region = "us-east-1"
     hostname_parts = parts.hostname.split(".")
@@ -100,6 +102,8 @@ def send_webhook_using_aws_sqs(target_url, message, domain, signature, event_typ
 def send_webhook_using_google_cloud_pubsub(
     target_url, message, domain, signature, event_type
 ):
+    from google.cloud import pubsub_v1
+
     parts = urlparse(target_url)
     client = pubsub_v1.PublisherClient()
     topic_name = parts.path[1:]  # drop the leading slash
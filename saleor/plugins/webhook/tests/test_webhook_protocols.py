@@ -24,7 +24,7 @@ def test_trigger_webhooks_with_aws_sqs(
     mocked_client_constructor = MagicMock(spec=boto3.client, return_value=mocked_client)
 
     monkeypatch.setattr(
-        "saleor.plugins.webhook.tasks.boto3.client", mocked_client_constructor,
+        "boto3.client", mocked_client_constructor,
     )
 
     webhook.app.permissions.add(permission_manage_orders)
@@ -70,7 +70,7 @@ def test_trigger_webhooks_with_aws_sqs_and_secret_key(
     mocked_client_constructor = MagicMock(spec=boto3.client, return_value=mocked_client)
 
     monkeypatch.setattr(
-        "saleor.plugins.webhook.tasks.boto3.client", mocked_client_constructor,
+        "boto3.client", mocked_client_constructor,
     )
 
     webhook.app.permissions.add(permission_manage_orders)
@@ -119,7 +119,7 @@ def test_trigger_webhooks_with_google_pub_sub(
 ):
     mocked_publisher = MagicMock(spec=PublisherClient)
     monkeypatch.setattr(
-        "saleor.plugins.webhook.tasks.pubsub_v1.PublisherClient",
+        "google.cloud.pubsub_v1.PublisherClient",
         lambda: mocked_publisher,
     )
     webhook.app.permissions.add(permission_manage_orders)
@@ -148,7 +148,7 @@ def test_trigger_webhooks_with_google_pub_sub_and_secret_key(
 ):
     mocked_publisher = MagicMock(spec=PublisherClient)
     monkeypatch.setattr(
-        "saleor.plugins.webhook.tasks.pubsub_v1.PublisherClient",
+        "google.cloud.pubsub_v1.PublisherClient",
         lambda: mocked_publisher,
     )
     webhook.app.permissions.add(permission_manage_orders)
@@ -0,0 +1,23 @@
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("product", "0137_drop_attribute_models"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="product",
+            index=models.Index(fields=["name", "slug"], name="product_name_sort_idx"),
+        ),
+        AddIndexConcurrently(
+            model_name="product",
+            index=models.Index(
+                fields=["updated_at", "name", "slug"], name="product_updated_sort_idx"
+            ),
+        ),
+    ]
@@ -344,6 +344,13 @@ class Product(SeoModel, ModelWithMetadata):
         permissions = (
             (ProductPermissions.MANAGE_PRODUCTS.codename, "Manage products."),
         )
+        indexes = [
+            # Used by the cursor-based pagination of products sorted by name or date
+            models.Index(fields=["name", "slug"], name="product_name_sort_idx"),
+            models.Index(
+                fields=["updated_at", "name", "slug"], name="product_updated_sort_idx"
+            ),
+        ]
 
     def __iter__(self):
         if not hasattr(self, "__variants"):
@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
 
-import opentracing
 from django.conf import settings
 from prices import MoneyRange, TaxedMoney, TaxedMoneyRange
 
 from ...channel.models import Channel
+from ...core.tracing import get_tracer
 from ...core.utils import to_local_currency
 from ...discount import DiscountInfo
 from ...discount.utils import calculate_discounted_price
@@ -111,7 +111,7 @@ def get_product_price_range(
     discounts: Iterable[DiscountInfo],
     channel: Channel,
 ) -> Optional[MoneyRange]:
-    with opentracing.global_tracer().start_active_span("get_product_price_range"):
+    with get_tracer().start_active_span("get_product_price_range"):
         if variants:
             prices = [
                 get_variant_price(
@@ -142,7 +142,7 @@ def get_product_availability(
     local_currency: Optional[str] = None,
     plugins: Optional["PluginsManager"] = None,
 ) -> ProductAvailability:
-    with opentracing.global_tracer().start_active_span("get_product_availability"):
+    with get_tracer().start_active_span("get_product_availability"):
         if not plugins:
             plugins = get_plugins_manager()
 
@@ -220,7 +220,7 @@ def get_variant_availability(
     local_currency: Optional[str] = None,
     plugins: Optional["PluginsManager"] = None,
 ) -> VariantAvailability:
-    with opentracing.global_tracer().start_active_span("get_variant_availability"):
+    with get_tracer().start_active_span("get_variant_availability"):
         if not plugins:
             plugins = get_plugins_manager()
         discounted = plugins.apply_taxes_to_product(
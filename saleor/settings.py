@@ -384,6 +384,22 @@ PAYMENT_MODEL = "order.Payment"
 
 MAX_CHECKOUT_LINE_QUANTITY = int(os.environ.get("MAX_CHECKOUT_LINE_QUANTITY", 50))
 
+# Calculate the prices of a checkout once per GraphQL operation and reuse them
+# until the lines, addresses, voucher or shipping method of the checkout change
+CHECKOUT_PRICE_CONTEXT_ENABLED = get_bool_from_env(
+    "CHECKOUT_PRICE_CONTEXT_ENABLED", False
+)
+
+# Store the calculated prices on checkouts and serve them in queries until they
+# expire or the checkout changes; changes of product prices and plugin
+# configurations are visible in checkouts after the TTL
+CHECKOUT_PRICE_SNAPSHOT_ENABLED = get_bool_from_env(
+    "CHECKOUT_PRICE_SNAPSHOT_ENABLED", False
+)
+CHECKOUT_PRICE_SNAPSHOT_TTL = timedelta(
+    seconds=parse(os.environ.get("CHECKOUT_PRICE_SNAPSHOT_TTL", "1 hour"))
+)
+
 TEST_RUNNER = "saleor.tests.runner.PytestTestRunner"
 
 
@@ -484,6 +500,113 @@ REAL_IP_ENVIRON = os.environ.get("REAL_IP_ENVIRON", "REMOTE_ADDR")
 # The maximum length of a graphql query to log in tracings
 OPENTRACING_MAX_QUERY_LENGTH_LOG = 2000
 
+# The fraction of API requests recording opentracing spans; requests sent with
+# the "X-Saleor-Trace: 1" header are always traced
+OPENTRACING_SAMPLE_RATE = float(os.environ.get("OPENTRACING_SAMPLE_RATE", 1))
+
+# The number of parsed and validated GraphQL documents kept in memory by every
+# worker process; set to 0 to disable the cache
+GRAPHQL_QUERY_DOCUMENT_CACHE_SIZE = int(
+    os.environ.get("GRAPHQL_QUERY_DOCUMENT_CACHE_SIZE", 1000)
+)
+
+# Automatic persisted queries, the query text is stored in the cache under its
+# sha256 hash, so clients can send only the hash. Enabling them also allows
+# executing queries sent in GET requests. Longer queries aren't registered.
+GRAPHQL_PERSISTED_QUERIES_ENABLED = get_bool_from_env(
+    "GRAPHQL_PERSISTED_QUERIES_ENABLED", False
+)
+GRAPHQL_PERSISTED_QUERY_TTL = timedelta(
+    seconds=parse(os.environ.get("GRAPHQL_PERSISTED_QUERY_TTL", "7 days"))
+)
+GRAPHQL_PERSISTED_QUERY_MAX_LENGTH = int(
+    os.environ.get("GRAPHQL_PERSISTED_QUERY_MAX_LENGTH", 20000)
+)
+
+# Limits of the static cost analysis done before executing GraphQL operations.
+# Every field costs one unit multiplied by the `first`/`last` arguments of the
+# connections above it, the cost is returned in the response extensions.
+# Staff users and apps may get other cost limits than customers, limits set to
+# 0 fall back to GRAPHQL_QUERY_MAX_COST. Setting GRAPHQL_QUERY_MAX_COST or
+# GRAPHQL_QUERY_MAX_DEPTH to 0 disables the default check.
+GRAPHQL_QUERY_MAX_COST = int(os.environ.get("GRAPHQL_QUERY_MAX_COST", 0))
+GRAPHQL_QUERY_MAX_COST_STAFF = int(os.environ.get("GRAPHQL_QUERY_MAX_COST_STAFF", 0))
+GRAPHQL_QUERY_MAX_COST_APP = int(os.environ.get("GRAPHQL_QUERY_MAX_COST_APP", 0))
+GRAPHQL_QUERY_MAX_DEPTH = int(os.environ.get("GRAPHQL_QUERY_MAX_DEPTH", 0))
+
+# The number of threads used to execute read-only entries of batched GraphQL
+# requests concurrently; entries are executed one by one if set to 1
+GRAPHQL_BATCH_MAX_WORKERS = int(os.environ.get("GRAPHQL_BATCH_MAX_WORKERS", 1))
+
+# Serve the API with a view executing requests on a thread pool of the given
+# size, to be used with ASGI servers so that slow requests do not take a whole
+# worker each
+GRAPHQL_ASYNC_VIEW_ENABLED = get_bool_from_env("GRAPHQL_ASYNC_VIEW_ENABLED", False)
+GRAPHQL_ASYNC_MAX_WORKERS = int(os.environ.get("GRAPHQL_ASYNC_MAX_WORKERS", 20))
+
+# Cache complete responses to anonymous queries in the Django cache; entries are
+# invalidated when the catalog models they were built from are saved or deleted
+GRAPHQL_RESPONSE_CACHE_ENABLED = get_bool_from_env(
+    "GRAPHQL_RESPONSE_CACHE_ENABLED", False
+)
+GRAPHQL_RESPONSE_CACHE_TTL = timedelta(
+    seconds=parse(os.environ.get("GRAPHQL_RESPONSE_CACHE_TTL", "1 minute"))
+)
+
+# Log a warning when a GraphQL operation executes more SQL queries than the
+# budget or repeats the same query from one resolver more than the given number
+# of times, which usually means an N+1 problem; 0 disables the check
+GRAPHQL_QUERY_BUDGET = int(os.environ.get("GRAPHQL_QUERY_BUDGET", 0))
+GRAPHQL_QUERY_MAX_REPEATS = int(os.environ.get("GRAPHQL_QUERY_MAX_REPEATS", 0))
+
+# Let concurrent identical anonymous queries wait for the result of the first
+# one, coordinated with a lock in the Django cache, instead of executing them
+# again; waiting requests execute the query themselves after the timeout
+GRAPHQL_COALESCE_ENABLED = get_bool_from_env("GRAPHQL_COALESCE_ENABLED", False)
+GRAPHQL_COALESCE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("GRAPHQL_COALESCE_TIMEOUT", "5 seconds"))
+)
+
+# Cache values of dataloaders of rarely changed data, such as channels, product
+# types and attributes, across requests in a process-local LRU of the given size
+# and in the Django cache; entries are invalidated when their models are saved
+GRAPHQL_LOADER_CACHE_ENABLED = get_bool_from_env("GRAPHQL_LOADER_CACHE_ENABLED", False)
+GRAPHQL_LOADER_CACHE_SIZE = int(os.environ.get("GRAPHQL_LOADER_CACHE_SIZE", 10000))
+GRAPHQL_LOADER_CACHE_TTL = timedelta(
+    seconds=parse(os.environ.get("GRAPHQL_LOADER_CACHE_TTL", "1 hour"))
+)
+
+# Cache apps authenticated by tokens with their permissions; entries are removed
+# when the token is deleted or the app changes, which requires a cache shared by
+# all workers
+APP_TOKEN_CACHE_ENABLED = get_bool_from_env("APP_TOKEN_CACHE_ENABLED", False)
+APP_TOKEN_CACHE_TTL = timedelta(
+    seconds=parse(os.environ.get("APP_TOKEN_CACHE_TTL", "5 minutes"))
+)
+
+# How `totalCount` of connections is calculated: "exact" runs COUNT for every
+# request, "cached" keeps the exact count in the cache for the given time and
+# "estimate" uses the query planner estimate when it's above the threshold
+GRAPHQL_TOTAL_COUNT_STRATEGY = os.environ.get("GRAPHQL_TOTAL_COUNT_STRATEGY", "exact")
+GRAPHQL_TOTAL_COUNT_CACHE_TTL = timedelta(
+    seconds=parse(os.environ.get("GRAPHQL_TOTAL_COUNT_CACHE_TTL", "1 minute"))
+)
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 100000)
+)
+
+# Dotted path to a callable receiving the dataloader stats of every GraphQL
+# operation, keyed by loader name; use
+# "saleor.graphql.dataloader_metrics.aggregate_loader_stats" to keep totals of
+# the process in memory
+GRAPHQL_DATALOADER_STATS_HOOK = os.environ.get("GRAPHQL_DATALOADER_STATS_HOOK")
+
+# Dotted path to a callable serializing GraphQL responses to JSON bytes, use
+# "saleor.graphql.encoders.encode_orjson" if the orjson package is installed
+GRAPHQL_RESPONSE_ENCODER = os.environ.get(
+    "GRAPHQL_RESPONSE_ENCODER", "saleor.graphql.encoders.encode_json"
+)
+
 # Slugs for menus precreated in Django migrations
 DEFAULT_MENUS = {"top_menu_name": "navbar", "bottom_menu_name": "footer"}
 
@@ -499,17 +622,34 @@ if SENTRY_DSN:
     )
 
 GRAPHENE = {
+    # The schema is imported on the first request rather than with the URLconf,
+    # so management commands and worker boot don't build it
+    "SCHEMA": "saleor.graphql.api.schema",
     "RELAY_CONNECTION_ENFORCE_FIRST_OR_LAST": True,
     "RELAY_CONNECTION_MAX_LIMIT": 100,
     "MIDDLEWARE": [
         "saleor.graphql.middleware.OpentracingGrapheneMiddleware",
-        "saleor.graphql.middleware.JWTMiddleware",
-        "saleor.graphql.middleware.app_middleware",
+        "saleor.graphql.middleware.ResolverTracingMiddleware",
+        "saleor.graphql.middleware.QueryBudgetMiddleware",
     ],
 }
 
+# Dotted paths to callables run once per GraphQL operation before it's executed,
+# with the request and the operation definition; unlike the graphene middleware
+# above they don't run for every resolved field
+GRAPHQL_OPERATION_MIDDLEWARE = [
+    "saleor.graphql.middleware.authenticate_user",
+    "saleor.graphql.middleware.authenticate_app",
+]
+
 PLUGINS_MANAGER = "saleor.plugins.manager.PluginsManager"
 
+# Reuse the plugins manager across the requests of a process; it's rebuilt when
+# a plugin configuration changes, which requires a cache shared by all workers
+PLUGINS_MANAGER_CACHE_ENABLED = get_bool_from_env(
+    "PLUGINS_MANAGER_CACHE_ENABLED", False
+)
+
 PLUGINS = [
     "saleor.plugins.avatax.plugin.AvataxPlugin",
     "saleor.plugins.vatlayer.plugin.VatlayerPlugin",
@@ -523,6 +663,12 @@ PLUGINS = [
     "saleor.plugins.invoicing.plugin.InvoicingPlugin",
 ]
 
+# Connections to Avatax kept alive by each process, and retries of the failed
+# idempotent (GET) requests with an exponential backoff
+AVATAX_HTTP_POOL_SIZE = int(os.environ.get("AVATAX_HTTP_POOL_SIZE", 10))
+AVATAX_HTTP_MAX_RETRIES = int(os.environ.get("AVATAX_HTTP_MAX_RETRIES", 3))
+AVATAX_HTTP_BACKOFF_FACTOR = float(os.environ.get("AVATAX_HTTP_BACKOFF_FACTOR", 0.3))
+
 # Plugin discovery
 installed_plugins = pkg_resources.iter_entry_points("saleor.plugins")
 for entry_point in installed_plugins:
@@ -580,6 +726,14 @@ JWT_TTL_APP_ACCESS = timedelta(
 )
 JWT_TTL_REFRESH = timedelta(seconds=parse(os.environ.get("JWT_TTL_REFRESH", "30 days")))
 
+# Cache users authenticated with access tokens with their permissions; entries
+# are replaced when the user, their groups or permissions change, which requires
+# a cache shared by all workers
+JWT_USER_CACHE_ENABLED = get_bool_from_env("JWT_USER_CACHE_ENABLED", False)
+JWT_USER_CACHE_TTL = timedelta(
+    seconds=parse(os.environ.get("JWT_USER_CACHE_TTL", "5 minutes"))
+)
+
 
 JWT_TTL_REQUEST_EMAIL_CHANGE = timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
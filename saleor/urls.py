@@ -4,13 +4,17 @@ from django.conf.urls.static import static
 from django.contrib.staticfiles.views import serve
 from django.views.decorators.csrf import csrf_exempt
 
-from .graphql.api import schema
-from .graphql.views import GraphQLView
+from .graphql.views import AsyncGraphQLView, GraphQLView
 from .plugins.views import handle_plugin_webhook
 from .product.views import digital_product
 
+if settings.GRAPHQL_ASYNC_VIEW_ENABLED:
+    graphql_view = AsyncGraphQLView.as_view()
+else:
+    graphql_view = csrf_exempt(GraphQLView.as_view())
+
 urlpatterns = [
-    url(r"^graphql/", csrf_exempt(GraphQLView.as_view(schema=schema)), name="api"),
+    url(r"^graphql/", graphql_view, name="api"),
     url(
         r"^digital-download/(?P<token>[0-9A-Za-z_\-]+)/$",
         digital_product,